@@ -26,6 +26,7 @@ from triangular_arbitrage.execution_engine import (
     CycleState
 )
 from triangular_arbitrage.exchanges import BacktestExchange
+from triangular_arbitrage.utils import install_uvloop
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -174,7 +175,7 @@ class BacktestRunner:
 
                 # Determine initial amount based on balances
                 start_currency = cycle[0]
-                available_balance = (await exchange.fetch_balance()).get(start_currency, 0.0)
+                available_balance = exchange.balances.get(start_currency, 0.0)
 
                 if available_balance <= 0:
                     logger.debug(f"No balance for {start_currency}, skipping cycle {i}")
@@ -462,5 +463,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
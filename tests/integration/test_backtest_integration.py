@@ -35,8 +35,10 @@ def sample_backtest_data():
         f.flush()
         yield f.name
 
-    # Cleanup
+    # Cleanup, including any Parquet cache written beside the CSV
     os.unlink(f.name)
+    for cache_file in Path(f.name).parent.glob(Path(f.name).stem + ".*.parquet"):
+        cache_file.unlink()
 
 
 @pytest.fixture
@@ -136,6 +138,19 @@ class TestBacktestIntegration:
         assert final_balances.get("BTC", 0) > initial_btc
         assert final_balances.get("USDT", 0) < initial_usdt
 
+        # Running totals match the fills and feed the balance update
+        assert result.total_fee == pytest.approx(sum(f.fee for f in result.fills))
+        assert final_balances["USDT"] == pytest.approx(
+            initial_usdt
+            - result.amount_filled * result.average_price
+            - result.total_fee
+        )
+
+        # The balances view is live and read-only
+        assert exchange.balances["BTC"] == final_balances["BTC"]
+        with pytest.raises(TypeError):
+            exchange.balances["BTC"] = 0.0
+
     @pytest.mark.asyncio
     async def test_deterministic_backtest(self, sample_backtest_data):
         """Test that backtests are deterministic with same seed"""
@@ -164,6 +179,160 @@ class TestBacktestIntegration:
         # Results should be identical
         assert result1.amount_filled == result2.amount_filled
         assert result1.average_price == result2.average_price
+        assert result1.order_id == result2.order_id == "bt-o-1"
+        assert [f.fill_id for f in result1.fills] == [f.fill_id for f in result2.fills]
+
+    @pytest.mark.asyncio
+    async def test_market_orders_batch(self, sample_backtest_data):
+        """Test that a batch of market orders returns one result per spec"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSide
+
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "random_seed": 42,
+                "initial_balances": {"BTC": 1.0, "ETH": 10.0, "USDT": 50000.0},
+                "fill_model": {
+                    "fill_probability": 1.0,
+                    "partial_fill_threshold": 1e12,
+                    "min_fill_ratio": 0.3,
+                    "max_fill_time_ms": 1000,
+                },
+            }
+        )
+        await exchange.initialize()
+
+        results = await exchange.create_market_orders_batch(
+            [
+                ("BTC/USDT", OrderSide.BUY, 0.01),
+                ("ETH/USDT", OrderSide.SELL, 0.5),
+                ("XRP/USDT", OrderSide.BUY, 1.0),
+            ]
+        )
+
+        assert [r.symbol for r in results] == ["BTC/USDT", "ETH/USDT", "XRP/USDT"]
+        assert results[0].status == "filled"
+        assert results[0].average_price > 42010.00
+        assert results[1].status == "filled"
+        assert results[1].average_price < 2200.00
+        assert results[2].status == "failed"
+        assert exchange.metrics["orders_created"] == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_orders_archived(self, sample_backtest_data):
+        """Test that finished orders leave _orders but keep their status"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSide
+
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "random_seed": 42,
+                "initial_balances": {"BTC": 1.0, "USDT": 50000.0},
+            }
+        )
+        await exchange.initialize()
+
+        result = await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 0.01)
+        assert exchange._orders == {}
+
+        archived = await exchange.fetch_order_status(result.order_id, "BTC/USDT")
+        assert archived.status == result.status
+        assert archived.symbol == "BTC/USDT"
+        assert archived.side == OrderSide.BUY
+        assert archived.amount_filled == pytest.approx(result.amount_filled)
+        assert archived.average_price == pytest.approx(result.average_price)
+        assert archived.total_fee == pytest.approx(result.total_fee)
+
+        missing = await exchange.fetch_order_status("bt-o-999", "BTC/USDT")
+        assert missing.error_message == "Order not found"
+
+    @pytest.mark.asyncio
+    async def test_finished_orders_dropped_without_retention(
+        self, sample_backtest_data
+    ):
+        """Test that retain_orders=False forgets finished orders"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSide
+
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "random_seed": 42,
+                "retain_orders": False,
+                "initial_balances": {"BTC": 1.0, "USDT": 50000.0},
+            }
+        )
+        await exchange.initialize()
+
+        result = await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 0.01)
+
+        assert exchange._orders == {}
+        assert not exchange._closed_orders_np["status_code"].any()
+        status = await exchange.fetch_order_status(result.order_id, "BTC/USDT")
+        assert status.error_message == "Order not found"
+
+    @pytest.mark.asyncio
+    async def test_partial_fills_do_not_sleep_by_default(self, sample_backtest_data):
+        """Test that simulated fill delays only advance simulation time"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSide
+
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "random_seed": 42,
+                "initial_balances": {"BTC": 10.0, "USDT": 500000.0},
+                "fill_model": {
+                    "fill_probability": 1.0,
+                    "partial_fill_threshold": 0,
+                    "min_fill_ratio": 0.3,
+                    "max_fill_time_ms": 1000,
+                },
+            }
+        )
+        await exchange.initialize()
+        start = exchange.get_current_simulation_time()
+
+        with patch("asyncio.sleep") as sleep:
+            result = await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 1.0)
+
+        sleep.assert_not_called()
+        assert len(result.fills) >= 2
+        assert exchange.get_current_simulation_time() > start
+
+    @pytest.mark.asyncio
+    async def test_realtime_playback_sleeps_off_fill_delays(self, sample_backtest_data):
+        """Test that realtime playback sleeps once for the accrued delay"""
+        from unittest.mock import AsyncMock
+        from triangular_arbitrage.exchanges.base_adapter import OrderSide
+
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "random_seed": 42,
+                "realtime_playback": True,
+                "time_acceleration": 100.0,
+                "initial_balances": {"BTC": 10.0, "USDT": 500000.0},
+                "fill_model": {
+                    "fill_probability": 1.0,
+                    "partial_fill_threshold": 0,
+                    "min_fill_ratio": 0.3,
+                    "max_fill_time_ms": 1000,
+                },
+            }
+        )
+        await exchange.initialize()
+        start = exchange.get_current_simulation_time()
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+            await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 1.0)
+
+        elapsed = exchange.get_current_simulation_time() - start
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(elapsed / 100.0)
 
     @pytest.mark.asyncio
     async def test_backtest_runner_integration(self, backtest_strategy_config):
@@ -244,6 +413,144 @@ class TestBacktestIntegration:
         current_time = exchange.get_current_simulation_time()
         assert current_time >= target_time
 
+    @pytest.mark.asyncio
+    async def test_backtest_ticker_follows_simulation_time(self, sample_backtest_data):
+        """Test that fetch_ticker returns the latest tick at or before now"""
+        config = {
+            "execution_mode": "backtest",
+            "data_file": sample_backtest_data,
+            "random_seed": 42,
+            "time_acceleration": 0,
+        }
+
+        exchange = BacktestExchange(config)
+        await exchange.initialize()
+
+        # One-second bars are detected as a uniform grid
+        assert "BTC/USDT" in exchange._uniform
+
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+        assert ticker.timestamp == 1700000000.0
+
+        exchange.advance_time_to(1700000001.5)
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+        assert ticker.timestamp == 1700000001.0
+        assert ticker.bid == 42005.00
+
+        exchange.advance_time_to(1700000100.0)
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+        assert ticker.timestamp == 1700000002.0
+
+        # Re-reading the same tick reuses the MarketData instance
+        assert await exchange.fetch_ticker("BTC/USDT") is ticker
+
+    @pytest.mark.asyncio
+    async def test_fast_ticker_matches_fetch_ticker(self, sample_backtest_data):
+        """Test that the timeline cursor serves the same ticks as fetch_ticker"""
+        exchange = BacktestExchange(
+            {"execution_mode": "backtest", "data_file": sample_backtest_data}
+        )
+        await exchange.initialize()
+
+        for target in (1700000000.0, 1700000000.5, 1700000001.0, 1700000005.0):
+            exchange.advance_time_to(target)
+            for symbol in ("BTC/USDT", "ETH/USDT", "ETH/BTC"):
+                assert exchange.fetch_ticker_fast(symbol) == (
+                    await exchange.fetch_ticker(symbol)
+                )
+        assert exchange._cursor == len(exchange._global_ts) == 9
+
+        with pytest.raises(ValueError):
+            exchange.fetch_ticker_fast("XRP/USDT")
+
+    @pytest.mark.asyncio
+    async def test_backtest_skips_invalid_rows(self, tmp_path):
+        """Test that malformed rows are dropped and volume defaults to zero"""
+        data_file = tmp_path / "feed.csv"
+        data_file.write_text(
+            "timestamp,symbol,bid,ask,last\n"
+            "1700000001.0,BTC/USDT,42005.00,42015.00,42010.00\n"
+            "1700000000.0,BTC/USDT,42000.00,42010.00,42005.00\n"
+            "not-a-time,BTC/USDT,1,2,3\n"
+            "1700000002.0,BTC/USDT,,42020.00,42015.00\n"
+        )
+
+        exchange = BacktestExchange(
+            {"execution_mode": "backtest", "data_file": str(data_file)}
+        )
+        await exchange.initialize()
+
+        assert list(exchange._cols["BTC/USDT"]["ts"]) == [1700000000.0, 1700000001.0]
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+        assert ticker.bid == 42000.00
+        assert ticker.volume == 0.0
+
+    @pytest.mark.asyncio
+    async def test_backtest_time_range(self, sample_backtest_data):
+        """Test that start/end times keep only ticks inside the range"""
+        exchange = BacktestExchange(
+            {
+                "execution_mode": "backtest",
+                "data_file": sample_backtest_data,
+                "start_time": 1700000001.0,
+                "end_time": 1700000001.5,
+            }
+        )
+        await exchange.initialize()
+
+        assert set(exchange._cols) == {"BTC/USDT", "ETH/USDT", "ETH/BTC"}
+        for columns in exchange._cols.values():
+            assert list(columns["ts"]) == [1700000001.0]
+        assert exchange.get_current_simulation_time() == 1700000001.0
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+        assert ticker.bid == 42005.00
+
+    @pytest.mark.asyncio
+    async def test_backtest_reuses_parquet_cache(self, tmp_path):
+        """Test that a second load reads the Parquet cache instead of the CSV"""
+        pytest.importorskip("pyarrow")
+        data_file = tmp_path / "feed.csv"
+        data_file.write_text(
+            "timestamp,symbol,bid,ask,last,volume\n"
+            "1700000000.0,BTC/USDT,42000.00,42010.00,42005.00,125.50\n"
+            "1700000001.0,BTC/USDT,42005.00,42015.00,42010.00,126.20\n"
+        )
+        config = {"execution_mode": "backtest", "data_file": str(data_file)}
+
+        await BacktestExchange(config).initialize()
+        assert len(list(tmp_path.glob("feed.*.parquet"))) == 1
+
+        exchange = BacktestExchange(config)
+        with patch.object(BacktestExchange, "_parse_csv") as parse_csv:
+            await exchange.initialize()
+        parse_csv.assert_not_called()
+        assert list(exchange._cols["BTC/USDT"]["ts"]) == [1700000000.0, 1700000001.0]
+
+    @pytest.mark.asyncio
+    async def test_backtest_replaces_stale_parquet_cache(self, tmp_path):
+        """Test that rewriting the CSV leaves only the current cache behind"""
+        pytest.importorskip("pyarrow")
+        data_file = tmp_path / "feed.csv"
+        rows = (
+            "timestamp,symbol,bid,ask,last,volume\n"
+            "1700000000.0,BTC/USDT,42000.00,42010.00,42005.00,125.50\n"
+        )
+        data_file.write_text(rows)
+        other_cache = tmp_path / ("feed.v2." + "0" * 40 + ".parquet")
+        other_cache.write_bytes(b"")
+        config = {"execution_mode": "backtest", "data_file": str(data_file)}
+
+        await BacktestExchange(config).initialize()
+        (first_cache,) = tmp_path.glob("feed.[0-9a-f]*.parquet")
+
+        data_file.write_text(rows)
+        os.utime(data_file, (1800000000, 1800000000))
+        await BacktestExchange(config).initialize()
+
+        caches = list(tmp_path.glob("feed.[0-9a-f]*.parquet"))
+        assert len(caches) == 1 and caches[0] != first_cache
+        assert other_cache.exists()
+
     @pytest.mark.asyncio
     async def test_backtest_error_handling(self, backtest_strategy_config):
         """Test error handling in backtest scenarios"""
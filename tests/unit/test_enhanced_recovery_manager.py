@@ -0,0 +1,378 @@
+"""
+Unit tests for the enhanced failure recovery manager
+"""
+
+import asyncio
+from collections import deque
+
+import numpy as np
+import pytest
+
+from triangular_arbitrage.enhanced_recovery_manager import (
+    EnhancedFailureRecoveryManager,
+    MarketCondition,
+    _book_liquidity,
+    _bucket_amount,
+    _slippage_bps,
+    _slippage_bps_loop,
+    _slippage_bps_numpy,
+)
+
+MARKETS = {
+    "BTC/USDT": {"base": "BTC", "quote": "USDT", "active": True, "taker": 0.001},
+    "ETH/USDT": {"base": "ETH", "quote": "USDT", "active": True, "taker": 0.001},
+    "ETH/BTC": {"base": "ETH", "quote": "BTC", "active": True, "taker": 0.001},
+    "ADA/BTC": {"base": "ADA", "quote": "BTC", "active": True, "taker": 0.001},
+    "ADA/ETH": {"base": "ADA", "quote": "ETH", "active": True, "taker": 0.001},
+}
+
+
+class CountingExchange:
+    """Minimal async exchange that records every REST call it receives"""
+
+    def __init__(self, markets=None):
+        self.markets = {s: dict(m) for s, m in (markets or MARKETS).items()}
+        self.order_book_calls = []
+        self.order_book_limits = []
+        self.ticker_calls = []
+
+    async def load_markets(self):
+        return self.markets
+
+    async def fetch_ticker(self, symbol):
+        self.ticker_calls.append(symbol)
+        return {"symbol": symbol, "percentage": 1.0}
+
+    async def fetch_order_book(self, symbol, limit=None):
+        self.order_book_calls.append(symbol)
+        self.order_book_limits.append(limit)
+        bids = [[100.0 - i, 1000.0] for i in range(10)]
+        asks = [[101.0 + i, 1000.0] for i in range(10)]
+        if limit:
+            bids, asks = bids[:limit], asks[:limit]
+        return {"bids": bids, "asks": asks}
+
+
+@pytest.fixture
+def exchange():
+    return CountingExchange()
+
+
+@pytest.fixture
+def manager(exchange):
+    return EnhancedFailureRecoveryManager(exchange, {"panic_sell": {}})
+
+
+class TestSlippage:
+    """Test order book slippage estimation"""
+
+    @pytest.mark.asyncio
+    async def test_slippage_within_top_level(self, manager):
+        slippage = await manager.calculate_slippage("BTC/USDT", "sell", 10)
+        assert slippage == 0
+
+    @pytest.mark.asyncio
+    async def test_slippage_walks_levels(self, manager):
+        # 1000 @ 100 + 500 @ 99 -> avg 99.666..., 33.33 bps below best bid
+        slippage = await manager.calculate_slippage("BTC/USDT", "sell", 1500)
+        assert slippage == pytest.approx((100 - 149500 / 1500) / 100 * 10000)
+
+    @pytest.mark.asyncio
+    async def test_insufficient_liquidity(self, manager):
+        slippage = await manager.calculate_slippage("BTC/USDT", "buy", 1e9)
+        assert slippage == 999999
+
+    def test_kernels_match_python_walk(self):
+        prices = np.array([100.0, 99.5, 99.0, 98.0])
+        volumes = np.array([1.0, 2.0, 0.5, 10.0])
+        for amount in (0.5, 1.0, 3.2, 13.5, 20.0):
+            expected = _slippage_bps_loop(prices, volumes, amount)
+            assert _slippage_bps(prices, volumes, amount) == pytest.approx(expected)
+            assert _slippage_bps_numpy(prices, volumes, amount) == pytest.approx(
+                expected
+            )
+
+    def test_kernels_zero_amount(self):
+        prices = np.array([100.0, 99.5])
+        volumes = np.array([1.0, 2.0])
+        for kernel in (_slippage_bps, _slippage_bps_loop, _slippage_bps_numpy):
+            assert kernel(prices, volumes, 0.0) == 0.0
+
+    def test_bucket_amount(self):
+        assert _bucket_amount(1234.5678) == 1230
+        assert _bucket_amount(0.00123456) == pytest.approx(0.00123)
+        assert _bucket_amount(0) == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_configured_book_depth(self, exchange):
+        manager = EnhancedFailureRecoveryManager(
+            exchange, {"panic_sell": {"book_depth": 5}}
+        )
+        await manager.calculate_slippage("BTC/USDT", "sell", 1)
+        assert exchange.order_book_limits == [5]
+
+        # 5 levels of 1000 cannot fill 6000 even though the exchange has more
+        assert await manager.calculate_slippage("BTC/USDT", "sell", 6000) == 999999
+
+    @pytest.mark.asyncio
+    async def test_book_cache_reused(self, manager, exchange):
+        book_cache = {}
+        await manager.calculate_slippage("BTC/USDT", "sell", 1, book_cache)
+        await manager.calculate_slippage("BTC/USDT", "buy", 2, book_cache)
+        assert exchange.order_book_calls == ["BTC/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_expired_books_dropped(self, exchange):
+        manager = EnhancedFailureRecoveryManager(
+            exchange, {"panic_sell": {"cache_ttl_ms": 0}}
+        )
+        await manager.calculate_slippage("BTC/USDT", "sell", 1)
+        await manager.calculate_slippage("ETH/USDT", "sell", 1)
+        assert list(manager.market_cache) == ["ETH/USDT"]
+
+
+class TestMarketGraph:
+    """Test market graph construction and refresh"""
+
+    @staticmethod
+    def _graph_state(manager):
+        return (
+            {c: sorted(edges) for c, edges in manager._adj.items()},
+            dict(manager._edge_index),
+            sorted(manager.market_graph.edges(data="symbol")),
+        )
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_matches_full_build(self, manager, exchange):
+        await manager.build_market_graph(force_refresh=True)
+
+        del exchange.markets["ADA/ETH"]
+        exchange.markets["ADA/BTC"] = dict(exchange.markets["ADA/BTC"], taker=0.002)
+        exchange.markets["DOT/ETH"] = {"base": "DOT", "quote": "ETH", "taker": 0.001}
+        exchange.markets["BTC/ETH"] = {"base": "BTC", "quote": "ETH", "taker": 0.001}
+        await manager.build_market_graph(force_refresh=True)
+
+        rebuilt = EnhancedFailureRecoveryManager(exchange, {"panic_sell": {}})
+        await rebuilt.build_market_graph(force_refresh=True)
+        assert self._graph_state(manager) == self._graph_state(rebuilt)
+
+        del exchange.markets["BTC/ETH"]
+        del exchange.markets["DOT/ETH"]
+        await manager.build_market_graph(force_refresh=True)
+
+        assert manager._edge_index[("ETH", "BTC")] == ("BTC", "ETH/BTC", "sell", 0.001)
+        assert "DOT" not in manager._adj
+        assert "DOT" not in manager.market_graph
+
+    @pytest.mark.asyncio
+    async def test_blacklisted_market_removed_on_refresh(self, manager):
+        await manager.build_market_graph(force_refresh=True)
+        manager.blacklisted_markets.add("ADA/ETH")
+        await manager.build_market_graph(force_refresh=True)
+
+        assert ("ADA", "ETH") not in manager._edge_index
+        assert not manager.market_graph.has_edge("ETH", "ADA")
+
+
+class TestPathFinding:
+    """Test liquidation path discovery"""
+
+    @pytest.mark.asyncio
+    async def test_finds_paths_to_stable(self, manager):
+        paths = await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+        assert paths
+        for path in paths:
+            assert path.path[0] == "ADA"
+            assert path.path[-1] == "USDT"
+            assert len(path.edges) == len(path.path) - 1
+
+    @pytest.mark.asyncio
+    async def test_each_book_fetched_once(self, manager, exchange):
+        await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+        assert exchange.order_book_calls
+        assert len(exchange.order_book_calls) == len(set(exchange.order_book_calls))
+
+    @pytest.mark.asyncio
+    async def test_already_at_target(self, manager, exchange):
+        paths = await manager.find_liquidation_paths("USDT", 5.0, ["USDT"])
+        assert len(paths) == 1
+        assert paths[0].estimated_output == 5.0
+        assert exchange.order_book_calls == []
+
+    @pytest.mark.asyncio
+    async def test_failed_book_fetch_drops_path(self, manager, exchange):
+        original = exchange.fetch_order_book
+
+        async def flaky_fetch(symbol, limit=None):
+            if symbol == "ADA/BTC":
+                raise Exception("market unavailable")
+            return await original(symbol, limit)
+
+        exchange.fetch_order_book = flaky_fetch
+        await manager.build_market_graph(force_refresh=True)
+
+        assert await manager.evaluate_path(["ADA", "BTC", "USDT"], 1.0) is None
+        assert await manager.evaluate_path(["ADA", "ETH", "USDT"], 1.0) is not None
+
+    @pytest.mark.asyncio
+    async def test_enumerate_paths_respects_hop_limit(self, manager):
+        await manager.build_market_graph(force_refresh=True)
+
+        paths = list(manager._enumerate_paths("ADA", {"USDT"}, 2))
+        assert paths[0] in (["ADA", "BTC", "USDT"], ["ADA", "ETH", "USDT"])
+        assert all(len(p) - 1 <= 2 for p in paths)
+        assert all(len(set(p)) == len(p) for p in paths)
+
+        longer = list(manager._enumerate_paths("ADA", {"USDT"}, 3))
+        assert ["ADA", "ETH", "BTC", "USDT"] in longer
+
+    @pytest.mark.asyncio
+    async def test_prescore_caps_candidates(self, exchange):
+        exchange.markets["ADA/ETH"]["taker"] = 0.003
+        manager = EnhancedFailureRecoveryManager(
+            exchange,
+            {
+                "panic_sell": {
+                    "max_paths_to_evaluate": 1,
+                    "early_exit_min_confidence": 2,
+                }
+            },
+        )
+        await manager.build_market_graph(force_refresh=True)
+
+        assert manager._prescore(["ADA", "BTC", "USDT"]) < manager._prescore(
+            ["ADA", "ETH", "USDT"]
+        )
+
+        paths = await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+        assert [p.path for p in paths] == [["ADA", "BTC", "USDT"]]
+        assert "ADA/ETH" not in exchange.order_book_calls
+
+    @pytest.mark.asyncio
+    async def test_hops_to_targets(self, manager):
+        await manager.build_market_graph(force_refresh=True)
+
+        assert manager._hops_to_targets({"USDT"}, 4) == {
+            "USDT": 0,
+            "BTC": 1,
+            "ETH": 1,
+            "ADA": 2,
+        }
+        assert "ADA" not in manager._hops_to_targets({"USDT"}, 1)
+        assert list(manager._enumerate_paths("ADA", {"USDT"}, 1)) == []
+
+    @pytest.mark.asyncio
+    async def test_early_exit_skips_longer_routes(self, manager, exchange):
+        paths = await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+
+        assert all(len(p.path) == 3 for p in paths)
+        # ADA/ETH -> ETH/BTC -> BTC/USDT style three-hop routes never fetched
+        assert "ETH/BTC" not in exchange.order_book_calls
+
+    @pytest.mark.asyncio
+    async def test_no_early_exit_when_disabled(self, exchange):
+        manager = EnhancedFailureRecoveryManager(
+            exchange, {"panic_sell": {"early_exit_min_confidence": 1.1}}
+        )
+        paths = await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+
+        assert any(len(p.path) == 4 for p in paths)
+
+    @pytest.mark.asyncio
+    async def test_slippage_memo_shared_across_paths(self, manager):
+        await manager.build_market_graph(force_refresh=True)
+        book_cache, memo = {}, {}
+        await manager._prefetch_books([["ADA", "BTC", "USDT"]], book_cache)
+
+        first = manager._evaluate_path_sync(["ADA", "BTC"], 1.0001, book_cache, memo)
+        second = manager._evaluate_path_sync(["ADA", "BTC"], 1.0002, book_cache, memo)
+
+        assert len(memo) == 1
+        assert first.estimated_slippage == second.estimated_slippage
+
+
+class TestStatistics:
+    """Test execution statistics bookkeeping"""
+
+    def test_most_used_paths_tracks_evictions(self, exchange):
+        manager = EnhancedFailureRecoveryManager(exchange, {"panic_sell": {}})
+        manager.execution_history = deque(maxlen=3)
+
+        for path in (["A", "USDT"], ["B", "USDT"], ["B", "USDT"], ["C", "USDT"]):
+            manager._record_execution({"path": path, "success": True, "slippage": 1})
+
+        assert manager._get_most_used_paths() == [
+            (["B", "USDT"], 2),
+            (["C", "USDT"], 1),
+        ]
+        assert manager.get_execution_statistics()["total_executions"] == 3
+
+
+class TestMarketConditions:
+    """Test market condition analysis"""
+
+    @pytest.mark.asyncio
+    async def test_shared_markets_fetched_once(self, manager, exchange):
+        await manager.build_market_graph(force_refresh=True)
+        conditions = await manager.analyze_market_conditions(["BTC", "USDT", "ETH"])
+
+        assert set(conditions) == {"BTC", "USDT", "ETH"}
+        assert len(exchange.ticker_calls) == len(set(exchange.ticker_calls))
+        assert len(exchange.order_book_calls) == len(set(exchange.order_book_calls))
+
+    def test_book_liquidity(self):
+        levels = [[100.0, 2.0], [99.0, 1.0], [98.0, 1.0]]
+        assert _book_liquidity(levels) == pytest.approx(397.0)
+        assert _book_liquidity(levels, depth=1) == pytest.approx(200.0)
+        assert _book_liquidity([]) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_reuses_books_cached_by_path_search(self, manager, exchange):
+        await manager.find_liquidation_paths("ADA", 1.0, ["USDT"])
+        fetched = set(exchange.order_book_calls)
+        exchange.order_book_calls.clear()
+
+        await manager.analyze_market_conditions(["ADA"])
+
+        assert set(exchange.order_book_calls).isdisjoint(fetched)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_assumes_volatile(self, manager, exchange):
+        async def failing_ticker(symbol):
+            raise Exception("rate limited")
+
+        exchange.fetch_ticker = failing_ticker
+        await manager.build_market_graph(force_refresh=True)
+        conditions = await manager.analyze_market_conditions(["ADA"])
+
+        assert conditions["ADA"] == MarketCondition.VOLATILE
+
+
+class TestBlacklist:
+    """Test temporary market blacklisting"""
+
+    @pytest.mark.asyncio
+    async def test_single_reaper_expires_entries(self, manager):
+        await manager.blacklist_market("ADA/BTC", duration_seconds=0.3)
+        reaper = manager._reaper_task
+        await manager.blacklist_market("ETH/BTC", duration_seconds=0.02)
+
+        assert manager._reaper_task is reaper
+        assert manager.blacklisted_markets == {"ADA/BTC", "ETH/BTC"}
+
+        await asyncio.sleep(0.15)
+        assert manager.blacklisted_markets == {"ADA/BTC"}
+
+        await asyncio.wait_for(reaper, timeout=1)
+        assert manager.blacklisted_markets == set()
+
+    @pytest.mark.asyncio
+    async def test_reblacklist_extends_expiry(self, manager):
+        await manager.blacklist_market("ADA/BTC", duration_seconds=0.02)
+        await manager.blacklist_market("ADA/BTC", duration_seconds=0.3)
+
+        await asyncio.sleep(0.15)
+        assert "ADA/BTC" in manager.blacklisted_markets
+
+        await asyncio.wait_for(manager._reaper_task, timeout=1)
+        assert "ADA/BTC" not in manager.blacklisted_markets
@@ -115,4 +115,19 @@ def test_exception_inheritance():
     for exc_class in exceptions:
         instance = exc_class("test message")
         assert isinstance(instance, TriangularArbitrageError)
-        assert isinstance(instance, Exception)
\ No newline at end of file
+        assert isinstance(instance, Exception)
+
+
+def test_exception_attributes_survive_pickling():
+    """Test that slotted exception attributes round-trip through pickle."""
+    import pickle
+
+    error = ExchangeError(
+        "Exchange failed", exchange="binance", symbol="BTC/USDT", details={"a": 1}
+    )
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert str(restored) == "Exchange failed"
+    assert restored.exchange == "binance"
+    assert restored.symbol == "BTC/USDT"
+    assert restored.details == {"a": 1}
@@ -0,0 +1,150 @@
+"""
+Unit tests for ccxt exchange data fetching
+"""
+
+import asyncio
+
+import pytest
+
+from triangular_arbitrage import exchange as exchange_module
+from triangular_arbitrage.exceptions import ExchangeError, ValidationError
+
+TICKERS = {"BTC/USDT": {"symbol": "BTC/USDT", "bid": 42000, "ask": 42010}}
+
+
+class FakeExchange:
+    """Stand-in for a ccxt async exchange that counts network calls"""
+
+    instances = []
+
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.markets = None
+        self.load_markets_calls = 0
+        self.fetch_tickers_calls = 0
+        self.closed = False
+        FakeExchange.instances.append(self)
+
+    async def load_markets(self, reload=False):
+        self.load_markets_calls += 1
+        await asyncio.sleep(0)
+        self.markets = {"BTC/USDT": {}}
+        return self.markets
+
+    async def fetch_tickers(self):
+        self.fetch_tickers_calls += 1
+        await asyncio.sleep(0)
+        return TICKERS
+
+    def milliseconds(self):
+        return 1700000000000
+
+    def iso8601(self, timestamp):
+        return "2023-11-14T22:13:20.000Z"
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ccxt(monkeypatch):
+    """Register FakeExchange as the ccxt exchange fakeex"""
+    FakeExchange.instances = []
+    monkeypatch.setattr(exchange_module.ccxt, "fakeex", FakeExchange, raising=False)
+    monkeypatch.setattr(
+        exchange_module,
+        "_VALID_EXCHANGES",
+        exchange_module._VALID_EXCHANGES | {"fakeex"},
+    )
+    return FakeExchange
+
+
+class TestGetExchangeData:
+    """Test get_exchange_data behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_returns_tickers_and_time(self, fake_ccxt):
+        tickers, exchange_time = await exchange_module.get_exchange_data("fakeex")
+
+        assert tickers == TICKERS
+        assert exchange_time == "2023-11-14T22:13:20.000Z"
+
+    @pytest.mark.asyncio
+    async def test_closes_connection_by_default(self, fake_ccxt):
+        await exchange_module.get_exchange_data("fakeex")
+        await exchange_module.get_exchange_data("fakeex")
+
+        assert len(fake_ccxt.instances) == 2
+        assert all(instance.closed for instance in fake_ccxt.instances)
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_string_name(self, fake_ccxt):
+        with pytest.raises(ValidationError):
+            await exchange_module.get_exchange_data(123)
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_exchange(self, fake_ccxt):
+        with pytest.raises(ExchangeError):
+            await exchange_module.get_exchange_data("not_a_real_exchange")
+
+    @pytest.mark.asyncio
+    async def test_rejects_ccxt_attribute_that_is_not_an_exchange(self, fake_ccxt):
+        with pytest.raises(ExchangeError):
+            await exchange_module.get_exchange_data("Exchange")
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_retried(self, fake_ccxt, monkeypatch):
+        monkeypatch.setattr(exchange_module, "TICKER_RETRY_BASE_DELAY_SECONDS", 0.0)
+        original_fetch = fake_ccxt.fetch_tickers
+        failures = [
+            exchange_module.ccxt.RateLimitExceeded("429"),
+            exchange_module.ccxt.NetworkError("reset"),
+        ]
+
+        async def flaky_fetch(self):
+            if failures:
+                raise failures.pop()
+            return await original_fetch(self)
+
+        monkeypatch.setattr(fake_ccxt, "fetch_tickers", flaky_fetch)
+        tickers, _ = await exchange_module.get_exchange_data("fakeex")
+
+        assert tickers == TICKERS
+        assert failures == []
+        assert fake_ccxt.instances[0].closed is True
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_raise(self, fake_ccxt, monkeypatch):
+        monkeypatch.setattr(exchange_module, "TICKER_RETRY_BASE_DELAY_SECONDS", 0.0)
+        calls = []
+
+        async def failing_fetch(self):
+            calls.append(1)
+            raise exchange_module.ccxt.NetworkError("down")
+
+        monkeypatch.setattr(fake_ccxt, "fetch_tickers", failing_fetch)
+        with pytest.raises(exchange_module.ccxt.NetworkError):
+            await exchange_module.get_exchange_data("fakeex")
+
+        assert len(calls) == exchange_module.TICKER_FETCH_ATTEMPTS
+        assert fake_ccxt.instances[0].closed is True
+
+
+class TestExchangeSession:
+    """Test the exchange_session context manager"""
+
+    @pytest.mark.asyncio
+    async def test_session_closes_on_exit(self, fake_ccxt):
+        async with exchange_module.exchange_session("fakeex") as exchange:
+            assert exchange.load_markets_calls == 1
+            assert exchange.closed is False
+
+        assert exchange.closed is True
+
+    @pytest.mark.asyncio
+    async def test_session_closes_on_error(self, fake_ccxt):
+        with pytest.raises(RuntimeError):
+            async with exchange_module.exchange_session("fakeex"):
+                raise RuntimeError("boom")
+
+        assert fake_ccxt.instances[0].closed is True
@@ -109,6 +109,94 @@ class TestPaperExchange:
         # Results should be identical with same seed
         assert result1.amount_filled == result2.amount_filled
 
+    @pytest.mark.asyncio
+    async def test_order_totals_match_fills(self, mock_live_exchange, paper_config):
+        """Test running fee/notional totals agree with the fills"""
+        exchange = PaperExchange(
+            mock_live_exchange, dict(paper_config, latency_sim_ms=0)
+        )
+        await exchange.initialize()
+
+        result = await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 0.1)
+
+        assert result.fills
+        assert result.total_fee == pytest.approx(sum(f.fee for f in result.fills))
+        assert result.average_price == pytest.approx(
+            sum(f.price * f.amount for f in result.fills) / result.amount_filled
+        )
+
+    @pytest.mark.asyncio
+    async def test_status_polls_share_fills_snapshot(
+        self, mock_live_exchange, paper_config
+    ):
+        """Test repeated status polls reuse one fills tuple until a new fill"""
+        exchange = PaperExchange(
+            mock_live_exchange, dict(paper_config, latency_sim_ms=0)
+        )
+        await exchange.initialize()
+        result = await exchange.create_market_order("BTC/USDT", OrderSide.BUY, 0.1)
+
+        first = await exchange.fetch_order_status(result.order_id, "BTC/USDT")
+        second = await exchange.fetch_order_status(result.order_id, "BTC/USDT")
+        assert isinstance(first.fills, tuple)
+        assert first.fills is second.fills
+
+        state = exchange._orders[result.order_id]
+        await exchange._create_fill(state, 100.0, 0.01)
+        third = await exchange.fetch_order_status(result.order_id, "BTC/USDT")
+        assert len(third.fills) == len(first.fills) + 1
+
+    @pytest.mark.asyncio
+    async def test_simulate_time_off_skips_sleeps(
+        self, mock_live_exchange, paper_config
+    ):
+        """Test fills match with and without simulated waiting"""
+        results = {}
+        for simulate_time in (True, False):
+            config = dict(paper_config, fill_ratio=0.0, simulate_time=simulate_time)
+            exchange = PaperExchange(mock_live_exchange, config)
+            with patch(
+                "triangular_arbitrage.exchanges.paper_exchange.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as sleep:
+                result = await exchange.create_market_order(
+                    "BTC/USDT", OrderSide.BUY, 0.1
+                )
+            assert (sleep.await_count > 0) is simulate_time
+            results[simulate_time] = [(f.amount, f.price) for f in result.fills]
+
+        assert len(results[False]) > 1
+        assert results[False] == results[True]
+
+    def test_sequential_ids(self, mock_live_exchange, paper_config):
+        """Test order ids are sequential per instance and distinct across them"""
+        exchange1 = PaperExchange(mock_live_exchange, paper_config)
+        exchange2 = PaperExchange(mock_live_exchange, paper_config.copy())
+
+        first, second = exchange1._gen_id(), exchange1._gen_id()
+        assert first.endswith("-1") and second.endswith("-2")
+        assert first.rsplit("-", 1)[0] == second.rsplit("-", 1)[0]
+        assert exchange2._gen_id() != first
+
+        exchange3 = PaperExchange(
+            mock_live_exchange, dict(paper_config, deterministic_ids=False)
+        )
+        assert len(exchange3._gen_id()) == 36
+
+    @pytest.mark.asyncio
+    async def test_cached_ticker_cannot_be_mutated(
+        self, mock_live_exchange, paper_config
+    ):
+        """Test the ticker shared by cache hits is read-only"""
+        from dataclasses import FrozenInstanceError
+
+        exchange = PaperExchange(mock_live_exchange, paper_config)
+        ticker = await exchange.fetch_ticker("BTC/USDT")
+
+        with pytest.raises(FrozenInstanceError):
+            ticker.bid = 0.0
+        assert (await exchange.fetch_ticker("BTC/USDT")).bid == 42000
+
     @pytest.mark.asyncio
     async def test_execution_metrics(self, mock_live_exchange, paper_config):
         """Test execution metrics collection"""
@@ -126,6 +214,135 @@ class TestPaperExchange:
         assert "fill_rate" in metrics
         assert "total_volume_usd" in metrics
 
+    @pytest.mark.asyncio
+    async def test_ticker_cached_and_coalesced(self, mock_live_exchange, paper_config):
+        """Test that fresh tickers are reused and concurrent misses share a fetch"""
+        exchange = PaperExchange(mock_live_exchange, paper_config)
+
+        results = await asyncio.gather(
+            *(exchange.fetch_ticker("BTC/USDT") for _ in range(5))
+        )
+        await exchange.fetch_ticker("BTC/USDT")
+
+        assert all(r is results[0] for r in results)
+        mock_live_exchange.fetch_ticker.assert_awaited_once_with("BTC/USDT")
+
+        exchange._ticker_ttl = 0.0
+        await exchange.fetch_ticker("BTC/USDT")
+        assert mock_live_exchange.fetch_ticker.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_market_orders_batch_matches_single_orders(
+        self, mock_live_exchange, paper_config
+    ):
+        """Test that batch pricing gives the per-order execution prices"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSpec
+
+        config = dict(paper_config, fill_ratio=1.0, latency_sim_ms=0)
+        config["slippage_model"] = {
+            "base_slippage_bps": 2,
+            "volatility_multiplier": 1.5,
+            "random_component_bps": 0,
+            "adverse_selection_bps": 1,
+        }
+        single = PaperExchange(mock_live_exchange, dict(config))
+        batched = PaperExchange(mock_live_exchange, dict(config))
+        specs = [
+            OrderSpec("BTC/USDT", OrderSide.BUY, 0.01),
+            OrderSpec("BTC/USDT", OrderSide.SELL, 0.5),
+        ]
+
+        expected = [
+            await single.create_market_order(s.symbol, s.side, s.amount) for s in specs
+        ]
+        results = await batched.create_orders_batch(specs)
+
+        assert [r.status for r in results] == ["filled", "filled"]
+        for got, want in zip(results, expected):
+            assert got.average_price == pytest.approx(want.average_price)
+        assert await batched.fetch_balance() == await single.fetch_balance()
+
+    @pytest.mark.asyncio
+    async def test_market_orders_batch_reproducible_with_seed(
+        self, mock_live_exchange, paper_config
+    ):
+        """Test a seeded batch with random slippage and partial fills repeats"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderSpec
+
+        config = dict(
+            paper_config, fill_ratio=0.5, latency_sim_ms=0, simulate_time=False
+        )
+        specs = [
+            OrderSpec("BTC/USDT", OrderSide.BUY, 0.01),
+            OrderSpec("BTC/USDT", OrderSide.SELL, 0.5),
+            OrderSpec("BTC/USDT", OrderSide.BUY, 0.2),
+        ]
+
+        runs = []
+        for _ in range(2):
+            exchange = PaperExchange(mock_live_exchange, dict(config))
+            results = await exchange.create_orders_batch(specs)
+            runs.append([(r.average_price, r.amount_filled) for r in results])
+
+        assert runs[0] == runs[1]
+
+    def test_multi_fill_balance_update(self, mock_live_exchange, paper_config):
+        """Test balances net every fill of an order"""
+        from triangular_arbitrage.exchanges.base_adapter import FillInfo
+        from triangular_arbitrage.exchanges.base_adapter import (
+            OrderSide as AdapterOrderSide,
+        )
+        from triangular_arbitrage.exchanges.paper_exchange import PaperOrderState
+
+        exchange = PaperExchange(mock_live_exchange, paper_config)
+        for side, amounts in (
+            (AdapterOrderSide.BUY, (0.1, 0.2)),
+            (AdapterOrderSide.SELL, (0.05,)),
+        ):
+            state = PaperOrderState("o", "BTC/USDT", side, OrderType.MARKET, 0.3)
+            state.fills = [
+                FillInfo("o", "BTC/USDT", side, amount, 100.0, 1.0, 0.0, "f")
+                for amount in amounts
+            ]
+            exchange._update_balances(state)
+
+        assert exchange._balances["BTC"] == pytest.approx(1.25)
+        assert exchange._balances["USDT"] == pytest.approx(50000 - 32 + 4)
+
+    def test_random_stream_seeded_across_blocks(self, mock_live_exchange, paper_config):
+        """Test seeded draws repeat exactly, including past a block refill"""
+        import itertools
+        from triangular_arbitrage.exchanges.paper_exchange import RANDOM_BLOCK_SIZE
+
+        n = RANDOM_BLOCK_SIZE + 5
+        first = PaperExchange(mock_live_exchange, paper_config)
+        second = PaperExchange(mock_live_exchange, paper_config.copy())
+        draws = list(itertools.islice(first._random, n))
+
+        assert draws == list(itertools.islice(second._random, n))
+        assert all(0.0 <= x < 1.0 for x in draws)
+        assert len(set(draws)) == n
+
+    def test_slippage_kernels_match(self):
+        """Test that the batch slippage kernels agree"""
+        import numpy as np
+        from triangular_arbitrage.exchanges.paper_exchange import (
+            _slippage_bps_batch,
+            _slippage_bps_loop,
+            _slippage_bps_numpy,
+        )
+
+        base = np.array([42000.0, 2200.0, 0.0524])
+        amount = np.array([0.5, 3.0, 10.0])
+        rand_bps = np.array([1.5, -2.0, 0.25])
+        args = (base, amount, rand_bps, 8.0, 0.1, 1.5)
+
+        expected = _slippage_bps_loop(*args)
+        for kernel in (_slippage_bps_batch, _slippage_bps_numpy):
+            assert kernel(*args) == pytest.approx(expected)
+        # 0.5 BTC @ 42000 = 21000 notional -> 2.1 bps impact, capped at 1.5
+        assert expected[0] == pytest.approx(8.0 + 1.5 + 1.5)
+
 
 class TestBacktestExchange:
     """Test BacktestExchange functionality"""
@@ -194,6 +411,48 @@ class TestBacktestExchange:
         )
         assert "data_points_processed" in metrics
 
+    def test_exec_price_kernels_match(self):
+        """Test that the batch execution price kernels agree"""
+        import numpy as np
+        from triangular_arbitrage.exchanges.backtest_exchange import (
+            _exec_price_kernel,
+            _exec_price_loop,
+            _exec_price_numpy,
+        )
+
+        base = np.array([42000.0, 2200.0, 0.0524])
+        amount = np.array([0.5, 3.0, 10.0])
+        side_sign = np.array([1.0, -1.0, 1.0])
+        rand_bps = np.array([1.5, -2.0, 0.25])
+        args = (base, amount, side_sign, rand_bps, 3.0, 0.05, 100.0)
+
+        expected_price, expected_bps = _exec_price_loop(*args)
+        for kernel in (_exec_price_kernel, _exec_price_numpy):
+            price, bps = kernel(*args)
+            assert price == pytest.approx(expected_price)
+            assert bps == pytest.approx(expected_bps)
+        # 0.5 BTC @ 42000 = 21000 notional -> 1.05 bps size impact
+        assert expected_bps[0] == pytest.approx(3.0 + 1.05 + 1.5)
+
+    def test_parallel_csv_read_matches_single_read(self, tmp_path):
+        """Test that segment-parallel CSV parsing keeps every row in order"""
+        import pandas as pd
+        from triangular_arbitrage.exchanges.backtest_exchange import (
+            _read_csv_parallel,
+        )
+
+        rows = ["timestamp,symbol,bid,ask,last,volume"] + [
+            f"{1700000000 + i}.0,BTC/USDT,{42000 + i},{42010 + i},{42005 + i},1.5"
+            for i in range(50)
+        ]
+        data_file = tmp_path / "feed.csv"
+        data_file.write_text("\n".join(rows) + "\n")
+
+        expected = pd.read_csv(data_file, dtype={"symbol": str})
+        for workers in (1, 3, 200):
+            result = _read_csv_parallel(data_file, workers)
+            pd.testing.assert_frame_equal(result, expected)
+
 
 class TestLiveExchangeAdapter:
     """Test LiveExchangeAdapter wrapper"""
@@ -245,6 +504,545 @@ class TestLiveExchangeAdapter:
         assert result.status == "filled"
         assert result.amount_filled == 0.1
         assert len(result.fills) == 1
+        assert result.fills[0].fee == 1.26
+        assert result.total_fee == 1.26
+
+    @pytest.mark.asyncio
+    async def test_order_conversion_with_sparse_trades(self, mock_live_exchange):
+        """Test fill defaults when trades omit fields"""
+        adapter = LiveExchangeAdapter(mock_live_exchange, {"execution_mode": "live"})
+        mock_live_exchange.create_market_order = AsyncMock(
+            return_value={
+                "id": "order_1",
+                "status": "closed",
+                "trades": [{"amount": 0.1}],
+            }
+        )
+
+        result = await adapter.create_market_order("BTC/USDT", OrderSide.BUY, 0.1)
+
+        fill = result.fills[0]
+        assert fill.amount == 0.1
+        assert fill.price == 100.0
+        assert fill.fee == 0.0
+        assert fill.fill_id == "test_fill"
+
+    @pytest.mark.asyncio
+    async def test_limit_order_conversion(self, mock_live_exchange):
+        """Test a live limit order is returned as an OrderResult"""
+        from triangular_arbitrage.exchanges.base_adapter import OrderResult
+
+        adapter = LiveExchangeAdapter(mock_live_exchange, {"execution_mode": "live"})
+        mock_live_exchange.create_limit_order = AsyncMock(
+            return_value={
+                "id": "limit_1",
+                "status": "open",
+                "filled": 0.05,
+                "average": 41990.0,
+                "trades": [
+                    {
+                        "amount": 0.05,
+                        "price": 41990.0,
+                        "timestamp": 1700000000000,
+                        "id": "t1",
+                        "fee": {"cost": 0.5},
+                    }
+                ],
+            }
+        )
+
+        result = await adapter.create_limit_order(
+            "BTC/USDT", OrderSide.SELL, 0.2, 42000
+        )
+
+        mock_live_exchange.create_limit_order.assert_awaited_once_with(
+            "BTC/USDT", "sell", 0.2, 42000
+        )
+        assert isinstance(result, OrderResult)
+        assert result.order_id == "limit_1"
+        assert result.status == "open"
+        assert result.amount_requested == 0.2
+        assert result.amount_filled == 0.05
+        assert result.average_price == 41990.0
+        assert result.total_fee == 0.5
+        assert [f.fill_id for f in result.fills] == ["t1"]
+
+    @pytest.mark.asyncio
+    async def test_mock_orders_without_exchange_methods(self):
+        """Test mock results when the wrapped exchange lacks order methods"""
+        adapter = LiveExchangeAdapter(object(), {"execution_mode": "live"})
+
+        market = await adapter.create_market_order("BTC/USDT", OrderSide.BUY, 0.1)
+        limit = await adapter.create_limit_order("BTC/USDT", OrderSide.SELL, 0.2, 42000)
+
+        assert market.status == "filled"
+        assert market.amount_filled == 0.1
+        assert market.average_price == 100.0
+        assert limit.status == "filled"
+        assert limit.amount_filled == 0.2
+        assert limit.average_price == 42000
+        assert market.fills is not limit.fills
+
+    @pytest.mark.asyncio
+    async def test_cancel_order_status(self, mock_live_exchange):
+        """Test cancel status detection for non-interned status strings"""
+        adapter = LiveExchangeAdapter(mock_live_exchange, {"execution_mode": "live"})
+        status = "".join(["cancel", "ed"])
+        mock_live_exchange.cancel_order = AsyncMock(return_value={"status": status})
+
+        assert await adapter.cancel_order("order_1", "BTC/USDT") is True
+
+        mock_live_exchange.cancel_order = AsyncMock(return_value={"status": "open"})
+        assert await adapter.cancel_order("order_1", "BTC/USDT") is False
+
+
+class TestCcxtAdapter:
+    """Test the ccxt wrapper in base_adapter"""
+
+    @staticmethod
+    def make_adapter(exchange):
+        from triangular_arbitrage.exchanges.base_adapter import (
+            LiveExchangeAdapter as CcxtAdapter,
+        )
+
+        return CcxtAdapter(exchange, {"execution_mode": "live"})
+
+    @staticmethod
+    def ccxt_order(order_id, side, amount):
+        return {
+            "id": order_id,
+            "side": side,
+            "status": "closed",
+            "amount": amount,
+            "filled": amount,
+            "average": 100.0,
+            "fee": {"cost": 0.1},
+            "trades": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_orders_batch_uses_native_endpoint(self):
+        from triangular_arbitrage.exchanges.base_adapter import (
+            OrderSide,
+            OrderSpec,
+            OrderType,
+        )
+
+        exchange = Mock()
+        exchange.has = {"createOrders": True}
+        exchange.create_orders = AsyncMock(
+            return_value=[
+                self.ccxt_order("1", "buy", 0.5),
+                self.ccxt_order("2", "sell", 2.0),
+            ]
+        )
+        adapter = self.make_adapter(exchange)
+
+        results = await adapter.create_orders_batch(
+            [
+                OrderSpec("BTC/USDT", OrderSide.BUY, 0.5),
+                OrderSpec("ETH/USDT", OrderSide.SELL, 2.0, OrderType.LIMIT, 2200.0),
+            ]
+        )
+
+        exchange.create_orders.assert_awaited_once()
+        sent = exchange.create_orders.await_args.args[0]
+        assert [o["type"] for o in sent] == ["market", "limit"]
+        assert sent[1]["price"] == 2200.0
+        assert [r.order_id for r in results] == ["1", "2"]
+        assert [r.symbol for r in results] == ["BTC/USDT", "ETH/USDT"]
+        assert all(r.status == "filled" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_orders_batch_falls_back_to_single_orders(self):
+        from triangular_arbitrage.exchanges.base_adapter import (
+            OrderSide,
+            OrderSpec,
+            OrderType,
+        )
+
+        exchange = Mock()
+        exchange.has = {}
+        exchange.create_market_buy_order = AsyncMock(
+            return_value=self.ccxt_order("1", "buy", 0.5)
+        )
+        exchange.create_limit_sell_order = AsyncMock(
+            return_value=self.ccxt_order("2", "sell", 2.0)
+        )
+        adapter = self.make_adapter(exchange)
+
+        results = await adapter.create_orders_batch(
+            [
+                OrderSpec("BTC/USDT", OrderSide.BUY, 0.5),
+                OrderSpec("ETH/USDT", OrderSide.SELL, 2.0, OrderType.LIMIT, 2200.0),
+            ]
+        )
+
+        assert [r.order_id for r in results] == ["1", "2"]
+        exchange.create_limit_sell_order.assert_awaited_once_with(
+            "ETH/USDT", 2.0, 2200.0
+        )
+
+        # Each order's round trip is stamped and totalled
+        assert all(0 < r.submit_mono_ns <= r.recv_mono_ns for r in results)
+        metrics = await adapter.get_execution_metrics()
+        assert metrics["orders_timed"] == 2
+        assert metrics["max_order_latency_ms"] >= metrics["avg_order_latency_ms"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_tickers_uses_one_request(self):
+        raw = {"bid": 99.0, "ask": 101.0, "last": 100.0, "quoteVolume": 5.0}
+        exchange = Mock()
+        exchange.has = {"fetchTickers": True}
+        exchange.fetch_tickers = AsyncMock(
+            return_value={"BTC/USDT": raw, "ETH/USDT": raw, "XRP/USDT": raw}
+        )
+        exchange.fetch_ticker = AsyncMock(return_value=raw)
+        adapter = self.make_adapter(exchange)
+
+        tickers = await adapter.fetch_tickers(["BTC/USDT", "ETH/USDT", "ETH/BTC"])
+
+        exchange.fetch_tickers.assert_awaited_once()
+        # Only the symbol missing from the batched response is fetched singly
+        exchange.fetch_ticker.assert_awaited_once_with("ETH/BTC")
+        assert set(tickers) == {"BTC/USDT", "ETH/USDT", "ETH/BTC"}
+        assert tickers["ETH/USDT"].symbol == "ETH/USDT"
+        assert tickers["BTC/USDT"].last == 100.0
+
+    @pytest.mark.asyncio
+    async def test_fetch_ticker_served_from_websocket_stream(self):
+        pushes = asyncio.Queue()
+        exchange = Mock()
+        exchange.has = {"watchTicker": True}
+        exchange.watch_ticker = lambda symbol: pushes.get()
+        exchange.fetch_ticker = AsyncMock(
+            return_value={"bid": 1.0, "ask": 3.0, "last": 2.0, "quoteVolume": 1.0}
+        )
+        exchange.close = AsyncMock()
+        adapter = self.make_adapter(exchange)
+
+        # First call goes over REST and starts the stream
+        assert (await adapter.fetch_ticker("BTC/USDT")).last == 2.0
+        await pushes.put({"bid": 9.0, "ask": 11.0, "last": 10.0, "quoteVolume": 1.0})
+        await asyncio.sleep(0.01)
+
+        ticker = await adapter.fetch_ticker("BTC/USDT")
+        assert ticker.last == 10.0
+        exchange.fetch_ticker.assert_awaited_once()
+
+        await adapter.close()
+        assert adapter._watch_tasks == {}
+        assert adapter._ticker_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_stalled_websocket_stream_falls_back_to_rest(self):
+        pushes = asyncio.Queue()
+        exchange = Mock()
+        exchange.has = {"watchTicker": True}
+        exchange.watch_ticker = lambda symbol: pushes.get()
+        exchange.fetch_ticker = AsyncMock(
+            return_value={"bid": 1.0, "ask": 3.0, "last": 2.0, "quoteVolume": 1.0}
+        )
+        exchange.close = AsyncMock()
+        adapter = self.make_adapter(exchange)
+        adapter._ticker_max_age = 0.05
+
+        await adapter.fetch_ticker("BTC/USDT")
+        await pushes.put({"bid": 9.0, "ask": 11.0, "last": 10.0, "quoteVolume": 1.0})
+        await asyncio.sleep(0.01)
+        assert (await adapter.fetch_ticker("BTC/USDT")).last == 10.0
+
+        # The feed goes quiet without raising: the old push is not served
+        await asyncio.sleep(0.06)
+        assert (await adapter.fetch_ticker("BTC/USDT")).last == 2.0
+        assert exchange.fetch_ticker.await_count == 2
+
+        # A fresh push is served from the stream again
+        await pushes.put({"bid": 4.0, "ask": 6.0, "last": 5.0, "quoteVolume": 1.0})
+        await asyncio.sleep(0.01)
+        assert (await adapter.fetch_ticker("BTC/USDT")).last == 5.0
+        assert exchange.fetch_ticker.await_count == 2
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_stuck_cancel_times_out(self):
+        async def hang(order_id, symbol):
+            await asyncio.sleep(10)
+
+        exchange = Mock()
+        exchange.cancel_order = hang
+        exchange.fetch_order = hang
+        adapter = self.make_adapter(exchange)
+        adapter.config.update(cancel_timeout_s=0.01, fetch_order_timeout_s=0.01)
+
+        assert await adapter.cancel_order("1", "BTC/USDT") is False
+        result = await adapter.fetch_order_status("1", "BTC/USDT")
+        assert result.status == "failed"
+        assert "timed out" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_cancel_order_propagates_task_cancellation(self):
+        started = asyncio.Event()
+
+        async def hang(order_id, symbol):
+            started.set()
+            await asyncio.sleep(10)
+
+        exchange = Mock()
+        exchange.cancel_order = hang
+        adapter = self.make_adapter(exchange)
+
+        task = asyncio.ensure_future(adapter.cancel_order("1", "BTC/USDT"))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_minimum_order_size_indexed_from_markets(self):
+        exchange = Mock()
+        exchange.load_markets = AsyncMock(
+            return_value={
+                "BTC/USDT": {"limits": {"amount": {"min": 0.0001}}},
+                "ETH/USDT": {"limits": {"amount": {"min": None}}},
+            }
+        )
+        adapter = self.make_adapter(exchange)
+        await adapter.load_markets()
+
+        assert adapter.get_minimum_order_size("BTC/USDT") == 0.0001
+        assert adapter.get_minimum_order_size("ETH/USDT") == 0.0
+        assert adapter.get_minimum_order_size("XRP/USDT") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_markets_shared_and_persisted(self, tmp_path, monkeypatch):
+        from triangular_arbitrage.exchanges import base_adapter
+
+        monkeypatch.setattr(base_adapter, "_MARKETS_CACHE", {})
+        loads = []
+
+        class FakeCcxt:
+            id = "fakeex"
+            markets = None
+            currencies = None
+
+            async def load_markets(self):
+                loads.append(self)
+                self.markets = {"BTC/USDT": {"limits": {"amount": {"min": 0.01}}}}
+                self.currencies = {"BTC": {"code": "BTC"}}
+                return self.markets
+
+            def set_markets(self, markets, currencies=None):
+                self.markets = markets
+                self.currencies = currencies
+
+        config = {"markets_cache_dir": str(tmp_path), "prewarm": False}
+        adapters = [
+            base_adapter.LiveExchangeAdapter(FakeCcxt(), config) for _ in range(2)
+        ]
+        await asyncio.gather(*(adapter.initialize() for adapter in adapters))
+        assert len(loads) == 1
+        assert all(a.get_minimum_order_size("BTC/USDT") == 0.01 for a in adapters)
+
+        # Re-initializing an adapter does not load its markets again
+        base_adapter._MARKETS_CACHE.clear()
+        await adapters[0].initialize()
+        assert len(loads) == 1
+
+        # A fresh process reads the markets back from disk
+        monkeypatch.setattr(base_adapter, "_MARKETS_CACHE", {})
+        adapter = base_adapter.LiveExchangeAdapter(FakeCcxt(), config)
+        await adapter.initialize()
+        assert len(loads) == 1
+        assert adapter.get_minimum_order_size("BTC/USDT") == 0.01
+        assert adapter.exchange.currencies == {"BTC": {"code": "BTC"}}
+
+    @pytest.mark.asyncio
+    async def test_markets_cache_keyed_by_variant_and_day(self, tmp_path, monkeypatch):
+        from triangular_arbitrage.exchanges import base_adapter
+
+        monkeypatch.setattr(base_adapter, "_MARKETS_CACHE", {})
+        loads = []
+
+        class FakeCcxt:
+            id = "fakeex"
+            markets = None
+            currencies = None
+
+            def __init__(self, sandbox=False, options=None):
+                self.isSandboxModeEnabled = sandbox
+                self.options = options or {}
+
+            async def load_markets(self):
+                loads.append(self)
+                self.markets = {"BTC/USDT": {}}
+                return self.markets
+
+            def set_markets(self, markets, currencies=None):
+                self.markets = markets
+
+        config = {"markets_cache_dir": str(tmp_path), "prewarm": False}
+        stale = tmp_path / "fakeex-2000-01-01.json"
+        stale.write_text("{}")
+        base_adapter._MARKETS_CACHE[("fakeex", "2000-01-01")] = ({}, None)
+
+        for exchange in (
+            FakeCcxt(),
+            FakeCcxt(sandbox=True),
+            FakeCcxt(options={"defaultType": "swap"}),
+            FakeCcxt(),
+        ):
+            await base_adapter.LiveExchangeAdapter(exchange, config).initialize()
+
+        # Mainnet, sandbox and swap markets are loaded once each
+        assert len(loads) == 3
+        assert len(base_adapter._MARKETS_CACHE) == 3
+        assert all(day != "2000-01-01" for _, day in base_adapter._MARKETS_CACHE)
+        assert not stale.exists()
+        assert len(list(tmp_path.glob("*.json"))) == 3
+
+    def test_fee_rate_follows_fee_config_changes(self):
+        adapter = self.make_adapter(Mock())
+
+        assert adapter.get_fee_rate("BTC/USDT", None, OrderType.MARKET) == 0.003
+        assert adapter.get_fee_rate("BTC/USDT", None, OrderType.LIMIT) == 0.001
+
+        adapter.config["fees"] = {"taker_bps": 10, "maker_bps": 2}
+        assert adapter.get_fee_rate("BTC/USDT", None, OrderType.MARKET) == 0.001
+        assert adapter.get_fee_rate("BTC/USDT", None, OrderType.LIMIT) == 0.0002
+
+        # Edited in place rather than replaced
+        adapter.config["fees"]["taker_bps"] = 5
+        assert adapter.get_fee_rate("BTC/USDT", None, OrderType.MARKET) == 0.0005
+
+    @pytest.mark.asyncio
+    async def test_convert_order_result_tolerates_null_fields(self):
+        order = self.ccxt_order("1", "buy", 0.5)
+        # A full unified order, as ccxt's safe_order returns it
+        order.update(fee=None, info=None, price=None, average=None)
+        order["trades"] = [
+            {
+                "id": "t1",
+                "amount": 0.2,
+                "price": 100.0,
+                "fee": None,
+                "timestamp": 1700000000000,
+            },
+            {
+                "id": "t2",
+                "amount": 0.3,
+                "price": 101.0,
+                "fee": {"cost": 0.05},
+                "timestamp": None,
+            },
+        ]
+        adapter = self.make_adapter(Mock())
+
+        before = time.time()
+        result = await adapter._convert_order_result(order, "BTC/USDT", None, 0.5)
+
+        # Order-level average and fee are null, so they come from the fills
+        assert result.average_price == pytest.approx((20.0 + 30.3) / 0.5)
+        assert result.total_fee == 0.05
+        assert result.error_message is None
+        first, second = result.fills
+        assert first.fee == 0 and first.timestamp == 1700000000.0
+        assert second.fee == 0.05
+        assert before <= second.timestamp <= time.time()
+        assert all(f.order_id == "1" for f in result.fills)
+
+    @pytest.mark.asyncio
+    async def test_fill_batch_built_on_first_access(self):
+        order = self.ccxt_order("1", "buy", 0.5)
+        order.update(average=100.5, fee={"cost": 0.05})
+        order["trades"] = [
+            {"id": "t1", "amount": 0.2, "price": 100.0, "timestamp": 1000},
+            {"id": "t2", "amount": 0.3, "price": 101.0, "timestamp": 2000},
+        ]
+        adapter = self.make_adapter(Mock())
+
+        result = await adapter._convert_order_result(order, "BTC/USDT", None, 0.5)
+
+        # Order-level average and fee are present, so no batch is needed
+        assert result._fill_batch is None
+        assert result.fill_batch.prices.tolist() == [100.0, 101.0]
+        assert result.fill_batch is result.fill_batch
+
+    @pytest.mark.asyncio
+    async def test_initialize_installs_pooled_session_and_ping(self):
+        from triangular_arbitrage.exchanges.base_adapter import (
+            LiveExchangeAdapter as CcxtAdapter,
+        )
+
+        class FakeCcxt:
+            session = None
+            pings = 0
+            closed = False
+
+            async def load_markets(self):
+                return {}
+
+            async def fetch_time(self):
+                self.pings += 1
+
+            async def close(self):
+                self.closed = True
+
+        exchange = FakeCcxt()
+        adapter = CcxtAdapter(
+            exchange, {"keepalive_ping_seconds": 0.001, "prewarm_connections": 3}
+        )
+        await adapter.initialize()
+        # Warm-up requests run during initialize, before any ping
+        assert exchange.pings >= 3
+
+        session = exchange.session
+        assert session is not None and not session.closed
+        await asyncio.sleep(0.05)
+        assert exchange.pings > 3
+
+        await adapter.close()
+        assert exchange.closed
+        assert session.closed
+        assert adapter._ping_task is None
+
+    @pytest.mark.asyncio
+    async def test_pooled_session_keeps_ccxt_tls_and_proxy_settings(self):
+        import ssl
+
+        import aiohttp
+
+        from triangular_arbitrage.exchanges.base_adapter import (
+            LiveExchangeAdapter as CcxtAdapter,
+        )
+
+        class FakeCcxt:
+            session = None
+            ssl_context = None
+            aiohttp_trust_env = True
+
+            def open(self):
+                # As ccxt: resolve the TLS context and create a plain session
+                self.ssl_context = ssl.create_default_context()
+                self.session = self.default_session = aiohttp.ClientSession()
+
+            async def close(self):
+                pass
+
+        exchange = FakeCcxt()
+        adapter = CcxtAdapter(exchange, {"keepalive_ping_seconds": 0})
+        await adapter.initialize()
+        session = exchange.session
+
+        assert session is adapter._session
+        assert exchange.default_session.closed
+        assert session.connector._ssl is exchange.ssl_context
+        assert session.trust_env is True
+        assert session.connector.limit == 32
+
+        await adapter.close()
+        assert session.closed
 
 
 @pytest.mark.asyncio
@@ -268,3 +1066,47 @@ def test_order_type_enum():
     """Test OrderType enum values"""
     assert OrderType.MARKET.value == "market"
     assert OrderType.LIMIT.value == "limit"
+
+
+class TestTokenBucket:
+    """Test the order throttle used by the ccxt wrapper"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_refill_rate(self):
+        from triangular_arbitrage.exchanges.base_adapter import TokenBucket
+
+        bucket = TokenBucket(capacity=3, refill_rate=50.0)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = time.monotonic() - start
+        await bucket.acquire(2)
+        waited = time.monotonic() - start - burst
+
+        assert burst < 0.01
+        # Two tokens at 50/s take about 40ms to refill
+        assert waited >= 0.03
+
+
+def test_fill_batch_vwap():
+    from triangular_arbitrage.exchanges.base_adapter import (
+        FillBatch,
+        FillInfo,
+        OrderSide,
+    )
+
+    batch = FillBatch.from_fills(
+        [
+            FillInfo("1", "BTC/USDT", OrderSide.BUY, 1.0, 100.0, 0.1, 1.0, "f1"),
+            FillInfo("1", "BTC/USDT", OrderSide.BUY, 0.5, 110.0, None, 2.0, "f2"),
+            FillInfo("1", "BTC/USDT", OrderSide.BUY, 0.5, 120.0, 0.0, 3.0, "f3"),
+        ]
+    )
+
+    assert len(batch) == 3
+    assert batch.prices.tolist() == [100.0, 110.0, 120.0]
+    assert batch.vwap() == pytest.approx((100.0 + 55.0 + 60.0) / 2.0)
+    assert batch.total_fee() == pytest.approx(0.1)
+    assert batch.timestamps[0] == 1.0
+    assert FillBatch().vwap() == 0.0
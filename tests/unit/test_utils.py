@@ -32,6 +32,7 @@ from triangular_arbitrage.utils import (
     is_positive_number,
     is_valid_percentage,
     is_valid_basis_points,
+    install_uvloop,
 )
 
 
@@ -249,6 +250,19 @@ class TestLoggingUtils:
         assert len(logger.handlers) > 0
 
 
+def test_install_uvloop_sets_policy():
+    """Test uvloop policy installation (no-op when uvloop is missing)."""
+    import asyncio
+
+    previous = asyncio.get_event_loop_policy()
+    try:
+        installed = install_uvloop()
+        policy = asyncio.get_event_loop_policy()
+        assert installed == (type(policy).__module__.startswith("uvloop"))
+    finally:
+        asyncio.set_event_loop_policy(previous)
+
+
 def test_no_circular_imports():
     """Test that importing utils doesn't cause circular imports."""
     # This test passes if the import at the top doesn't raise ImportError
@@ -25,6 +25,7 @@ from triangular_arbitrage.execution_helpers import (
 )
 from triangular_arbitrage.slippage_monitor import SlippageMonitor
 from triangular_arbitrage.trade_executor import _fire_trade_callbacks
+from triangular_arbitrage.utils import install_uvloop
 from triangular_arbitrage.validation.breakeven import BreakevenGuard, LegInfo
 
 # Setup logging
@@ -2919,4 +2920,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -101,6 +101,15 @@ class BacktestExecutionConfig(BaseModel):
         default=None, description="End timestamp"
     )
     time_acceleration: Optional[float] = Field(ge=0.1, le=1000, default=1.0)
+    realtime_playback: bool = Field(
+        default=False, description="Sleep through simulated delays"
+    )
+    retain_orders: bool = Field(
+        default=True, description="Keep finished orders queryable by id"
+    )
+    data_cache: bool = Field(
+        default=True, description="Cache parsed data as Parquet beside the CSV"
+    )
     random_seed: Optional[int] = Field(ge=1, le=2147483647, default=None)
     initial_balances: Dict[str, float] = Field(
         description="Initial balances for backtesting"
@@ -7,17 +7,115 @@ slippage, and market conditions.
 """
 
 import asyncio
+import heapq
 import logging
+import math
 import time
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Set, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from itertools import groupby
 import networkx as nx
-from collections import defaultdict, deque
-# heapq removed - not used in current implementation
+import numpy as np
+from collections import Counter, deque
+
+from .utils import DATACLASS_SLOTS
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# symbol -> (monotonic fetch time, array order book, depth or None for full)
+BookCache = Dict[str, Tuple[float, Dict[str, np.ndarray], Optional[int]]]
+
+# Slippage reported when a book cannot absorb the requested amount
+NO_LIQUIDITY_SLIPPAGE_BPS = 999999
+
+
+def _slippage_bps_loop(prices, volumes, amount):
+    """Slippage in bps of filling ``amount`` against one side of a book"""
+    if amount <= 0:
+        return 0.0
+
+    remaining = amount
+    total_cost = 0.0
+
+    for i in range(prices.size):
+        if remaining <= 0:
+            break
+
+        filled = min(remaining, volumes[i])
+        total_cost += filled * prices[i]
+        remaining -= filled
+
+    if remaining > 0:
+        return NO_LIQUIDITY_SLIPPAGE_BPS
+
+    avg_price = total_cost / amount
+    best_price = prices[0]
+
+    return abs(avg_price - best_price) / best_price * 10000
+
+
+def _slippage_bps_numpy(prices, volumes, amount):
+    """Vectorised equivalent of ``_slippage_bps_loop`` using cumulative volume"""
+    if amount <= 0:
+        return 0.0
+
+    cumulative = np.cumsum(volumes)
+    if amount > cumulative[-1]:
+        return NO_LIQUIDITY_SLIPPAGE_BPS
+
+    # First level at which the cumulative volume covers the amount
+    idx = int(np.searchsorted(cumulative, amount))
+    filled_before = cumulative[idx - 1] if idx else 0.0
+    total_cost = float(prices[:idx] @ volumes[:idx]) + float(
+        prices[idx] * (amount - filled_before)
+    )
+
+    avg_price = total_cost / amount
+    best_price = prices[0]
+
+    return abs(avg_price - best_price) / best_price * 10000
+
+
+# Compiled loop when numba is installed, otherwise the NumPy cumsum version
+if NUMBA_AVAILABLE:
+    _slippage_bps = njit(cache=True)(_slippage_bps_loop)
+else:
+    _slippage_bps = _slippage_bps_numpy
+
+
+def _bucket_amount(amount: float, significant_figures: int = 3) -> float:
+    """Round ``amount`` to a few significant figures for memoisation"""
+    if amount <= 0:
+        return amount
+    return round(amount, significant_figures - 1 - math.floor(math.log10(amount)))
+
+
+def _book_liquidity(levels, depth: int = 5) -> float:
+    """Quote value resting in the top ``depth`` levels of one side of a book"""
+    top = np.asarray(levels[:depth], dtype=np.float64)
+    if top.ndim != 2:
+        return 0.0
+    return float(top[:, 0] @ top[:, 1])
+
+
+def _book_to_arrays(order_book: Dict) -> Dict[str, np.ndarray]:
+    """Convert ``bids``/``asks`` level lists to contiguous (N, 2) float arrays"""
+    arrays = {}
+    for side in ("bids", "asks"):
+        levels = np.asarray(order_book.get(side) or [], dtype=np.float64)
+        if levels.ndim != 2:
+            levels = levels.reshape(0, 2)
+        arrays[side] = np.ascontiguousarray(levels[:, :2])
+    return arrays
+
 
 class MarketCondition(Enum):
     """Market condition indicators"""
@@ -28,7 +126,7 @@ class MarketCondition(Enum):
     EXTREME = "extreme"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MarketEdge:
     """Represents a market connection between two currencies"""
 
@@ -46,7 +144,7 @@ class MarketEdge:
     slippage_estimate: float = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LiquidationPath:
     """Represents a complete liquidation path"""
 
@@ -60,7 +158,7 @@ class LiquidationPath:
     risk_score: float  # Risk assessment (0-1, lower is better)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExecutionStep:
     """Single step in a multi-hop execution"""
 
@@ -102,6 +200,8 @@ class EnhancedFailureRecoveryManager:
         self.max_single_hop_slippage_bps = self.panic_config.get(
             "max_single_hop_slippage_bps", 100
         )
+        # Order book levels to request; None fetches the exchange's full depth
+        self.book_depth = self.panic_config.get("book_depth", 20)
 
         # Path finding parameters
         self.path_timeout_ms = self.panic_config.get("path_timeout_ms", 5000)
@@ -109,6 +209,13 @@ class EnhancedFailureRecoveryManager:
         self.liquidity_weight = self.panic_config.get("liquidity_weight", 0.4)
         self.slippage_weight = self.panic_config.get("slippage_weight", 0.4)
         self.hop_penalty_weight = self.panic_config.get("hop_penalty_weight", 0.2)
+        # Stop searching longer routes once a path is at least this good
+        self.early_exit_slippage_ratio = self.panic_config.get(
+            "early_exit_slippage_ratio", 0.5
+        )
+        self.early_exit_min_confidence = self.panic_config.get(
+            "early_exit_min_confidence", 0.85
+        )
 
         # Market condition parameters
         self.volatility_threshold_bps = self.panic_config.get(
@@ -125,13 +232,31 @@ class EnhancedFailureRecoveryManager:
 
         # Caching
         self.market_graph = nx.DiGraph()
-        self.market_cache = {}
+        # Flat adjacency for hot reads: currency -> [(to, symbol, side, fees)]
+        self._adj: Dict[str, List[Tuple[str, str, str, float]]] = {}
+        # Keyed form of the same adjacency, used for incremental updates
+        self._adjacency: Dict[str, Dict[str, Tuple[str, str, str, float]]] = {}
+        # (from, to) -> the same (to, symbol, side, fees) tuple held in _adj
+        self._edge_index: Dict[Tuple[str, str], Tuple[str, str, str, float]] = {}
+        # symbol -> (base, quote, fees) for every market currently in the graph
+        self._known_symbols: Dict[str, Tuple[str, str, float]] = {}
+        # Order books shared by slippage estimation and condition analysis
+        self.market_cache: BookCache = {}
         self.cache_ttl = self.panic_config.get("cache_ttl_ms", 10000) / 1000.0
+        # Monotonic time expired books were last dropped from a book cache
+        self._books_pruned_at = 0.0
         self.last_graph_update = 0
 
         # Tracking
         self.execution_history = deque(maxlen=100)
+        # Successful path counts for entries currently in execution_history
+        self._path_counter: Counter = Counter()
         self.blacklisted_markets = set()
+        # (expiry, symbol) min-heap drained by a single reaper task
+        self._blacklist_heap: List[Tuple[float, str]] = []
+        self._blacklist_expiry: Dict[str, float] = {}
+        self._blacklist_wakeup: Optional[asyncio.Event] = None
+        self._reaper_task: Optional[asyncio.Task] = None
         self.market_conditions = {}
 
     async def initialize(self):
@@ -139,7 +264,11 @@ class EnhancedFailureRecoveryManager:
         await self.build_market_graph()
 
     async def build_market_graph(self, force_refresh: bool = False):
-        """Build a graph of all available market connections"""
+        """Build a graph of all available market connections
+
+        Only markets that were listed, delisted, blacklisted or changed since
+        the previous refresh touch the graph; unchanged markets are left alone.
+        """
         current_time = time.time()
 
         # Check if we need to refresh
@@ -148,63 +277,147 @@ class EnhancedFailureRecoveryManager:
 
         try:
             markets = await self.exchange.load_markets()
-            self.market_graph.clear()
+            fresh: Dict[str, Tuple[str, str, float]] = {}
 
             for symbol, market in markets.items():
                 if not market.get("active", True):
                     continue
 
-                base = market["base"]
-                quote = market["quote"]
-
                 # Skip blacklisted markets
                 if symbol in self.blacklisted_markets:
                     continue
 
-                # Create bidirectional edges
-                edge_data = {
-                    "symbol": symbol,
-                    "base": base,
-                    "quote": quote,
-                    "weight": 1.0,  # Will be updated with liquidity data
-                    "fees": market.get("taker", 0.001),  # Default 0.1%
-                }
+                fresh[symbol] = (
+                    market["base"],
+                    market["quote"],
+                    market.get("taker", 0.001),  # Default 0.1%
+                )
 
-                # Add both directions
-                self.market_graph.add_edge(quote, base, **edge_data, side="buy")
-                self.market_graph.add_edge(base, quote, **edge_data, side="sell")
+            known = self._known_symbols
+            removed = [s for s, info in known.items() if fresh.get(s) != info]
+            added = [s for s, info in fresh.items() if known.get(s) != info]
+
+            touched: Set[str] = set()
+            for symbol in removed:
+                touched |= self._remove_market(symbol, *known.pop(symbol))
+            for symbol in added:
+                known[symbol] = fresh[symbol]
+                touched |= self._add_market(symbol, *fresh[symbol])
+
+            for currency in touched:
+                neighbours = self._adjacency.get(currency)
+                if neighbours:
+                    self._adj[currency] = list(neighbours.values())
+                else:
+                    self._adjacency.pop(currency, None)
+                    self._adj.pop(currency, None)
+                    if currency in self.market_graph:
+                        self.market_graph.remove_node(currency)
 
             self.last_graph_update = current_time
             logger.info(
                 f"Market graph updated: {self.market_graph.number_of_nodes()} currencies, "
-                f"{self.market_graph.number_of_edges()} market connections"
+                f"{self.market_graph.number_of_edges()} market connections "
+                f"(+{len(added)}/-{len(removed)} markets)"
             )
 
         except Exception as e:
             logger.error(f"Failed to build market graph: {e}")
 
+    def _add_market(self, symbol: str, base: str, quote: str, fees: float) -> Set[str]:
+        """Insert both directions of a market, returning the touched currencies"""
+        edge_data = {
+            "symbol": symbol,
+            "base": base,
+            "quote": quote,
+            "weight": 1.0,  # Will be updated with liquidity data
+            "fees": fees,
+        }
+
+        # Add both directions in one call
+        self.market_graph.add_edges_from(
+            (
+                (quote, base, {**edge_data, "side": "buy"}),
+                (base, quote, {**edge_data, "side": "sell"}),
+            )
+        )
+
+        # One tuple per direction, shared by the adjacency and the edge index
+        buy_edge = (base, symbol, "buy", fees)
+        sell_edge = (quote, symbol, "sell", fees)
+        self._adjacency.setdefault(quote, {})[base] = buy_edge
+        self._adjacency.setdefault(base, {})[quote] = sell_edge
+        self._edge_index[(quote, base)] = buy_edge
+        self._edge_index[(base, quote)] = sell_edge
+
+        return {base, quote}
+
+    def _remove_market(
+        self, symbol: str, base: str, quote: str, fees: float
+    ) -> Set[str]:
+        """Remove a market's edges, returning the touched currencies
+
+        Edges are only dropped if ``symbol`` still owns them; if another known
+        market trades the same pair it takes the edges over.
+        """
+        for from_curr, to_curr in ((quote, base), (base, quote)):
+            edge = self._edge_index.get((from_curr, to_curr))
+            if edge is None or edge[1] != symbol:
+                continue
+            del self._edge_index[(from_curr, to_curr)]
+            del self._adjacency[from_curr][to_curr]
+            self.market_graph.remove_edge(from_curr, to_curr)
+
+        touched = {base, quote}
+        replacement = None
+        for other, (other_base, other_quote, other_fees) in self._known_symbols.items():
+            if {other_base, other_quote} == touched:
+                replacement = (other, other_base, other_quote, other_fees)
+        if replacement is not None:
+            self._add_market(*replacement)
+
+        return touched
+
     async def analyze_market_conditions(
         self, currencies: List[str]
     ) -> Dict[str, MarketCondition]:
         """Analyze current market conditions for relevant currencies"""
         conditions = {}
 
+        # Check the top 3 markets of each currency
+        relevant_markets = {
+            currency: [symbol for _, symbol, _, _ in self._adj.get(currency, ())[:3]]
+            for currency in currencies
+        }
+
+        # Fetch ticker and order book for every distinct market concurrently
+        symbols = list(
+            dict.fromkeys(
+                symbol for markets in relevant_markets.values() for symbol in markets
+            )
+        )
+        results = await asyncio.gather(
+            *(
+                asyncio.gather(
+                    self.exchange.fetch_ticker(symbol),
+                    self._get_book(symbol, self.book_depth),
+                )
+                for symbol in symbols
+            ),
+            return_exceptions=True,
+        )
+        snapshots = dict(zip(symbols, results))
+
         for currency in currencies:
             try:
-                # Get recent trades and order book for volatility analysis
-                relevant_markets = [
-                    edge["symbol"]
-                    for _, _, edge in self.market_graph.edges(currency, data=True)
-                ][
-                    :3
-                ]  # Check top 3 markets
-
                 volatility_scores = []
                 liquidity_scores = []
 
-                for symbol in relevant_markets:
-                    ticker = await self.exchange.fetch_ticker(symbol)
-                    order_book = await self.exchange.fetch_order_book(symbol, limit=10)
+                for symbol in relevant_markets[currency]:
+                    snapshot = snapshots[symbol]
+                    if isinstance(snapshot, BaseException):
+                        raise snapshot
+                    ticker, order_book = snapshot
 
                     # Calculate volatility
                     if ticker.get("percentage"):
@@ -212,12 +425,8 @@ class EnhancedFailureRecoveryManager:
                         volatility_scores.append(volatility)
 
                     # Calculate liquidity
-                    bid_liquidity = sum(
-                        bid[1] * bid[0] for bid in order_book["bids"][:5]
-                    )
-                    ask_liquidity = sum(
-                        ask[1] * ask[0] for ask in order_book["asks"][:5]
-                    )
+                    bid_liquidity = _book_liquidity(order_book["bids"])
+                    ask_liquidity = _book_liquidity(order_book["asks"])
                     liquidity_scores.append(min(bid_liquidity, ask_liquidity))
 
                 # Determine market condition
@@ -249,46 +458,135 @@ class EnhancedFailureRecoveryManager:
 
         return conditions
 
-    async def calculate_slippage(self, symbol: str, side: str, amount: float) -> float:
-        """Calculate expected slippage for a trade"""
-        try:
-            order_book = await self.exchange.fetch_order_book(symbol)
+    async def calculate_slippage(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        book_cache: Optional[BookCache] = None,
+    ) -> float:
+        """Calculate expected slippage for a trade
 
-            if side == "buy":
-                orders = order_book["asks"]
-            else:
-                orders = order_book["bids"]
+        Order books are reused for up to ``cache_ttl`` seconds, from
+        ``book_cache`` if given and otherwise from ``market_cache``.
+        """
+        try:
+            book = await self._get_book(symbol, self.book_depth, book_cache)
+            return self._slippage_from_book(book, side, amount)
 
-            if not orders:
-                return 999999  # No liquidity
+        except Exception as e:
+            logger.error(f"Failed to calculate slippage for {symbol}: {e}")
+            return NO_LIQUIDITY_SLIPPAGE_BPS
 
-            # Calculate weighted average price for the amount
-            remaining = amount
-            total_cost = 0
+    def _slippage_from_book(
+        self, book: Dict[str, np.ndarray], side: str, amount: float
+    ) -> float:
+        """Walk an array order book and return the slippage in bps for ``amount``"""
+        orders = book["asks"] if side == "buy" else book["bids"]
 
-            for price, volume in orders:
-                if remaining <= 0:
-                    break
+        if not len(orders):
+            return NO_LIQUIDITY_SLIPPAGE_BPS
 
-                filled = min(remaining, volume)
-                total_cost += filled * price
-                remaining -= filled
+        return float(_slippage_bps(orders[:, 0], orders[:, 1], float(amount)))
 
-            if remaining > 0:
-                # Not enough liquidity
-                return 999999
+    def _cached_book(
+        self,
+        book_cache: BookCache,
+        symbol: str,
+        limit: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Optional[Tuple[float, Dict[str, np.ndarray], Optional[int]]]:
+        """Return a cache entry if it is younger than ``cache_ttl`` and at
+        least ``limit`` levels deep (``None`` meaning the full book)
+
+        Cache ages use ``time.monotonic()``; callers checking many symbols
+        pass one captured ``now`` instead of reading the clock per symbol.
+        """
+        entry = book_cache.get(symbol)
+        if now is None:
+            now = time.monotonic()
+        if entry is None or now - entry[0] >= self.cache_ttl:
+            return None
+        depth = entry[2]
+        if depth is not None and (limit is None or depth < limit):
+            return None
+        return entry
 
-            avg_price = total_cost / amount
-            best_price = orders[0][0]
+    async def _get_book(
+        self,
+        symbol: str,
+        limit: Optional[int] = None,
+        book_cache: Optional[BookCache] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Fetch an order book as NumPy arrays through the TTL cache"""
+        if book_cache is None:
+            book_cache = self.market_cache
+
+        entry = self._cached_book(book_cache, symbol, limit)
+        if entry is None:
+            order_book = await self.exchange.fetch_order_book(symbol, limit=limit)
+            entry = (time.monotonic(), _book_to_arrays(order_book), limit)
+            self._prune_books(book_cache, entry[0])
+            book_cache[symbol] = entry
+
+        return entry[1]
+
+    def _prune_books(self, book_cache: BookCache, now: float) -> None:
+        """Drop books older than ``cache_ttl`` so the cache stays bounded by
+        the symbols fetched within one TTL; runs at most once per TTL"""
+        if now - self._books_pruned_at < self.cache_ttl:
+            return
+        self._books_pruned_at = now
+        expired = [s for s, e in book_cache.items() if now - e[0] >= self.cache_ttl]
+        for symbol in expired:
+            del book_cache[symbol]
 
-            # Calculate slippage in basis points
-            slippage_bps = abs(avg_price - best_price) / best_price * 10000
+    async def _prefetch_books(
+        self,
+        paths: List[List[str]],
+        book_cache: Optional[BookCache] = None,
+    ) -> BookCache:
+        """Fetch every order book needed by ``paths`` concurrently
+
+        Symbols already in ``book_cache`` and younger than ``cache_ttl`` are
+        skipped. Failed fetches are logged and left out of the cache, which
+        makes the affected hops unviable during evaluation.
+        """
+        symbols = set()
+        for path in paths:
+            for from_curr, to_curr in zip(path, path[1:]):
+                edge = self._edge_index.get((from_curr, to_curr))
+                if edge:
+                    symbols.add(edge[1])
+
+        if book_cache is None:
+            book_cache = self.market_cache
+
+        now = time.monotonic()
+        to_fetch = [
+            symbol
+            for symbol in symbols
+            if self._cached_book(book_cache, symbol, self.book_depth, now) is None
+        ]
+        if not to_fetch:
+            return book_cache
+
+        results = await asyncio.gather(
+            *(
+                self._get_book(symbol, self.book_depth, book_cache)
+                for symbol in to_fetch
+            ),
+            return_exceptions=True,
+        )
 
-            return slippage_bps
+        for symbol, result in zip(to_fetch, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch order book for {symbol}: {result}")
+                book_cache.pop(symbol, None)
+            elif isinstance(result, BaseException):
+                raise result
 
-        except Exception as e:
-            logger.error(f"Failed to calculate slippage for {symbol}: {e}")
-            return 999999
+        return book_cache
 
     async def find_liquidation_paths(
         self,
@@ -319,62 +617,166 @@ class EnhancedFailureRecoveryManager:
                 )
             ]
 
+        targets = {t for t in target_currencies if t in self._adj}
+        candidate_paths = list(
+            self._enumerate_paths(from_currency, targets, self.max_hops)
+        )
+        if not candidate_paths:
+            logger.debug(f"No path found from {from_currency} to {target_currencies}")
+
+        # Keep only the most promising candidates before touching the network
+        now = time.monotonic()
+        candidate_paths.sort(key=lambda path: self._prescore(path, now))
+        del candidate_paths[self.max_paths_to_evaluate :]
+
+        # Candidates come out of the BFS ordered by hop count. Evaluate one hop
+        # level at a time, fetching that level's order books concurrently, and
+        # skip longer routes once a good-enough path has been found.
+        book_cache = self.market_cache
+        slippage_memo: Dict[Tuple[str, str, float, float], float] = {}
         paths = []
+        for _, level in groupby(candidate_paths, key=len):
+            level_paths = list(level)
+            await self._prefetch_books(level_paths, book_cache)
 
-        # Find paths to each target currency
-        for target in target_currencies:
-            if target not in self.market_graph:
-                continue
+            for path in level_paths:
+                evaluated_path = self._evaluate_path_sync(
+                    path, amount, book_cache, slippage_memo
+                )
+                if evaluated_path:
+                    paths.append(evaluated_path)
 
-            try:
-                # Find multiple shortest paths
-                all_paths = list(
-                    nx.all_shortest_paths(self.market_graph, from_currency, target)
-                )[: self.max_paths_to_evaluate]
-
-                # Also find paths through preferred intermediaries
-                for intermediary in self.preferred_intermediaries:
-                    if (
-                        intermediary in self.market_graph
-                        and intermediary != from_currency
-                    ):
-                        try:
-                            path1 = nx.shortest_path(
-                                self.market_graph, from_currency, intermediary
-                            )
-                            path2 = nx.shortest_path(
-                                self.market_graph, intermediary, target
-                            )
-                            combined_path = (
-                                path1 + path2[1:]
-                            )  # Avoid duplicating intermediary
-                            if len(combined_path) <= self.max_hops + 1:
-                                all_paths.append(combined_path)
-                        except nx.NetworkXNoPath:
-                            continue
-
-                # Evaluate each path
-                for path in all_paths:
-                    if len(path) - 1 > self.max_hops:
-                        continue
-
-                    evaluated_path = await self.evaluate_path(path, amount)
-                    if evaluated_path:
-                        paths.append(evaluated_path)
-
-            except nx.NetworkXNoPath:
-                logger.debug(f"No path found from {from_currency} to {target}")
-                continue
+            if any(self._is_good_enough(p) for p in paths):
+                logger.debug(
+                    f"Good-enough liquidation path found within "
+                    f"{len(level_paths[0]) - 1} hops, skipping longer routes"
+                )
+                break
 
         # Sort paths by combined score
         paths.sort(key=lambda p: self.score_path(p), reverse=True)
 
         return paths[: self.max_paths_to_evaluate]
 
+    def _hops_to_targets(self, targets: Set[str], cutoff: int) -> Dict[str, int]:
+        """Hop distance from every currency to its nearest target
+
+        One multi-source BFS outward from ``targets``, stopping at ``cutoff``
+        hops. Every market is inserted in both directions, so walking the
+        forward adjacency gives the same distances as the reversed graph.
+        """
+        distances = {target: 0 for target in targets}
+        frontier = list(targets)
+
+        for hops in range(1, cutoff + 1):
+            next_frontier = []
+            for node in frontier:
+                for to_curr, _, _, _ in self._adj.get(node, ()):
+                    if to_curr not in distances:
+                        distances[to_curr] = hops
+                        next_frontier.append(to_curr)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return distances
+
+    def _prescore(
+        self, path: List[str], now: Optional[float] = None
+    ) -> Tuple[int, float]:
+        """Cheap static ranking key for a candidate path, lower is better
+
+        Orders by hop count, then by the summed taker fees plus the spread of
+        any hop whose order book is already cached, all in basis points.
+        """
+        cost_bps = 0.0
+        for from_curr, to_curr in zip(path, path[1:]):
+            _, symbol, _, fees = self._edge_index[(from_curr, to_curr)]
+            cost_bps += fees * 10000
+
+            entry = self._cached_book(self.market_cache, symbol, 1, now)
+            if entry is not None:
+                bids, asks = entry[1]["bids"], entry[1]["asks"]
+                if len(bids) and len(asks):
+                    mid = (bids[0, 0] + asks[0, 0]) / 2
+                    cost_bps += float(asks[0, 0] - bids[0, 0]) / mid * 10000
+
+        return len(path) - 1, cost_bps
+
+    def _enumerate_paths(
+        self, source: str, targets: Set[str], max_hops: int
+    ) -> Iterator[List[str]]:
+        """Enumerate simple paths from ``source`` to any of ``targets``
+
+        A single depth-limited BFS serves every target, so paths come out in
+        order of hop count. Branches that cannot reach a target within the
+        remaining hop budget are pruned using ``_hops_to_targets``. Preferred
+        intermediaries are expanded first at each level, and the number of
+        yielded paths is capped at ``max_paths_to_evaluate`` per target.
+        """
+        if source not in self._adj or not targets:
+            return
+
+        distances = self._hops_to_targets(targets, max_hops)
+        if source not in distances:
+            return
+
+        max_yields = self.max_paths_to_evaluate * len(targets)
+        preferred = {c: i for i, c in enumerate(self.preferred_intermediaries)}
+        yielded = 0
+        queue = deque([(source, (source,))])
+
+        while queue:
+            node, path = queue.popleft()
+            if node in targets and len(path) > 1:
+                yield list(path)
+                yielded += 1
+                if yielded >= max_yields:
+                    return
+                continue
+
+            # Hops still available after stepping to a child
+            remaining = max_hops - len(path)
+            if remaining < 0:
+                continue
+
+            children = sorted(
+                (
+                    edge[0]
+                    for edge in self._adj[node]
+                    if distances.get(edge[0], remaining + 1) <= remaining
+                ),
+                key=lambda c: preferred.get(c, len(preferred)),
+            )
+            for child in children:
+                if child not in path:
+                    queue.append((child, path + (child,)))
+
     async def evaluate_path(
-        self, path: List[str], initial_amount: float
+        self,
+        path: List[str],
+        initial_amount: float,
+        book_cache: Optional[BookCache] = None,
     ) -> Optional[LiquidationPath]:
         """Evaluate a specific path for viability and expected outcome"""
+        if book_cache is None:
+            book_cache = self.market_cache
+        await self._prefetch_books([path], book_cache)
+        return self._evaluate_path_sync(path, initial_amount, book_cache)
+
+    def _evaluate_path_sync(
+        self,
+        path: List[str],
+        initial_amount: float,
+        book_cache: BookCache,
+        slippage_memo: Optional[Dict[Tuple[str, str, float, float], float]] = None,
+    ) -> Optional[LiquidationPath]:
+        """Evaluate a path against already-fetched order books
+
+        ``slippage_memo`` caches per-hop slippage by symbol, side, amount
+        rounded to three significant figures and book fetch time, so paths
+        sharing an edge reuse the estimate until that book is refreshed.
+        """
 
         if len(path) < 2:
             return None
@@ -391,20 +793,34 @@ class EnhancedFailureRecoveryManager:
             to_curr = path[i + 1]
 
             # Find the market
-            edge_data = self.market_graph.get_edge_data(from_curr, to_curr)
-            if not edge_data:
+            edge = self._edge_index.get((from_curr, to_curr))
+            if not edge:
                 return None
 
-            symbol = edge_data["symbol"]
-            side = edge_data["side"]
+            _, symbol, side, fees = edge
 
             # Calculate slippage
-            slippage = await self.calculate_slippage(symbol, side, current_amount)
+            cached = book_cache.get(symbol)
+            if cached is None:
+                return None  # Order book unavailable
+            try:
+                if slippage_memo is None:
+                    slippage = self._slippage_from_book(cached[1], side, current_amount)
+                else:
+                    bucket = _bucket_amount(current_amount)
+                    key = (symbol, side, bucket, cached[0])
+                    slippage = slippage_memo.get(key)
+                    if slippage is None:
+                        slippage = self._slippage_from_book(cached[1], side, bucket)
+                        slippage_memo[key] = slippage
+            except Exception as e:
+                logger.error(f"Failed to calculate slippage for {symbol}: {e}")
+                return None
             if slippage > self.max_single_hop_slippage_bps:
                 return None  # Path not viable
 
             # Estimate output
-            fee_bps = edge_data.get("fees", 0.001) * 10000
+            fee_bps = fees * 10000
             effective_slippage = slippage + fee_bps
             output_amount = current_amount * (1 - effective_slippage / 10000)
 
@@ -441,6 +857,14 @@ class EnhancedFailureRecoveryManager:
             risk_score=risk_score,
         )
 
+    def _is_good_enough(self, path: LiquidationPath) -> bool:
+        """Whether a path is good enough to stop searching for alternatives"""
+        return (
+            path.estimated_slippage
+            <= self.early_exit_slippage_ratio * self.max_total_slippage_bps
+            and path.confidence_score >= self.early_exit_min_confidence
+        )
+
     def score_path(self, path: LiquidationPath) -> float:
         """Score a path based on multiple factors"""
 
@@ -554,21 +978,22 @@ class EnhancedFailureRecoveryManager:
                 execution_steps.extend(steps)
 
                 if success:
+                    actual_slippage = self.calculate_actual_slippage(
+                        amount, final_amount
+                    )
                     logger.info(
                         f"Successfully liquidated to {final_currency}: "
                         f"{final_amount:.8f} "
-                        f"(actual slippage: {self.calculate_actual_slippage(amount, final_amount):.1f} bps)"
+                        f"(actual slippage: {actual_slippage:.1f} bps)"
                     )
 
                     # Record successful path
-                    self.execution_history.append(
+                    self._record_execution(
                         {
                             "timestamp": time.time(),
                             "path": path.path,
                             "success": True,
-                            "slippage": self.calculate_actual_slippage(
-                                amount, final_amount
-                            ),
+                            "slippage": actual_slippage,
                         }
                     )
 
@@ -702,16 +1127,45 @@ class EnhancedFailureRecoveryManager:
 
     async def blacklist_market(self, symbol: str, duration_seconds: int = 300):
         """Temporarily blacklist a problematic market"""
+        expiry = time.monotonic() + duration_seconds
         self.blacklisted_markets.add(symbol)
+        self._blacklist_expiry[symbol] = max(
+            expiry, self._blacklist_expiry.get(symbol, expiry)
+        )
+        heapq.heappush(self._blacklist_heap, (expiry, symbol))
         logger.warning(f"Blacklisted market {symbol} for {duration_seconds} seconds")
 
-        # Schedule removal
-        async def remove_blacklist():
-            await asyncio.sleep(duration_seconds)
-            self.blacklisted_markets.discard(symbol)
-            logger.info(f"Removed {symbol} from blacklist")
-
-        asyncio.create_task(remove_blacklist())
+        # Schedule removal on the shared reaper, waking it if it is sleeping
+        if self._reaper_task is None or self._reaper_task.done():
+            self._blacklist_wakeup = asyncio.Event()
+            self._reaper_task = asyncio.create_task(self._blacklist_reaper())
+        else:
+            self._blacklist_wakeup.set()
+
+    async def _blacklist_reaper(self):
+        """Remove blacklist entries as they expire, exiting once none remain"""
+        heap = self._blacklist_heap
+
+        while heap:
+            now = time.monotonic()
+            while heap and heap[0][0] <= now:
+                expiry, symbol = heapq.heappop(heap)
+                # A later blacklist call may have extended this entry
+                if self._blacklist_expiry.get(symbol) == expiry:
+                    del self._blacklist_expiry[symbol]
+                    self.blacklisted_markets.discard(symbol)
+                    logger.info(f"Removed {symbol} from blacklist")
+
+            if not heap:
+                break
+
+            self._blacklist_wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._blacklist_wakeup.wait(), timeout=heap[0][0] - now
+                )
+            except asyncio.TimeoutError:
+                pass
 
     def get_execution_statistics(self) -> Dict[str, Any]:
         """Get statistics about recent panic sell executions"""
@@ -741,16 +1195,23 @@ class EnhancedFailureRecoveryManager:
 
         return stats
 
+    def _record_execution(self, execution: Dict[str, Any]):
+        """Append to the execution history, keeping path counts in sync"""
+        history = self.execution_history
+        if history.maxlen is not None and len(history) == history.maxlen:
+            evicted = history[0]
+            if evicted.get("success"):
+                path_tuple = tuple(evicted["path"])
+                self._path_counter[path_tuple] -= 1
+                if self._path_counter[path_tuple] <= 0:
+                    del self._path_counter[path_tuple]
+
+        history.append(execution)
+        if execution.get("success"):
+            self._path_counter[tuple(execution["path"])] += 1
+
     def _get_most_used_paths(self) -> List[Tuple[List[str], int]]:
         """Get the most frequently used successful paths"""
-        path_counts = defaultdict(int)
-
-        for execution in self.execution_history:
-            if execution.get("success"):
-                path_tuple = tuple(execution["path"])
-                path_counts[path_tuple] += 1
-
-        # Sort by frequency
-        sorted_paths = sorted(path_counts.items(), key=lambda x: x[1], reverse=True)
-
-        return [(list(path), count) for path, count in sorted_paths[:5]]
+        return [
+            (list(path), count) for path, count in self._path_counter.most_common(5)
+        ]
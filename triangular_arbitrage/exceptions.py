@@ -11,26 +11,42 @@ from typing import Optional, Dict, Any
 class TriangularArbitrageError(Exception):
     """Base exception for all triangular arbitrage related errors."""
 
+    # Attributes live in slots so raising does not allocate an instance dict
+    __slots__ = ("details",)
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.details = details or {}
 
+    def __reduce__(self):
+        # BaseException only pickles __dict__, so carry slot values explicitly
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        state.update(self.__dict__)
+        return type(self), self.args, state
+
 
 class ConfigurationError(TriangularArbitrageError):
     """Raised when there are configuration-related issues."""
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(TriangularArbitrageError):
     """Raised when validation of data or configuration fails."""
 
-    pass
+    __slots__ = ()
 
 
 class ExchangeError(TriangularArbitrageError):
     """Raised when exchange operations fail."""
 
+    __slots__ = ("exchange", "symbol")
+
     def __init__(
         self,
         message: str,
@@ -46,6 +62,8 @@ class ExchangeError(TriangularArbitrageError):
 class ExecutionError(TriangularArbitrageError):
     """Raised when trade execution fails."""
 
+    __slots__ = ("strategy", "cycle_id")
+
     def __init__(
         self,
         message: str,
@@ -61,6 +79,8 @@ class ExecutionError(TriangularArbitrageError):
 class ReconciliationError(TriangularArbitrageError):
     """Raised when reconciliation of trades or positions fails."""
 
+    __slots__ = ("expected", "actual")
+
     def __init__(
         self,
         message: str,
@@ -76,6 +96,8 @@ class ReconciliationError(TriangularArbitrageError):
 class RiskControlError(TriangularArbitrageError):
     """Raised when risk control violations occur."""
 
+    __slots__ = ("risk_type", "limit", "current")
+
     def __init__(
         self,
         message: str,
@@ -93,6 +115,8 @@ class RiskControlError(TriangularArbitrageError):
 class DataError(TriangularArbitrageError):
     """Raised when data processing or market data issues occur."""
 
+    __slots__ = ("source", "symbol")
+
     def __init__(
         self,
         message: str,
@@ -108,6 +132,8 @@ class DataError(TriangularArbitrageError):
 class NetworkError(TriangularArbitrageError):
     """Raised when network or connectivity issues occur."""
 
+    __slots__ = ("endpoint", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -1,51 +1,135 @@
 # triangular_arbitrage/exchange.py
 """Exchange data fetching utilities using ccxt."""
 
+import asyncio
+import random
+import ssl
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
+
+import aiohttp
+import certifi
 import ccxt.async_support as ccxt
 
+from .exceptions import ExchangeError, ValidationError
+from .utils import get_logger
 
-async def get_exchange_data(exchange_name):
-    """Connect to exchange and fetch latest market tickers."""
-    # --- defensive check ---
-    if not isinstance(exchange_name, str):
-        from .exceptions import ValidationError
+logger = get_logger(__name__)
 
-        raise ValidationError(
-            f"FATAL: The exchange name must be a string "
-            f"(e.g., 'coinbase'), but received type "
-            f"{type(exchange_name).__name__}."
-        )
+# Transient network / rate-limit failures of fetch_tickers are retried with
+# exponential backoff plus jitter before the error reaches the caller.
+TICKER_FETCH_ATTEMPTS = 3
+TICKER_RETRY_BASE_DELAY_SECONDS = 1.0
+TICKER_RETRY_MAX_DELAY_SECONDS = 30.0
 
-    # Dynamically get the exchange class from the ccxt library
-    if not hasattr(ccxt, exchange_name):
-        from .exceptions import ExchangeError
+_VALID_EXCHANGES = frozenset(ccxt.exchanges)
 
-        raise ExchangeError(
-            f"FATAL: The exchange '{exchange_name}' is not supported "
-            f"by the ccxt library.",
-            exchange=exchange_name,
-        )
 
-    exchange_class = getattr(ccxt, exchange_name)
+def create_http_session(
+    ssl_context: Any = None,
+    trust_env: bool = False,
+    limit: int = 100,
+    limit_per_host: int = 20,
+) -> aiohttp.ClientSession:
+    """Create a keep-alive HTTP session for ccxt instances.
+
+    Every session the package hands to ccxt comes from here, so pooling
+    and DNS caching match. ``ssl_context`` and ``trust_env`` should come
+    from the ccxt instance (``ssl_context`` after ``open()``,
+    ``aiohttp_trust_env``); without one, certifi's CA bundle is used as
+    ccxt does by default.
+    """
+    if ssl_context is None:
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_context,
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=75,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, trust_env=trust_env)
 
-    # Instantiate the exchange
-    exchange = exchange_class()
 
+async def _open_exchange(exchange_name: str) -> ccxt.Exchange:
+    """Create an exchange instance with its markets loaded."""
+    exchange_class = getattr(ccxt, exchange_name)
+    exchange = exchange_class({"enableRateLimit": True})
     try:
         # Load all available markets/trading pairs from the exchange
         await exchange.load_markets()
+    except BaseException:
+        await exchange.close()
+        raise
+    return exchange
 
-        # Fetch the latest tickers for all markets
-        tickers = await exchange.fetch_tickers()
-
-        # Get the current time from the exchange server for logging
-        exchange_time = exchange.iso8601(exchange.milliseconds())
 
-        return tickers, exchange_time
+@asynccontextmanager
+async def exchange_session(exchange_name: str) -> AsyncIterator[ccxt.Exchange]:
+    """Open an exchange connection that is closed once on exit.
 
-    except Exception as e:
-        # If something goes wrong, raise the error (finally will close)
-        raise e
+    The connection is closed exactly once whether the block returns,
+    raises or is cancelled.
+    """
+    exchange = await _open_exchange(exchange_name)
+    try:
+        yield exchange
     finally:
-        # Always ensure the connection to the exchange is closed gracefully
         await exchange.close()
+
+
+async def _fetch_tickers_with_retry(
+    exchange: ccxt.Exchange, exchange_name: str
+) -> Dict[str, Any]:
+    """Call fetch_tickers, retrying network and rate-limit errors."""
+    for attempt in range(TICKER_FETCH_ATTEMPTS):
+        try:
+            return await exchange.fetch_tickers()
+        except ccxt.NetworkError as e:
+            # RateLimitExceeded and RequestTimeout are NetworkError subclasses
+            if attempt == TICKER_FETCH_ATTEMPTS - 1:
+                raise
+            delay = (
+                min(
+                    TICKER_RETRY_BASE_DELAY_SECONDS * 2**attempt,
+                    TICKER_RETRY_MAX_DELAY_SECONDS,
+                )
+                + random.random() * TICKER_RETRY_BASE_DELAY_SECONDS
+            )
+            logger.warning(
+                "fetch_tickers on %s failed (%s), retrying in %.2fs",
+                exchange_name,
+                e,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+
+async def get_exchange_data(exchange_name) -> Tuple[Dict[str, Any], str]:
+    """Connect to exchange and fetch latest market tickers.
+
+    The connection is opened for this call and closed before returning.
+    """
+    # --- defensive check ---
+    if not isinstance(exchange_name, str):
+        raise ValidationError(
+            "FATAL: The exchange name must be a string "
+            "(e.g., 'coinbase'), but received type "
+            f"{type(exchange_name).__name__}."
+        )
+
+    # Only real exchange ids are accepted, not other ccxt module attributes
+    if exchange_name not in _VALID_EXCHANGES:
+        raise ExchangeError(
+            f"FATAL: The exchange '{exchange_name}' is not supported "
+            "by the ccxt library.",
+            exchange=exchange_name,
+        )
+
+    async with exchange_session(exchange_name) as exchange:
+        # Fetch the latest tickers for all markets
+        tickers = await _fetch_tickers_with_retry(exchange, exchange_name)
+
+        # Get the current time from the exchange server for logging
+        return tickers, exchange.iso8601(exchange.milliseconds())
@@ -6,32 +6,162 @@ Supports time-based simulation with configurable slippage and fill models.
 """
 
 import asyncio
-import csv
-import random
+import glob
+import hashlib
+import io
+import mmap
+import os
+import re
+import sys
 import time
-import uuid
+from types import MappingProxyType
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 import logging
-# bisect removed - not used in current implementation
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_adapter import (
+    EMPTY_FILLS,
     ExchangeAdapter,
     OrderResult,
     FillInfo,
     MarketData,
     OrderSide,
+    OrderSpec,
     OrderType,
 )
+from ..utils import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# Tick spacing with a coefficient of variation below this is treated as a
+# uniform grid, enabling interpolation search in fetch_ticker
+UNIFORM_SPACING_CV = 0.1
+
+# Uniform draws generated per refill of the scalar random buffer
+RAND_BUFFER_SIZE = 8192
+
+# Columns every backtest CSV row must provide; "volume" is optional
+PRICE_COLUMNS = ("timestamp", "bid", "ask", "last")
+
+# CSVs at least this large are parsed in newline-aligned segments across
+# processes when pyarrow (whose reader is already multi-threaded) is missing
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# Key part of a Parquet cache file name, "<stem>.<sha1 hex>.parquet"
+_CACHE_KEY_RE = re.compile(r"[0-9a-f]{40}")
+
+# Closed orders are archived as rows of this record, indexed by order number
+# (the N in "bt-o-N") minus one; status_code 0 marks an unused row
+ORDER_ARCHIVE_DTYPE = np.dtype(
+    [
+        ("symbol_idx", np.int32),
+        ("side", np.int8),
+        ("status_code", np.int8),
+        ("amount_requested", np.float64),
+        ("amount_filled", np.float64),
+        ("average_price", np.float64),
+        ("total_fee", np.float64),
+        ("timestamp", np.float64),
+    ]
+)
+ORDER_STATUS_CODES = {"filled": 1, "partial": 2, "failed": 3, "cancelled": 4}
+ORDER_STATUS_NAMES = {code: name for name, code in ORDER_STATUS_CODES.items()}
+
+
+def _exec_price_loop(base, amount, side_sign, rand_bps, base_bps, coef, max_bps):
+    """Execution prices and slippage (bps) for a batch of orders"""
+    n = base.size
+    exec_price = np.empty(n)
+    slippage_bps = np.empty(n)
+    for i in range(n):
+        size_impact = min(amount[i] * base[i] / 1000.0 * coef, max_bps)
+        slippage = base_bps + size_impact + rand_bps[i]
+        slippage_bps[i] = slippage
+        exec_price[i] = max(base[i] * (1.0 + side_sign[i] * slippage / 10000.0), 0.0)
+    return exec_price, slippage_bps
+
+
+def _exec_price_numpy(base, amount, side_sign, rand_bps, base_bps, coef, max_bps):
+    """Vectorised equivalent of ``_exec_price_loop``"""
+    size_impact = np.minimum(amount * base / 1000.0 * coef, max_bps)
+    slippage_bps = base_bps + size_impact + rand_bps
+    exec_price = np.maximum(base * (1 + side_sign * slippage_bps / 10000.0), 0.0)
+    return exec_price, slippage_bps
+
+
+# Compiled loop when numba is installed, otherwise the NumPy version
+if NUMBA_AVAILABLE:
+    _exec_price_kernel = njit(cache=True, fastmath=True)(_exec_price_loop)
+else:
+    _exec_price_kernel = _exec_price_numpy
+
+
+def _parse_csv_segment(path: str, start: int, end: int) -> pd.DataFrame:
+    """Parse bytes [start, end) of a CSV whose header is its first line"""
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        header = mm[: mm.find(b"\n") + 1]
+        return pd.read_csv(io.BytesIO(header + mm[start:end]), dtype={"symbol": str})
+
+
+def _read_csv_parallel(path: Path, workers: int) -> pd.DataFrame:
+    """Read a CSV in ``workers`` newline-aligned segments, in file order"""
+    with open(path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        size = len(mm)
+        bounds = [mm.find(b"\n") + 1]
+        for i in range(1, workers):
+            cut = mm.find(b"\n", max(size * i // workers, bounds[-1])) + 1
+            if cut <= 0:
+                break
+            bounds.append(cut)
+    bounds.append(size)
+    segments = [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo]
+
+    with ProcessPoolExecutor(max_workers=len(segments)) as pool:
+        frames = list(
+            pool.map(
+                _parse_csv_segment,
+                [str(path)] * len(segments),
+                [lo for lo, _ in segments],
+                [hi for _, hi in segments],
+            )
+        )
+    return pd.concat(frames, ignore_index=True)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BacktestTick:
-    """Single market data point"""
+    """Single market data point
+
+    Market data is held column-wise; this record is kept for callers that
+    want a row view of a tick.
+    """
 
     timestamp: float
     symbol: str
@@ -51,7 +181,7 @@ class BacktestTick:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BacktestOrderState:
     """Internal state for backtest orders"""
 
@@ -62,6 +192,9 @@ class BacktestOrderState:
     amount_requested: float
     limit_price: Optional[float] = None
     amount_filled: float = 0.0
+    # Running totals over fills
+    total_fee: float = 0.0
+    notional_sum: float = 0.0
     fills: List[FillInfo] = field(default_factory=list)
     timestamp: float = field(default_factory=time.time)
     status: str = "pending"
@@ -89,7 +222,13 @@ class BacktestExchange(ExchangeAdapter):
                 - data_file: Path to CSV data file
                 - start_time: Start timestamp for backtest
                 - end_time: End timestamp for backtest
-                - time_acceleration: Speed multiplier (default: 1.0)
+                - time_acceleration: Playback speed multiplier (default: 1.0)
+                - realtime_playback: Sleep through simulated delays at
+                  time_acceleration speed (default: False, run flat out)
+                - retain_orders: Keep finished orders queryable through
+                  fetch_order_status (default: True)
+                - data_cache: Cache the parsed data as Parquet beside the
+                  CSV (default: True, requires pyarrow)
                 - random_seed: Random seed for deterministic results
                 - slippage_model: Slippage parameters
                 - market_impact_model: Market impact parameters
@@ -101,20 +240,64 @@ class BacktestExchange(ExchangeAdapter):
         self.start_time = config.get("start_time")
         self.end_time = config.get("end_time")
         self.time_acceleration = config.get("time_acceleration", 1.0)
+        self.realtime_playback = (
+            config.get("realtime_playback", False) and self.time_acceleration > 0
+        )
+        # Simulated seconds not yet slept off under realtime playback
+        self._playback_delay = 0.0
+        self.data_cache = config.get("data_cache", True) and PYARROW_AVAILABLE
 
         # Market data storage
-        self._market_data: Dict[str, List[BacktestTick]] = {}
-        self._market_indices: Dict[str, int] = {}
+        # Structure-of-arrays market data: symbol -> column name -> float64
+        # array ("ts", "bid", "ask", "last", "volume"), sorted by timestamp
+        self._cols: Dict[str, Dict[str, np.ndarray]] = {}
+        # Sorted tick timestamps per symbol, searched with bisect
+        self._ts: Dict[str, array] = {}
+        # Index of the last tick served per symbol; simulation time only
+        # moves forward, so lookups resume from here
+        self._last_idx: Dict[str, int] = {}
+        # (first timestamp, mean spacing) for evenly sampled symbols, whose
+        # tick index can be estimated directly instead of bisected
+        self._uniform: Dict[str, tuple] = {}
+        # Last MarketData served per symbol, with the row it was built from
+        self._last_md: Dict[str, Tuple[int, MarketData]] = {}
+        # (base, quote) currencies per symbol, split once at load time
+        self._sym_parts: Dict[str, Tuple[str, str]] = {}
+        # Symbol numbering shared by the timeline and the order archive
+        self._symbols: List[str] = []
+        self._symbol_idx: Dict[str, int] = {}
+        # Every tick of every symbol merged in time order: timestamp, symbol
+        # number and row in that symbol's columns. _cursor counts the ticks
+        # at or before current time; _latest_row holds, per symbol number,
+        # the last of its rows the cursor has passed (-1 before the first)
+        self._global_ts = np.empty(0)
+        self._global_sym_idx = np.empty(0, dtype=np.int32)
+        self._global_row = np.empty(0, dtype=np.int64)
+        self._cursor = 0
+        self._latest_row = np.empty(0, dtype=np.int64)
         self._current_time = 0.0
         self._simulation_start = time.time()
         self._data_loaded = False
 
-        # Order management
+        # Order management; only orders that can still change live here
         self._orders: Dict[str, BacktestOrderState] = {}
+        # Finished orders, see ORDER_ARCHIVE_DTYPE; with retain_orders off
+        # they are dropped and only metrics and balances remember them
+        self._retain_orders = config.get("retain_orders", True)
+        self._closed_orders_np = np.zeros(1024, dtype=ORDER_ARCHIVE_DTYPE)
+        self._closed_errors: Dict[int, str] = {}
+        # Sequential order / fill ids, deterministic across runs
+        self._oid_ctr = 0
+        self._fid_ctr = 0
         self._balances = config.get("initial_balances", {})
+        self._balances_view = MappingProxyType(self._balances)
 
         # Randomness for deterministic testing
-        self.rng = random.Random(config.get("random_seed", 42))
+        self.random_seed = config.get("random_seed", 42)
+        self._np_rng = np.random.default_rng(self.random_seed)
+        # Scalar draws are served from a pre-generated buffer
+        self._rand_buf = self._np_rng.random(RAND_BUFFER_SIZE).tolist()
+        self._rand_i = 0
 
         # Models
         self.slippage_model = config.get(
@@ -126,6 +309,16 @@ class BacktestExchange(ExchangeAdapter):
                 "random_component_bps": 2,
             },
         )
+        # Slippage parameters read on every order, hoisted out of the dict
+        self._slip_base = float(self.slippage_model["base_slippage_bps"])
+        self._slip_coef = float(self.slippage_model["size_impact_coefficient"])
+        self._slip_max = float(self.slippage_model["max_slippage_bps"])
+        self._slip_rand = float(self.slippage_model["random_component_bps"])
+
+        # Fee rates only vary by order type
+        fees = self.config.get("fees", {})
+        self._taker_rate = fees.get("taker_bps", 30) / 10000.0
+        self._maker_rate = fees.get("maker_bps", 10) / 10000.0
 
         self.fill_model = config.get(
             "fill_model",
@@ -161,7 +354,7 @@ class BacktestExchange(ExchangeAdapter):
         self._setup_simulation_time()
         self.metrics["simulation_start_time"] = self._current_time
         logger.info(
-            f"BacktestExchange initialized with {len(self._market_data)} symbols"
+            f"BacktestExchange initialized with {len(self._cols)} symbols"
         )
 
     async def _load_market_data(self) -> None:
@@ -171,59 +364,210 @@ class BacktestExchange(ExchangeAdapter):
             from ..exceptions import DataError
             raise DataError(f"Backtest data file not found: {self.data_file}", source="file_system")
 
-        logger.info(f"Loading backtest data from {self.data_file}")
-
-        with open(data_path, "r") as f:
-            reader = csv.DictReader(f)
-            row_count = 0
-
-            for row in reader:
-                try:
-                    tick = BacktestTick(
-                        timestamp=float(row["timestamp"]),
-                        symbol=row["symbol"],
-                        bid=float(row["bid"]),
-                        ask=float(row["ask"]),
-                        last=float(row["last"]),
-                        volume=float(row.get("volume", 0)),
-                    )
-
-                    # Filter by time range if specified
-                    if self.start_time and tick.timestamp < self.start_time:
-                        continue
-                    if self.end_time and tick.timestamp > self.end_time:
-                        continue
-
-                    if tick.symbol not in self._market_data:
-                        self._market_data[tick.symbol] = []
-                        self._market_indices[tick.symbol] = 0
-
-                    self._market_data[tick.symbol].append(tick)
-                    row_count += 1
-
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping invalid data row: {row} - {e}")
-
-        # Sort data by timestamp for each symbol
-        for symbol in self._market_data:
-            self._market_data[symbol].sort(key=lambda x: x.timestamp)
-
+        cache_path = self._cache_path(data_path) if self.data_cache else None
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Loading cached backtest data from {cache_path}")
+            df = pq.read_table(cache_path, memory_map=True).to_pandas()
+        else:
+            logger.info(f"Loading backtest data from {self.data_file}")
+            df = self._parse_csv(data_path)
+            if cache_path is not None:
+                self._write_cache(df, cache_path)
+
+        # Split into per-symbol contiguous float64 columns sorted by timestamp
+        loaded = 0
+        for symbol, group in df.groupby("symbol", sort=False):
+            group = group.sort_values("timestamp", kind="mergesort")
+            timestamps = group["timestamp"].to_numpy(dtype=np.float64)
+
+            # Time range filter as one slice of the sorted columns
+            lo = (
+                int(np.searchsorted(timestamps, self.start_time, "left"))
+                if self.start_time
+                else 0
+            )
+            hi = (
+                int(np.searchsorted(timestamps, self.end_time, "right"))
+                if self.end_time
+                else len(timestamps)
+            )
+            if lo >= hi:
+                continue
+            timestamps = timestamps[lo:hi]
+            loaded += hi - lo
+
+            symbol = sys.intern(symbol)
+            base, quote = symbol.split("/")
+            self._sym_parts[symbol] = (sys.intern(base), sys.intern(quote))
+            self._ts[symbol] = array("d", timestamps.tobytes())
+            self._cols[symbol] = {
+                # Shares memory with the bisect array
+                "ts": np.frombuffer(self._ts[symbol], dtype=np.float64),
+                "bid": group["bid"].to_numpy(dtype=np.float64)[lo:hi],
+                "ask": group["ask"].to_numpy(dtype=np.float64)[lo:hi],
+                "last": group["last"].to_numpy(dtype=np.float64)[lo:hi],
+                "volume": group["volume"].to_numpy(dtype=np.float64)[lo:hi],
+            }
+            self._last_idx[symbol] = 0
+            if len(timestamps) >= 3:
+                deltas = np.diff(timestamps)
+                dt_mean = float(deltas.mean())
+                if dt_mean > 0 and float(deltas.std()) / dt_mean < UNIFORM_SPACING_CV:
+                    self._uniform[symbol] = (float(timestamps[0]), dt_mean)
+
+        self._build_timeline()
         logger.info(
-            f"Loaded {row_count} market data points for {len(self._market_data)} symbols"
+            f"Loaded {loaded} market data points for {len(self._cols)} symbols"
         )
         self._data_loaded = True
 
+    def _symbol_number(self, symbol: str) -> int:
+        """Stable small-integer id for a symbol, assigned on first use"""
+        number = self._symbol_idx.get(symbol)
+        if number is None:
+            number = len(self._symbols)
+            self._symbols.append(sys.intern(symbol))
+            self._symbol_idx[symbol] = number
+        return number
+
+    def _build_timeline(self) -> None:
+        """Merge all symbols' ticks into one time-ordered timeline"""
+        numbers = [self._symbol_number(symbol) for symbol in self._cols]
+        lengths = [len(columns["ts"]) for columns in self._cols.values()]
+        if not lengths:
+            return
+        global_ts = np.concatenate([columns["ts"] for columns in self._cols.values()])
+        # Stable, so each symbol's rows keep their (sorted) column order
+        order = np.argsort(global_ts, kind="stable")
+        self._global_ts = global_ts[order]
+        self._global_sym_idx = np.repeat(
+            np.array(numbers, dtype=np.int32), lengths
+        )[order]
+        self._global_row = np.concatenate(
+            [np.arange(n, dtype=np.int64) for n in lengths]
+        )[order]
+        self._cursor = 0
+        self._latest_row = np.full(len(self._symbols), -1, dtype=np.int64)
+
+    def _advance_cursor(self) -> None:
+        """Move the timeline cursor up to current time, recording for each
+        symbol the last row passed"""
+        end = int(
+            np.searchsorted(self._global_ts, self._current_time, "right")
+        )
+        start = self._cursor
+        if end > start:
+            # Rows only increase along the timeline, so the maximum per
+            # symbol is its most recent tick
+            np.maximum.at(
+                self._latest_row,
+                self._global_sym_idx[start:end],
+                self._global_row[start:end],
+            )
+            self._cursor = end
+
+    def fetch_ticker_fast(self, symbol: str) -> MarketData:
+        """Synchronous fetch_ticker for strictly forward, chronological replay
+
+        Reads the symbol's latest tick off the shared timeline cursor instead
+        of searching its columns. Like fetch_ticker, the first tick is served
+        before the symbol has traded.
+        """
+        number = self._symbol_idx.get(symbol)
+        columns = self._cols.get(symbol)
+        if number is None or columns is None:
+            raise ValueError(f"No market data available for {symbol}")
+        self._advance_cursor()
+        row = max(int(self._latest_row[number]), 0)
+        return self._market_data_at(symbol, columns, row)
+
+    def _parse_csv(self, data_path: Path) -> pd.DataFrame:
+        """Parse the CSV into a validated DataFrame"""
+        workers = os.cpu_count() or 1
+        if (
+            not PYARROW_AVAILABLE
+            and workers > 1
+            and data_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES
+        ):
+            df = _read_csv_parallel(data_path, workers)
+        else:
+            df = pd.read_csv(
+                data_path,
+                dtype={"symbol": str},
+                engine="pyarrow" if PYARROW_AVAILABLE else "c",
+            )
+
+        numeric = list(PRICE_COLUMNS) + ["volume"]
+        missing = [c for c in ("symbol",) + PRICE_COLUMNS if c not in df.columns]
+        if missing:
+            logger.warning(f"Backtest data is missing columns {missing}; no rows loaded")
+            return pd.DataFrame(columns=["symbol"] + numeric)
+
+        if "volume" not in df.columns:
+            df["volume"] = 0.0
+        df[numeric] = df[numeric].apply(pd.to_numeric, errors="coerce")
+
+        valid = df[numeric].notna().all(axis=1) & df["symbol"].notna()
+        skipped = int((~valid).sum())
+        if skipped:
+            logger.warning(f"Skipping {skipped} invalid data rows")
+        return df.loc[valid, ["symbol"] + numeric]
+
+    def _cache_path(self, data_path: Path) -> Path:
+        """Parquet cache file for this CSV, keyed by its path and mtime
+
+        The cache holds every valid row; the time range is applied after
+        loading, so backtests over different windows share one cache.
+        """
+        key = hashlib.sha1(
+            (str(data_path.resolve()) + str(os.path.getmtime(data_path))).encode()
+        ).hexdigest()
+        return data_path.with_suffix(f".{key}.parquet")
+
+    def _write_cache(self, df: pd.DataFrame, cache_path: Path) -> None:
+        """Write parsed data to the Parquet cache; failures only cost the speedup"""
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Could not write backtest data cache {cache_path}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        else:
+            self._remove_stale_caches(cache_path)
+
+    @staticmethod
+    def _remove_stale_caches(cache_path: Path) -> None:
+        """Delete caches of earlier versions of the same CSV
+
+        Only ``<stem>.<sha1>.parquet`` siblings are touched, so caches of
+        other files that share the prefix (e.g. ``feed.v2.csv``) are kept.
+        """
+        stem = cache_path.name[: -len(".parquet")].rsplit(".", 1)[0]
+        for path in cache_path.parent.glob(glob.escape(stem) + ".*.parquet"):
+            key = path.name[len(stem) + 1 : -len(".parquet")]
+            if path == cache_path or not _CACHE_KEY_RE.fullmatch(key):
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove stale data cache {path}: {e}")
+
     def _setup_simulation_time(self) -> None:
         """Set up simulation time based on data"""
-        if not self._market_data:
+        if not self._cols:
             from ..exceptions import DataError
             raise DataError("No market data loaded", source="backtest_engine")
 
         # Find earliest timestamp across all symbols
         earliest_times = []
-        for symbol_data in self._market_data.values():
-            if symbol_data:
-                earliest_times.append(symbol_data[0].timestamp)
+        for columns in self._cols.values():
+            if len(columns["ts"]):
+                earliest_times.append(float(columns["ts"][0]))
 
         if earliest_times:
             self._current_time = min(earliest_times)
@@ -234,8 +578,8 @@ class BacktestExchange(ExchangeAdapter):
     async def load_markets(self) -> Dict[str, Dict]:
         """Return simulated market info"""
         if not self._markets:
-            for symbol in self._market_data.keys():
-                base, quote = symbol.split("/")
+            for symbol in self._cols.keys():
+                base, quote = self._sym_parts[symbol]
                 self._markets[symbol] = {
                     "id": symbol,
                     "symbol": symbol,
@@ -251,80 +595,195 @@ class BacktestExchange(ExchangeAdapter):
 
     async def fetch_ticker(self, symbol: str) -> MarketData:
         """Fetch current market data for symbol at current simulation time"""
-        if symbol not in self._market_data:
+        return self._fetch_ticker_sync(symbol)
+
+    def _fetch_ticker_sync(self, symbol: str) -> MarketData:
+        """fetch_ticker without the coroutine, for the order simulation path"""
+        columns = self._cols.get(symbol)
+        if columns is None:
             raise ValueError(f"No market data available for {symbol}")
 
-        symbol_data = self._market_data[symbol]
-        current_index = self._market_indices[symbol]
+        hint = self._last_idx[symbol]
 
-        # Find the most recent tick at or before current time
-        while (
-            current_index < len(symbol_data) - 1
-            and symbol_data[current_index + 1].timestamp <= self._current_time
-        ):
-            current_index += 1
+        # Find the most recent tick at or before current time, searching
+        # only the ticks after the one served last
+        current_index = self._find_tick_index(symbol, hint)
+        if current_index < hint:
+            current_index = hint
 
-        self._market_indices[symbol] = current_index
+        self._last_idx[symbol] = current_index
 
-        if current_index >= len(symbol_data):
+        if current_index >= len(columns["ts"]):
             from ..exceptions import DataError
             raise DataError(
                 f"No market data available for {symbol} at time {self._current_time}",
                 symbol=symbol, source="backtest_engine"
             )
 
-        tick = symbol_data[current_index]
-        return tick.to_market_data()
+        return self._market_data_at(symbol, columns, current_index)
+
+    def _market_data_at(
+        self, symbol: str, columns: Dict[str, np.ndarray], row: int
+    ) -> MarketData:
+        """MarketData for one row of a symbol's columns
+
+        Repeated reads of the same tick return the same (frozen) instance.
+        """
+        cached = self._last_md.get(symbol)
+        if cached is not None and cached[0] == row:
+            return cached[1]
+        market_data = MarketData(
+            symbol=symbol,
+            bid=float(columns["bid"][row]),
+            ask=float(columns["ask"][row]),
+            last=float(columns["last"][row]),
+            volume=float(columns["volume"][row]),
+            timestamp=float(columns["ts"][row]),
+        )
+        self._last_md[symbol] = (row, market_data)
+        return market_data
+
+    def _find_tick_index(self, symbol: str, hint: int) -> int:
+        """Index of the last tick at or before current time (>= hint - 1)"""
+        timestamps = self._ts[symbol]
+        now = self._current_time
+        uniform = self._uniform.get(symbol)
+
+        if uniform is not None:
+            # Interpolation probe: on an even grid the tick index follows
+            # from the elapsed time; confirm it within a small window
+            t0, dt = uniform
+            n = len(timestamps)
+            guess = min(max(int((now - t0) / dt), hint), n - 1)
+            lo = max(guess - 2, hint)
+            hi = min(guess + 3, n)
+            if (lo == hint or timestamps[lo] <= now) and (
+                hi == n or timestamps[hi] > now
+            ):
+                return bisect_right(timestamps, now, lo, hi) - 1
+
+        return bisect_right(timestamps, now, hint) - 1
 
     async def fetch_balance(self) -> Dict[str, float]:
-        """Return simulated balances"""
+        """Return a snapshot copy of simulated balances"""
         return self._balances.copy()
 
+    @property
+    def balances(self) -> Mapping[str, float]:
+        """Read-only live view of simulated balances, without the copy"""
+        return self._balances_view
+
     async def create_market_order(
         self, symbol: str, side: OrderSide, amount: float
     ) -> OrderResult:
         """Create and simulate market order execution"""
-        order_id = str(uuid.uuid4())
+        results = await self.create_market_orders_batch([(symbol, side, amount)])
+        return results[0]
 
-        order_state = BacktestOrderState(
-            order_id=order_id,
-            symbol=symbol,
-            side=side,
-            order_type=OrderType.MARKET,
-            amount_requested=amount,
-            timestamp=self._current_time,
-        )
+    async def create_market_orders_batch(
+        self, specs: Sequence[Tuple[str, OrderSide, float]]
+    ) -> List[OrderResult]:
+        """
+        Create and simulate several market orders at the current simulation time
 
-        self._orders[order_id] = order_state
-        self.metrics["orders_created"] += 1
+        Fill decisions and slippage for the whole batch are computed as numpy
+        arrays; only fill bookkeeping runs per order.
 
-        try:
-            market_data = await self.fetch_ticker(symbol)
-            return await self._simulate_order_execution(order_state, market_data)
+        Args:
+            specs: (symbol, side, amount) for each order
 
-        except Exception as e:
-            order_state.status = "failed"
-            order_state.error_message = str(e)
-            self.metrics["orders_failed"] += 1
+        Returns:
+            One OrderResult per spec, in the same order
+        """
+        results: List[Optional[OrderResult]] = [None] * len(specs)
+        priced = []  # (result index, order state, base price)
 
-            return OrderResult(
-                order_id=order_id,
+        for i, (symbol, side, amount) in enumerate(specs):
+            order_state = BacktestOrderState(
+                order_id=self._next_oid(),
                 symbol=symbol,
                 side=side,
+                order_type=OrderType.MARKET,
                 amount_requested=amount,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
+                timestamp=self._current_time,
+            )
+            self._orders[order_state.order_id] = order_state
+            self.metrics["orders_created"] += 1
+
+            try:
+                market_data = self._fetch_ticker_sync(symbol)
+            except Exception as e:
+                results[i] = self._fail_order(order_state, str(e))
+                continue
+            base_price = market_data.ask if side == OrderSide.BUY else market_data.bid
+            priced.append((i, order_state, base_price))
+
+        if priced:
+            accepted = (
+                self._np_rng.random(len(priced)) <= self.fill_model["fill_probability"]
+            )
+            base_np = np.array([p[2] for p in priced], dtype=np.float64)
+            amount_np = np.array(
+                [p[1].amount_requested for p in priced], dtype=np.float64
+            )
+            side_sign_np = np.array(
+                [1.0 if p[1].side == OrderSide.BUY else -1.0 for p in priced]
+            )
+
+            exec_price, slippage_bps = self._calculate_execution_prices_batch(
+                base_np, amount_np, side_sign_np
+            )
+            self.metrics["total_slippage_bps"] += float(
+                np.abs(slippage_bps[accepted]).sum()
             )
 
+            for k, (i, order_state, _) in enumerate(priced):
+                if not accepted[k]:
+                    results[i] = self._reject_order(order_state)
+                    continue
+                try:
+                    results[i] = self._fill_order(order_state, float(exec_price[k]))
+                except Exception as e:
+                    results[i] = self._fail_order(order_state, str(e))
+
+        await self._play_back_delays()
+        return results
+
+    async def create_orders_batch(
+        self, orders: Sequence[OrderSpec]
+    ) -> List[OrderResult]:
+        """Simulate an all-market batch in one create_market_orders_batch call"""
+        if any(o.order_type.value != OrderType.MARKET.value for o in orders):
+            return await super().create_orders_batch(orders)
+        return await self.create_market_orders_batch(
+            [(o.symbol, o.side, o.amount) for o in orders]
+        )
+
+    def _fail_order(self, order_state: BacktestOrderState, error: str) -> OrderResult:
+        """Mark an order failed and build its result"""
+        order_state.status = "failed"
+        order_state.error_message = error
+        self.metrics["orders_failed"] += 1
+        self._archive_order(order_state)
+
+        return OrderResult(
+            order_id=order_state.order_id,
+            symbol=order_state.symbol,
+            side=order_state.side,
+            amount_requested=order_state.amount_requested,
+            amount_filled=0.0,
+            average_price=0.0,
+            total_fee=0.0,
+            fills=EMPTY_FILLS,
+            status="failed",
+            error_message=error,
+        )
+
     async def create_limit_order(
         self, symbol: str, side: OrderSide, amount: float, price: float
     ) -> OrderResult:
         """Create limit order (simplified - immediately check if fillable)"""
-        order_id = str(uuid.uuid4())
+        order_id = self._next_oid()
 
         order_state = BacktestOrderState(
             order_id=order_id,
@@ -340,7 +799,7 @@ class BacktestExchange(ExchangeAdapter):
         self.metrics["orders_created"] += 1
 
         try:
-            market_data = await self.fetch_ticker(symbol)
+            market_data = self._fetch_ticker_sync(symbol)
 
             # Check if limit order can be filled immediately
             can_fill = (side == OrderSide.BUY and price >= market_data.ask) or (
@@ -348,9 +807,11 @@ class BacktestExchange(ExchangeAdapter):
             )
 
             if can_fill:
-                return await self._simulate_order_execution(
+                result = self._simulate_order_execution(
                     order_state, market_data, limit_price=price
                 )
+                await self._play_back_delays()
+                return result
             else:
                 # Order remains pending (would need limit order book simulation for full accuracy)
                 return OrderResult(
@@ -361,31 +822,23 @@ class BacktestExchange(ExchangeAdapter):
                     amount_filled=0.0,
                     average_price=0.0,
                     total_fee=0.0,
-                    fills=[],
+                    fills=EMPTY_FILLS,
                     status="pending",
                 )
 
         except Exception as e:
-            order_state.status = "failed"
-            order_state.error_message = str(e)
-            self.metrics["orders_failed"] += 1
-
-            return OrderResult(
-                order_id=order_id,
-                symbol=symbol,
-                side=side,
-                amount_requested=amount,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
-            )
+            return self._fail_order(order_state, str(e))
 
     async def fetch_order_status(self, order_id: str, symbol: str) -> OrderResult:
-        """Get order status"""
+        """Get order status
+
+        Archived (finished) orders are rebuilt from the archive and carry
+        their totals but no individual fills.
+        """
         if order_id not in self._orders:
+            archived = self._archived_order_result(order_id)
+            if archived is not None:
+                return archived
             return OrderResult(
                 order_id=order_id,
                 symbol=symbol,
@@ -394,32 +847,12 @@ class BacktestExchange(ExchangeAdapter):
                 amount_filled=0.0,
                 average_price=0.0,
                 total_fee=0.0,
-                fills=[],
+                fills=EMPTY_FILLS,
                 status="failed",
                 error_message="Order not found",
             )
 
-        order_state = self._orders[order_id]
-        total_fee = sum(fill.fee for fill in order_state.fills)
-        avg_price = (
-            sum(fill.price * fill.amount for fill in order_state.fills)
-            / order_state.amount_filled
-            if order_state.amount_filled > 0
-            else 0.0
-        )
-
-        return OrderResult(
-            order_id=order_id,
-            symbol=order_state.symbol,
-            side=order_state.side,
-            amount_requested=order_state.amount_requested,
-            amount_filled=order_state.amount_filled,
-            average_price=avg_price,
-            total_fee=total_fee,
-            fills=order_state.fills.copy(),
-            status=order_state.status,
-            error_message=order_state.error_message,
-        )
+        return self._build_result(self._orders[order_id])
 
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """Cancel order"""
@@ -427,9 +860,71 @@ class BacktestExchange(ExchangeAdapter):
             order_state = self._orders[order_id]
             if order_state.status == "pending":
                 order_state.status = "cancelled"
+                self._archive_order(order_state)
                 return True
         return False
 
+    def _archive_order(self, order_state: BacktestOrderState) -> None:
+        """Move a finished order out of _orders, into the numpy archive
+        unless retain_orders is off"""
+        if not self._retain_orders:
+            del self._orders[order_state.order_id]
+            return
+
+        row = int(order_state.order_id[5:]) - 1
+        if row >= len(self._closed_orders_np):
+            grown = np.zeros(
+                max(row + 1, 2 * len(self._closed_orders_np)),
+                dtype=ORDER_ARCHIVE_DTYPE,
+            )
+            grown[: len(self._closed_orders_np)] = self._closed_orders_np
+            self._closed_orders_np = grown
+
+        symbol_idx = self._symbol_number(order_state.symbol)
+        self._closed_orders_np[row] = (
+            symbol_idx,
+            0 if order_state.side == OrderSide.BUY else 1,
+            ORDER_STATUS_CODES[order_state.status],
+            order_state.amount_requested,
+            order_state.amount_filled,
+            order_state.notional_sum / order_state.amount_filled
+            if order_state.amount_filled > 0
+            else 0.0,
+            order_state.total_fee,
+            order_state.timestamp,
+        )
+        if order_state.error_message is not None:
+            self._closed_errors[row] = order_state.error_message
+        del self._orders[order_state.order_id]
+
+    def _archived_order_result(self, order_id: str) -> Optional[OrderResult]:
+        """Rebuild the result of an archived order, or None if unknown"""
+        if not order_id.startswith("bt-o-"):
+            return None
+        try:
+            row = int(order_id[5:]) - 1
+        except ValueError:
+            return None
+        if not 0 <= row < len(self._closed_orders_np):
+            return None
+        record = self._closed_orders_np[row]
+        status_code = int(record["status_code"])
+        if status_code == 0:
+            return None
+
+        return OrderResult(
+            order_id=order_id,
+            symbol=self._symbols[int(record["symbol_idx"])],
+            side=OrderSide.BUY if record["side"] == 0 else OrderSide.SELL,
+            amount_requested=float(record["amount_requested"]),
+            amount_filled=float(record["amount_filled"]),
+            average_price=float(record["average_price"]),
+            total_fee=float(record["total_fee"]),
+            fills=EMPTY_FILLS,
+            status=ORDER_STATUS_NAMES[status_code],
+            error_message=self._closed_errors.get(row),
+        )
+
     async def close(self) -> None:
         """Finalize backtest and calculate metrics"""
         self.metrics["simulation_end_time"] = self._current_time
@@ -443,7 +938,34 @@ class BacktestExchange(ExchangeAdapter):
                 - self.metrics["simulation_start_time"]
             )
 
-    async def _simulate_order_execution(
+    def _next_oid(self) -> str:
+        """Next sequential order id"""
+        self._oid_ctr += 1
+        return f"bt-o-{self._oid_ctr}"
+
+    def _next_fid(self) -> str:
+        """Next sequential fill id; the matching trade id shares its number"""
+        self._fid_ctr += 1
+        return f"bt-f-{self._fid_ctr}"
+
+    def _rand(self) -> float:
+        """Next uniform draw in [0, 1) from the buffered generator"""
+        i = self._rand_i
+        if i == RAND_BUFFER_SIZE:
+            self._rand_buf = self._np_rng.random(RAND_BUFFER_SIZE).tolist()
+            i = 0
+        self._rand_i = i + 1
+        return self._rand_buf[i]
+
+    def _rand_uniform(self, low: float, high: float) -> float:
+        """Uniform draw in [low, high)"""
+        return low + (high - low) * self._rand()
+
+    def _rand_int(self, low: int, high: int) -> int:
+        """Integer draw in [low, high], both inclusive"""
+        return low + int(self._rand() * (high - low + 1))
+
+    def _simulate_order_execution(
         self,
         order_state: BacktestOrderState,
         market_data: MarketData,
@@ -452,13 +974,8 @@ class BacktestExchange(ExchangeAdapter):
         """Simulate order execution with backtest-specific logic"""
 
         # Check fill probability
-        if self.rng.random() > self.fill_model["fill_probability"]:
-            order_state.status = "failed"
-            order_state.error_message = "Order rejected by exchange"
-            self.metrics["orders_failed"] += 1
-            return await self.fetch_order_status(
-                order_state.order_id, order_state.symbol
-            )
+        if self._rand() > self.fill_model["fill_probability"]:
+            return self._reject_order(order_state)
 
         # Calculate execution price with slippage
         base_price = (
@@ -475,16 +992,22 @@ class BacktestExchange(ExchangeAdapter):
             elif order_state.side == OrderSide.SELL and execution_price < limit_price:
                 execution_price = limit_price
 
+        return self._fill_order(order_state, execution_price)
+
+    def _fill_order(
+        self, order_state: BacktestOrderState, execution_price: float
+    ) -> OrderResult:
+        """Fill an accepted order at its execution price"""
         # Determine fill amount and pattern
         notional_value = order_state.amount_requested * execution_price
         if notional_value > self.fill_model["partial_fill_threshold"]:
             # Large order - simulate partial fills
-            fill_ratio = self.rng.uniform(self.fill_model["min_fill_ratio"], 1.0)
+            fill_ratio = self._rand_uniform(self.fill_model["min_fill_ratio"], 1.0)
             fill_amount = order_state.amount_requested * fill_ratio
-            await self._create_backtest_fills(order_state, execution_price, fill_amount)
+            self._create_backtest_fills(order_state, execution_price, fill_amount)
         else:
             # Small order - single fill
-            await self._create_single_fill(
+            self._create_single_fill(
                 order_state, execution_price, order_state.amount_requested
             )
 
@@ -492,27 +1015,53 @@ class BacktestExchange(ExchangeAdapter):
         self._update_balances(order_state)
         self._update_metrics(order_state)
 
-        return await self.fetch_order_status(order_state.order_id, order_state.symbol)
+        result = self._build_result(order_state)
+        self._archive_order(order_state)
+        return result
+
+    def _reject_order(self, order_state: BacktestOrderState) -> OrderResult:
+        """Fail an order the simulated exchange declined to fill"""
+        order_state.status = "failed"
+        order_state.error_message = "Order rejected by exchange"
+        self.metrics["orders_failed"] += 1
+        result = self._build_result(order_state)
+        self._archive_order(order_state)
+        return result
+
+    def _build_result(self, order_state: BacktestOrderState) -> OrderResult:
+        """Build an OrderResult from a live order's state and running totals"""
+        return OrderResult(
+            order_id=order_state.order_id,
+            symbol=order_state.symbol,
+            side=order_state.side,
+            amount_requested=order_state.amount_requested,
+            amount_filled=order_state.amount_filled,
+            average_price=(
+                order_state.notional_sum / order_state.amount_filled
+                if order_state.amount_filled > 0
+                else 0.0
+            ),
+            total_fee=order_state.total_fee,
+            # Not copied: fills are only appended while an order executes,
+            # and executed orders are archived right after
+            fills=order_state.fills,
+            status=order_state.status,
+            error_message=order_state.error_message,
+        )
 
     def _calculate_execution_price(
         self, base_price: float, side: OrderSide, amount: float, market_data: MarketData
     ) -> float:
         """Calculate execution price with slippage for backtest"""
-        slippage_bps = self.slippage_model["base_slippage_bps"]
+        slippage_bps = self._slip_base
 
         # Size-based slippage
         notional_value = amount * base_price
-        size_impact = (notional_value / 1000.0) * self.slippage_model[
-            "size_impact_coefficient"
-        ]
-        slippage_bps += min(size_impact, self.slippage_model["max_slippage_bps"])
+        size_impact = (notional_value / 1000.0) * self._slip_coef
+        slippage_bps += min(size_impact, self._slip_max)
 
         # Random component (deterministic with seed)
-        random_slippage = self.rng.uniform(
-            -self.slippage_model["random_component_bps"],
-            self.slippage_model["random_component_bps"],
-        )
-        slippage_bps += random_slippage
+        slippage_bps += self._rand_uniform(-self._slip_rand, self._slip_rand)
 
         # Apply slippage
         slippage_factor = slippage_bps / 10000.0
@@ -526,12 +1075,30 @@ class BacktestExchange(ExchangeAdapter):
 
         return max(execution_price, 0.0)
 
-    async def _create_backtest_fills(
+    def _calculate_execution_prices_batch(
+        self, base: np.ndarray, amount: np.ndarray, side_sign: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Execution prices and slippage (bps) for a batch of orders
+
+        Same slippage model as _calculate_execution_price, applied elementwise;
+        side_sign is +1 for buys and -1 for sells.
+        """
+        return _exec_price_kernel(
+            base,
+            amount,
+            side_sign,
+            self._np_rng.uniform(-self._slip_rand, self._slip_rand, size=base.size),
+            self._slip_base,
+            self._slip_coef,
+            self._slip_max,
+        )
+
+    def _create_backtest_fills(
         self, order_state: BacktestOrderState, base_price: float, total_amount: float
     ) -> None:
         """Create multiple fills for large orders"""
         remaining = total_amount
-        fill_count = self.rng.randint(2, 4)
+        fill_count = self._rand_int(2, 4)
 
         for i in range(fill_count):
             if remaining <= 0:
@@ -541,20 +1108,19 @@ class BacktestExchange(ExchangeAdapter):
                 fill_amount = remaining
             else:
                 max_fill = remaining * 0.7
-                fill_amount = self.rng.uniform(remaining * 0.2, max_fill)
+                fill_amount = self._rand_uniform(remaining * 0.2, max_fill)
 
             # Small price variance per fill
-            price_var = self.rng.uniform(-0.0005, 0.0005)
+            price_var = self._rand_uniform(-0.0005, 0.0005)
             fill_price = base_price * (1 + price_var)
 
-            await self._create_single_fill(order_state, fill_price, fill_amount)
+            self._create_single_fill(order_state, fill_price, fill_amount)
             remaining -= fill_amount
 
             # Simulate time between fills
-            time_delay_ms = self.rng.uniform(50, 200)
-            await self._advance_simulation_time(time_delay_ms / 1000.0)
+            self._advance_simulation_time(self._rand_uniform(50, 200) / 1000.0)
 
-    async def _create_single_fill(
+    def _create_single_fill(
         self, order_state: BacktestOrderState, price: float, amount: float
     ) -> None:
         """Create a single fill"""
@@ -562,6 +1128,7 @@ class BacktestExchange(ExchangeAdapter):
             order_state.symbol, order_state.side, order_state.order_type
         )
         fee = amount * price * fee_rate
+        fill_id = self._next_fid()
 
         fill = FillInfo(
             order_id=order_state.order_id,
@@ -571,8 +1138,8 @@ class BacktestExchange(ExchangeAdapter):
             price=price,
             fee=fee,
             timestamp=self._current_time,
-            fill_id=str(uuid.uuid4()),
-            trade_id=str(uuid.uuid4()),
+            fill_id=fill_id,
+            trade_id=f"bt-t-{self._fid_ctr}",
             is_partial=(
                 order_state.amount_filled + amount < order_state.amount_requested
             ),
@@ -580,6 +1147,8 @@ class BacktestExchange(ExchangeAdapter):
 
         order_state.fills.append(fill)
         order_state.amount_filled += amount
+        order_state.total_fee += fee
+        order_state.notional_sum += price * amount
 
         if order_state.amount_filled >= order_state.amount_requested:
             order_state.status = "filled"
@@ -588,23 +1157,21 @@ class BacktestExchange(ExchangeAdapter):
 
     def _update_balances(self, order_state: BacktestOrderState) -> None:
         """Update simulated balances"""
-        base_currency, quote_currency = order_state.symbol.split("/")
-
-        for fill in order_state.fills:
-            if order_state.side == OrderSide.BUY:
-                self._balances[base_currency] = (
-                    self._balances.get(base_currency, 0.0) + fill.amount
-                )
-                self._balances[quote_currency] = self._balances.get(
-                    quote_currency, 0.0
-                ) - (fill.amount * fill.price + fill.fee)
-            else:
-                self._balances[base_currency] = (
-                    self._balances.get(base_currency, 0.0) - fill.amount
-                )
-                self._balances[quote_currency] = self._balances.get(
-                    quote_currency, 0.0
-                ) + (fill.amount * fill.price - fill.fee)
+        base_currency, quote_currency = self._sym_parts[order_state.symbol]
+        amount = order_state.amount_filled
+        notional = order_state.notional_sum
+        fee = order_state.total_fee
+
+        if order_state.side == OrderSide.BUY:
+            self._balances[base_currency] = self._balances.get(base_currency, 0.0) + amount
+            self._balances[quote_currency] = self._balances.get(
+                quote_currency, 0.0
+            ) - (notional + fee)
+        else:
+            self._balances[base_currency] = self._balances.get(base_currency, 0.0) - amount
+            self._balances[quote_currency] = self._balances.get(
+                quote_currency, 0.0
+            ) + (notional - fee)
 
     def _update_metrics(self, order_state: BacktestOrderState) -> None:
         """Update execution metrics"""
@@ -613,21 +1180,27 @@ class BacktestExchange(ExchangeAdapter):
         elif order_state.status == "partial":
             self.metrics["orders_partially_filled"] += 1
 
-        total_volume = sum(fill.amount * fill.price for fill in order_state.fills)
-        self.metrics["total_volume"] += total_volume
+        self.metrics["total_volume"] += order_state.notional_sum
 
-    async def _advance_simulation_time(self, seconds: float) -> None:
-        """Advance simulation time"""
+    def _advance_simulation_time(self, seconds: float) -> None:
+        """Advance simulation time; under realtime playback the wall-clock
+        wait is collected and slept off by _play_back_delays"""
         self._current_time += seconds
 
-        # Optional: sleep for realistic time if time_acceleration is set
-        if self.time_acceleration > 0:
-            await asyncio.sleep(seconds / self.time_acceleration)
+        if self.realtime_playback:
+            self._playback_delay += seconds
+
+    async def _play_back_delays(self) -> None:
+        """Sleep through simulated delays accrued under realtime playback"""
+        if self._playback_delay:
+            delay, self._playback_delay = self._playback_delay, 0.0
+            await asyncio.sleep(delay / self.time_acceleration)
 
     def advance_time_to(self, target_timestamp: float) -> None:
         """Advance simulation to specific timestamp"""
         if target_timestamp > self._current_time:
             self._current_time = target_timestamp
+            self._advance_cursor()
 
     def get_current_simulation_time(self) -> float:
         """Get current simulation timestamp"""
@@ -666,8 +1239,8 @@ class BacktestExchange(ExchangeAdapter):
             ),
             "total_volume_usd": self.metrics["total_volume"],
             "average_slippage_bps": avg_slippage,
-            "data_points_processed": len(self._market_data),
-            "symbols_traded": list(self._market_data.keys()),
+            "data_points_processed": len(self._cols),
+            "symbols_traded": list(self._cols.keys()),
             "final_balances": self._balances.copy(),
         }
 
@@ -679,8 +1252,6 @@ class BacktestExchange(ExchangeAdapter):
         self, symbol: str, side: OrderSide, order_type: OrderType
     ) -> float:
         """Get trading fee rate"""
-        fees = self.config.get("fees", {})
         if order_type == OrderType.MARKET:
-            return fees.get("taker_bps", 30) / 10000.0
-        else:
-            return fees.get("maker_bps", 10) / 10000.0
+            return self._taker_rate
+        return self._maker_rate
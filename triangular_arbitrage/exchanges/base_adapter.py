@@ -6,11 +6,44 @@ Supports live trading, paper trading, and backtesting modes.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Sequence, Tuple
 from enum import Enum
+from operator import itemgetter
+import asyncio
+import glob
+import hashlib
+import json
+import logging
+import os
 import time
 
+from ..utils import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Idle interval after which the live adapter pings the exchange so pooled
+# keep-alive connections are not dropped between orders
+KEEPALIVE_PING_SECONDS = 30.0
+
+# Connections opened by initialize's warm-up requests (config
+# prewarm_connections; prewarm: false disables the warm-up)
+PREWARM_CONNECTIONS = 4
+
+# Upper bound on a cancel or order-status request, so a stuck call cannot
+# hold up the caller; configurable as cancel_timeout_s / fetch_order_timeout_s
+ORDER_CALL_TIMEOUT_SECONDS = 2.0
+
+# Streamed tickers older than this are not served; fetch_ticker falls back
+# to REST while the feed is silent (config ws_ticker_max_age_ms)
+WS_TICKER_MAX_AGE_MS = 1000
+
+# Order endpoint budget: bursts of 10 at up to 10 per second (Binance's cap)
+DEFAULT_THROTTLE = {"orders": {"capacity": 10, "refill_rate": 10.0}}
+
 
 class OrderType(Enum):
     MARKET = "market"
@@ -22,7 +55,29 @@ class OrderSide(Enum):
     SELL = "sell"
 
 
-@dataclass
+# Unified ccxt order fields read in one C-level call; orders parsed by
+# ccxt's safe_order carry every key, possibly as None
+_ORDER_FIELDS = itemgetter(
+    "id",
+    "side",
+    "status",
+    "amount",
+    "filled",
+    "average",
+    "price",
+    "fee",
+    "info",
+    "trades",
+)
+
+# ccxt side strings -> OrderSide, a dict get instead of an Enum value scan
+_SIDE_FROM_STR = {side.value: side for side in OrderSide}
+
+# Shared stand-in for a missing config["fees"] so the fee-rate cache hits
+_NO_FEES: Dict[str, Any] = {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FillInfo:
     """Information about an order fill"""
 
@@ -38,7 +93,66 @@ class FillInfo:
     is_partial: bool = False
 
 
-@dataclass
+class FillBatch:
+    """
+    Fills of one order as parallel float64 arrays (prices, amounts, fees,
+    timestamps), so VWAP and fee totals are single NumPy reductions
+    """
+
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, capacity: int = 4):
+        import numpy as np
+
+        # One row per field
+        self._data = np.empty((4, max(capacity, 1)), dtype=np.float64)
+        self._size = 0
+
+    @classmethod
+    def from_fills(cls, fills: Sequence[FillInfo]) -> "FillBatch":
+        """Build a batch from FillInfo records"""
+        import numpy as np
+
+        n = len(fills)
+        batch = cls(n)
+        data = batch._data
+        data[0, :n] = np.fromiter((f.price or 0 for f in fills), float, n)
+        data[1, :n] = np.fromiter((f.amount or 0 for f in fills), float, n)
+        data[2, :n] = np.fromiter((f.fee or 0 for f in fills), float, n)
+        data[3, :n] = np.fromiter((f.timestamp for f in fills), float, n)
+        batch._size = n
+        return batch
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def prices(self) -> "np.ndarray":
+        return self._data[0, : self._size]
+
+    @property
+    def amounts(self) -> "np.ndarray":
+        return self._data[1, : self._size]
+
+    @property
+    def fees(self) -> "np.ndarray":
+        return self._data[2, : self._size]
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        return self._data[3, : self._size]
+
+    def vwap(self) -> float:
+        """Volume-weighted average fill price, 0.0 when nothing filled"""
+        amounts = self.amounts
+        total = amounts.sum()
+        return float(self.prices.dot(amounts) / total) if total else 0.0
+
+    def total_fee(self) -> float:
+        return float(self.fees.sum())
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OrderResult:
     """Result of placing/monitoring an order"""
 
@@ -49,19 +163,65 @@ class OrderResult:
     amount_filled: float
     average_price: float
     total_fee: float
-    fills: List[FillInfo]
+    fills: Sequence[FillInfo]
     status: str  # 'filled', 'partial', 'cancelled', 'failed'
     error_message: Optional[str] = None
-    timestamp: float = None
+    timestamp: float = field(default_factory=time.time)
+    # time.monotonic_ns() when the request was sent and its reply received,
+    # for latency accounting free of wall-clock adjustments; 0 if not timed
+    submit_mono_ns: int = 0
+    recv_mono_ns: int = 0
+    _fill_batch: Optional[FillBatch] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def fill_batch(self) -> FillBatch:
+        """The fills as a FillBatch, built on first access"""
+        if self._fill_batch is None:
+            self._fill_batch = FillBatch.from_fills(self.fills)
+        return self._fill_batch
+
+
+# Shared "no fills" value for results that carry none, instead of a new list each
+EMPTY_FILLS: Tuple[FillInfo, ...] = ()
+
+
+def _failed_order(
+    symbol: str, side: OrderSide, amount: float, error: str, order_id: str = ""
+) -> OrderResult:
+    """OrderResult for an order or status request that did not go through"""
+    return OrderResult(
+        order_id=order_id,
+        symbol=symbol,
+        side=side,
+        amount_requested=amount,
+        amount_filled=0.0,
+        average_price=0.0,
+        total_fee=0.0,
+        fills=EMPTY_FILLS,
+        status="failed",
+        error_message=error,
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
+class OrderSpec:
+    """One order of a batch submitted through create_orders_batch"""
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = time.time()
+    symbol: str
+    side: OrderSide
+    amount: float
+    order_type: OrderType = OrderType.MARKET
+    price: Optional[float] = None  # Required for limit orders
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MarketData:
-    """Market data snapshot"""
+    """Market data snapshot
+
+    Frozen: adapters hand the same cached instance to every caller.
+    """
 
     symbol: str
     bid: float
@@ -87,6 +247,7 @@ class ExchangeAdapter(ABC):
         """
         self.config = config
         self.execution_mode = config.get("execution_mode", "live")
+        self._fee_rate_cache = None  # ((taker_bps, maker_bps), {type: rate})
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -103,6 +264,16 @@ class ExchangeAdapter(ABC):
         """Fetch current market data for a symbol"""
         pass
 
+    async def fetch_tickers(self, symbols: Sequence[str]) -> Dict[str, MarketData]:
+        """
+        Fetch market data for several symbols
+
+        The default fetches every symbol concurrently; adapters whose
+        exchange serves all tickers in one request override this.
+        """
+        tickers = await asyncio.gather(*(self.fetch_ticker(s) for s in symbols))
+        return dict(zip(symbols, tickers))
+
     @abstractmethod
     async def fetch_balance(self) -> Dict[str, float]:
         """Fetch account balances"""
@@ -137,6 +308,26 @@ class ExchangeAdapter(ABC):
         """Clean up resources"""
         pass
 
+    async def create_orders_batch(
+        self, orders: Sequence[OrderSpec]
+    ) -> List[OrderResult]:
+        """
+        Place several orders at once
+
+        The default submits every order concurrently; adapters with a
+        native batch endpoint override this. Results are in input order.
+        """
+        return list(await asyncio.gather(*(self._place_order(o) for o in orders)))
+
+    async def _place_order(self, spec: OrderSpec) -> OrderResult:
+        """Place a single OrderSpec with the matching create_* method"""
+        # Compare by value: callers may pass either OrderType enum
+        if spec.order_type.value == OrderType.LIMIT.value:
+            return await self.create_limit_order(
+                spec.symbol, spec.side, spec.amount, spec.price
+            )
+        return await self.create_market_order(spec.symbol, spec.side, spec.amount)
+
     # Optional methods for specific functionality
     async def get_execution_metrics(self) -> Dict[str, Any]:
         """Get execution metrics (for paper/backtest modes)"""
@@ -154,11 +345,74 @@ class ExchangeAdapter(ABC):
         self, symbol: str, side: OrderSide, order_type: OrderType
     ) -> float:
         """Get fee rate for a trade"""
-        fees = self.config.get("fees", {})
-        if order_type == OrderType.MARKET:
-            return fees.get("taker_bps", 30) / 10000.0  # Default 0.3%
-        else:
-            return fees.get("maker_bps", 10) / 10000.0  # Default 0.1%
+        fees = self.config.get("fees", _NO_FEES)
+        # Default 0.3% / 0.1%
+        bps = (fees.get("taker_bps", 30), fees.get("maker_bps", 10))
+        cached = self._fee_rate_cache
+        if cached is None or cached[0] != bps:
+            # Recomputed whenever the configured fee values change
+            cached = self._fee_rate_cache = (
+                bps,
+                {
+                    OrderType.MARKET.value: bps[0] / 10000.0,
+                    OrderType.LIMIT.value: bps[1] / 10000.0,
+                },
+            )
+        # Keyed by value so either OrderType enum works
+        return cached[1].get(order_type.value, cached[1][OrderType.LIMIT.value])
+
+
+# ccxt options that change which markets load_markets returns
+_MARKETS_OPTION_KEYS = ("defaultType", "defaultSubType", "fetchMarkets")
+
+# (markets, currencies) per (exchange variant, UTC day), shared by every ccxt
+# adapter in the process; entries from earlier days are evicted on insert
+_MARKETS_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, Dict], Optional[Dict]]] = {}
+
+
+def _cache_markets(
+    key: Tuple[str, str], entry: Tuple[Dict[str, Dict], Optional[Dict]]
+) -> None:
+    """Store an entry in _MARKETS_CACHE and drop entries from other days"""
+    for stale in [k for k in _MARKETS_CACHE if k[1] != key[1]]:
+        del _MARKETS_CACHE[stale]
+    _MARKETS_CACHE[key] = entry
+
+
+class TokenBucket:
+    """
+    Async token bucket allowing bursts of up to ``capacity`` requests
+
+    Tokens refill continuously at ``refill_rate`` per second, so the
+    long-run rate is capped while a burst fires back-to-back instead of
+    being spaced evenly. Waiters are served in arrival order.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None  # Created on the running loop
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.refill_rate
+        )
+        self._updated = now
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        """Wait until ``cost`` tokens are available and take them"""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self._refill()
+            if self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) / self.refill_rate)
+                self._refill()
+            # May go negative for a cost above capacity; later callers wait it off
+            self.tokens -= cost
 
 
 class LiveExchangeAdapter(ExchangeAdapter):
@@ -175,29 +429,316 @@ class LiveExchangeAdapter(ExchangeAdapter):
         super().__init__(config)
         self.exchange = exchange_instance
         self._markets = None
+        self._min_sizes: Dict[str, float] = {}
+        # Running order round-trip latency totals for get_execution_metrics
+        self._orders_timed = 0
+        self._order_latency_total_ns = 0
+        self._order_latency_max_ns = 0
+        self._session = None  # HTTP session installed by initialize, if any
+        self._ping_task: Optional[asyncio.Task] = None
+        # Per-endpoint request budgets, e.g. {"orders": {"capacity": 10,
+        # "refill_rate": 10}}; endpoints without a bucket are not throttled
+        throttle = config.get("throttle", DEFAULT_THROTTLE)
+        self._buckets: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket(limits["capacity"], limits["refill_rate"])
+            for endpoint, limits in throttle.items()
+        }
+        # Latest pushed ticker per symbol, with its time.monotonic() receive
+        # time, and the watch_ticker task feeding it
+        self._ticker_cache: Dict[str, Tuple[float, MarketData]] = {}
+        self._ticker_max_age = (
+            config.get("ws_ticker_max_age_ms", WS_TICKER_MAX_AGE_MS) / 1000.0
+        )
+        self._watch_tasks: Dict[str, asyncio.Task] = {}
+        # ccxt.pro instances advertise their WebSocket methods in `has`
+        has = getattr(exchange_instance, "has", None)
+        self._streaming = bool(
+            config.get("websocket_tickers", True)
+            and isinstance(has, dict)
+            and has.get("watchTicker")
+        )
 
     async def initialize(self) -> None:
-        """Initialize the live exchange"""
-        if hasattr(self.exchange, "load_markets"):
-            await self.exchange.load_markets()
+        """Initialize the live exchange
 
-    async def load_markets(self) -> Dict[str, Dict]:
-        """Load markets from live exchange"""
-        if self._markets is None:
-            self._markets = await self.exchange.load_markets()
-        return self._markets
+        Installs a keep-alive connection pool on ccxt instances that have
+        not opened their own HTTP session yet, so orders reuse warm TLS
+        connections, opens a few of them while markets load, and starts a
+        background ping that keeps them open. The pool keeps the instance's
+        TLS (cafile, verify, OS certificates) and proxy environment settings.
+        """
+        if getattr(self.exchange, "session", False) is None:
+            from ..exchange import create_http_session
+
+            # open() resolves ccxt's ssl_context; the plain session it
+            # creates alongside is replaced by the pooled one below
+            if hasattr(self.exchange, "open"):
+                self.exchange.open()
+            default_session = self.exchange.session
+
+            # aiohttp disables Nagle (TCP_NODELAY) on its connections
+            self._session = create_http_session(
+                getattr(self.exchange, "ssl_context", None),
+                trust_env=getattr(self.exchange, "aiohttp_trust_env", False),
+                limit=32,
+                limit_per_host=16,
+            )
+            self.exchange.session = self._session
+            if default_session is not None:
+                await default_session.close()
+
+        # Open pooled connections (DNS, TCP, TLS) up front, alongside the
+        # markets request, so the first order does not pay the cold start
+        warmups = []
+        if self.config.get("prewarm", True) and hasattr(self.exchange, "fetch_time"):
+            count = self.config.get("prewarm_connections", PREWARM_CONNECTIONS)
+            warmups = [self._warm_connection() for _ in range(count)]
+
+        # Markets survive a re-initialize (e.g. after a reconnect)
+        if self._markets is None and hasattr(self.exchange, "load_markets"):
+            markets, *_ = await asyncio.gather(self._fetch_markets(), *warmups)
+            self._set_markets(markets)
+        elif warmups:
+            await asyncio.gather(*warmups)
+
+        interval = self.config.get("keepalive_ping_seconds", KEEPALIVE_PING_SECONDS)
+        if (
+            interval
+            and self._ping_task is None
+            and hasattr(self.exchange, "fetch_time")
+        ):
+            self._ping_task = asyncio.create_task(self._keepalive_ping(interval))
+
+        if self._streaming:
+            for symbol in self.config.get("watch_symbols", ()):
+                self._watch(symbol)
+
+    async def _warm_connection(self) -> None:
+        """Make one cheap request so a pooled connection is opened"""
+        try:
+            await self.exchange.fetch_time()
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
+    async def _keepalive_ping(self, interval: float) -> None:
+        """Hit a cheap public endpoint periodically to keep connections hot"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.exchange.fetch_time()
+            except Exception as e:
+                logger.debug(f"Keep-alive ping failed: {e}")
+
+    def _record_latency(
+        self, result: OrderResult, submit: int, recv: int
+    ) -> OrderResult:
+        """Stamp an order's round trip on its result and the running totals"""
+        result.submit_mono_ns = submit
+        result.recv_mono_ns = recv
+        latency = recv - submit
+        self._orders_timed += 1
+        self._order_latency_total_ns += latency
+        if latency > self._order_latency_max_ns:
+            self._order_latency_max_ns = latency
+        return result
 
-    async def fetch_ticker(self, symbol: str) -> MarketData:
-        """Fetch ticker from live exchange"""
-        ticker = await self.exchange.fetch_ticker(symbol)
+    async def get_execution_metrics(self) -> Dict[str, Any]:
+        """Order round-trip latency measured with time.monotonic_ns()"""
+        timed = self._orders_timed
+        return {
+            "execution_mode": self.execution_mode,
+            "orders_timed": timed,
+            "avg_order_latency_ms": (
+                self._order_latency_total_ns / timed / 1e6 if timed else 0.0
+            ),
+            "max_order_latency_ms": self._order_latency_max_ns / 1e6,
+        }
+
+    async def _throttle(self, endpoint: str, cost: float = 1.0) -> None:
+        """Wait for the endpoint's token bucket, if it has one"""
+        bucket = self._buckets.get(endpoint)
+        if bucket is not None:
+            await bucket.acquire(cost)
+
+    def _watch(self, symbol: str) -> None:
+        """Start streaming a symbol's ticker unless it is already streamed"""
+        if symbol not in self._watch_tasks:
+            self._watch_tasks[symbol] = asyncio.create_task(self._pump_ticker(symbol))
+
+    async def _pump_ticker(self, symbol: str) -> None:
+        """Keep the cached ticker for a symbol current from its WebSocket feed"""
+        try:
+            while True:
+                try:
+                    ticker = await self.exchange.watch_ticker(symbol)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    # Serve REST until the feed recovers
+                    self._ticker_cache.pop(symbol, None)
+                    logger.debug(f"Ticker stream for {symbol} failed: {e}")
+                    await asyncio.sleep(1.0)
+                    continue
+                self._ticker_cache[symbol] = (
+                    time.monotonic(),
+                    self._to_market_data(symbol, ticker, time.time()),
+                )
+        finally:
+            self._ticker_cache.pop(symbol, None)
+
+    @staticmethod
+    def _to_market_data(symbol: str, ticker: Dict, now: float) -> MarketData:
+        """Convert a ccxt ticker to MarketData"""
         return MarketData(
             symbol=symbol,
             bid=ticker["bid"],
             ask=ticker["ask"],
             last=ticker["last"],
             volume=ticker["quoteVolume"],
-            timestamp=time.time(),
+            timestamp=now,
+        )
+
+    async def load_markets(self) -> Dict[str, Dict]:
+        """Load markets from live exchange"""
+        if self._markets is None:
+            self._set_markets(await self._fetch_markets())
+        return self._markets
+
+    def _markets_variant(self) -> str:
+        """
+        Name of the markets this instance loads: the exchange id, plus the
+        sandbox flag and the options that select market types, if set
+        """
+        variant = self.exchange.id
+        if getattr(self.exchange, "isSandboxModeEnabled", False) is True:
+            variant += "-sandbox"
+        options = getattr(self.exchange, "options", None)
+        if isinstance(options, dict):
+            selected = {
+                k: options[k]
+                for k in _MARKETS_OPTION_KEYS
+                if options.get(k) is not None
+            }
+            if selected:
+                encoded = json.dumps(selected, sort_keys=True, default=str).encode()
+                variant += "-" + hashlib.sha1(encoded).hexdigest()[:8]
+        return variant
+
+    async def _fetch_markets(self) -> Dict[str, Dict]:
+        """
+        Load markets, reusing today's copy for this exchange if one exists
+
+        Markets and currencies are shared in-process across adapters for the
+        same exchange, sandbox mode and market-type options and, when config
+        markets_cache_dir is set, persisted there as JSON so a restart on the
+        same day skips the markets request. Copies from earlier days are
+        dropped.
+        """
+        exchange_id = getattr(self.exchange, "id", None)
+        if not isinstance(exchange_id, str) or not hasattr(
+            self.exchange, "set_markets"
+        ):
+            return await self.exchange.load_markets()
+
+        day = time.strftime("%Y-%m-%d", time.gmtime())
+        variant = self._markets_variant()
+        key = (variant, day)
+        entry = _MARKETS_CACHE.get(key)
+        cache_dir = self.config.get("markets_cache_dir")
+        path = os.path.join(cache_dir, f"{variant}-{day}.json") if cache_dir else None
+        if entry is None and path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                entry = (data["markets"], data.get("currencies"))
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable markets cache {path}: {e}")
+
+        if entry is not None:
+            self.exchange.set_markets(*entry)
+            _cache_markets(key, entry)
+            return self.exchange.markets
+
+        markets = await self.exchange.load_markets()
+        entry = (markets, getattr(self.exchange, "currencies", None))
+        _cache_markets(key, entry)
+        if path:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(
+                        {"markets": markets, "currencies": entry[1]}, f, default=str
+                    )
+                os.replace(tmp_path, path)
+                self._remove_stale_markets(cache_dir, variant, path)
+            except OSError as e:
+                logger.warning(f"Could not write markets cache {path}: {e}")
+        return markets
+
+    @staticmethod
+    def _remove_stale_markets(cache_dir: str, variant: str, keep: str) -> None:
+        """Delete this variant's markets files from earlier days"""
+        day = "[0-9]" * 4 + "-" + "[0-9]" * 2 + "-" + "[0-9]" * 2
+        pattern = os.path.join(
+            glob.escape(cache_dir), f"{glob.escape(variant)}-{day}.json"
         )
+        for stale in glob.glob(pattern):
+            if stale != keep:
+                try:
+                    os.remove(stale)
+                except OSError as e:
+                    logger.warning(f"Could not remove stale markets cache {stale}: {e}")
+
+    def _set_markets(self, markets: Optional[Dict[str, Dict]]) -> None:
+        """Store loaded markets and index their minimum order sizes"""
+        self._markets = markets
+        self._min_sizes = {
+            symbol: ((market.get("limits") or {}).get("amount") or {}).get("min") or 0.0
+            for symbol, market in (markets or {}).items()
+        }
+
+    def get_minimum_order_size(self, symbol: str) -> float:
+        """Minimum order amount from the loaded markets (0.0 if unknown)"""
+        return self._min_sizes.get(symbol, 0.0)
+
+    async def fetch_ticker(self, symbol: str) -> MarketData:
+        """Fetch ticker from live exchange
+
+        With a WebSocket-capable (ccxt.pro) exchange the first request for a
+        symbol starts streaming it, and later calls return the latest
+        pushed ticker without a round trip. A pushed ticker older than
+        ``ws_ticker_max_age_ms`` (a silently stalled feed) is not served;
+        the call goes over REST until the feed pushes again.
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self._ticker_max_age:
+            return cached[1]
+        if self._streaming:
+            self._watch(symbol)
+        ticker = await self.exchange.fetch_ticker(symbol)
+        return self._to_market_data(symbol, ticker, time.time())
+
+    async def fetch_tickers(self, symbols: Sequence[str]) -> Dict[str, MarketData]:
+        """Fetch tickers in one request where the exchange supports it"""
+        has = getattr(self.exchange, "has", None) or {}
+        if self._streaming or len(symbols) < 2 or not has.get("fetchTickers"):
+            # Streamed symbols are served from the cache by fetch_ticker
+            return await super().fetch_tickers(symbols)
+
+        tickers = await self.exchange.fetch_tickers(list(symbols))
+        now = time.time()
+        to_market_data = self._to_market_data
+        result = {
+            symbol: to_market_data(symbol, t, now)
+            for symbol, t in tickers.items()
+            if symbol in symbols
+        }
+        # Symbols the exchange left out of its response are fetched singly
+        missing = [s for s in symbols if s not in result]
+        if missing:
+            result.update(await super().fetch_tickers(missing))
+        return result
 
     async def fetch_balance(self) -> Dict[str, float]:
         """Fetch balance from live exchange"""
@@ -209,32 +750,27 @@ class LiveExchangeAdapter(ExchangeAdapter):
     ) -> OrderResult:
         """Create market order on live exchange"""
         try:
+            await self._throttle("orders")
+            submit = time.monotonic_ns()
             if side == OrderSide.BUY:
                 order = await self.exchange.create_market_buy_order(symbol, amount)
             else:
                 order = await self.exchange.create_market_sell_order(symbol, amount)
+            recv = time.monotonic_ns()
 
-            return await self._convert_order_result(order, symbol, side, amount)
+            result = await self._convert_order_result(order, symbol, side, amount)
+            return self._record_latency(result, submit, recv)
 
         except Exception as e:
-            return OrderResult(
-                order_id="",
-                symbol=symbol,
-                side=side,
-                amount_requested=amount,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
-            )
+            return _failed_order(symbol, side, amount, str(e))
 
     async def create_limit_order(
         self, symbol: str, side: OrderSide, amount: float, price: float
     ) -> OrderResult:
         """Create limit order on live exchange"""
         try:
+            await self._throttle("orders")
+            submit = time.monotonic_ns()
             if side == OrderSide.BUY:
                 order = await self.exchange.create_limit_buy_order(
                     symbol, amount, price
@@ -243,101 +779,189 @@ class LiveExchangeAdapter(ExchangeAdapter):
                 order = await self.exchange.create_limit_sell_order(
                     symbol, amount, price
                 )
+            recv = time.monotonic_ns()
 
-            return await self._convert_order_result(order, symbol, side, amount)
+            result = await self._convert_order_result(order, symbol, side, amount)
+            return self._record_latency(result, submit, recv)
 
         except Exception as e:
-            return OrderResult(
-                order_id="",
-                symbol=symbol,
-                side=side,
-                amount_requested=amount,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
+            return _failed_order(symbol, side, amount, str(e))
+
+    async def create_orders_batch(
+        self, orders: Sequence[OrderSpec]
+    ) -> List[OrderResult]:
+        """Place orders in one request where the exchange supports it"""
+        has = getattr(self.exchange, "has", None) or {}
+        if len(orders) < 2 or not has.get("createOrders"):
+            return await super().create_orders_batch(orders)
+
+        try:
+            await self._throttle("orders", len(orders))
+            submit = time.monotonic_ns()
+            placed = await self.exchange.create_orders(
+                [
+                    {
+                        "symbol": o.symbol,
+                        "type": o.order_type.value,
+                        "side": o.side.value,
+                        "amount": o.amount,
+                        "price": o.price,
+                    }
+                    for o in orders
+                ]
             )
+            recv = time.monotonic_ns()
+            return [
+                self._record_latency(
+                    await self._convert_order_result(order, o.symbol, o.side, o.amount),
+                    submit,
+                    recv,
+                )
+                for order, o in zip(placed, orders)
+            ]
+
+        except Exception as e:
+            error = str(e)
+            return [_failed_order(o.symbol, o.side, o.amount, error) for o in orders]
 
     async def fetch_order_status(self, order_id: str, symbol: str) -> OrderResult:
         """Fetch order status from live exchange"""
+        timeout = self.config.get("fetch_order_timeout_s", ORDER_CALL_TIMEOUT_SECONDS)
         try:
-            order = await self.exchange.fetch_order(order_id, symbol)
+            order = await asyncio.wait_for(
+                self.exchange.fetch_order(order_id, symbol), timeout=timeout
+            )
             return await self._convert_order_result(
                 order, symbol, None, order.get("amount", 0)
             )
 
-        except Exception as e:
-            return OrderResult(
-                order_id=order_id,
-                symbol=symbol,
-                side=OrderSide.BUY,  # Default
-                amount_requested=0.0,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
+        except asyncio.TimeoutError:
+            return _failed_order(
+                symbol,
+                OrderSide.BUY,  # Default
+                0.0,
+                f"fetch_order timed out after {timeout}s",
+                order_id,
             )
+        except Exception as e:
+            return _failed_order(symbol, OrderSide.BUY, 0.0, str(e), order_id)
 
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
         """Cancel order on live exchange"""
+        timeout = self.config.get("cancel_timeout_s", ORDER_CALL_TIMEOUT_SECONDS)
         try:
-            await self.exchange.cancel_order(order_id, symbol)
+            await self._throttle("orders")
+            await asyncio.wait_for(
+                self.exchange.cancel_order(order_id, symbol), timeout=timeout
+            )
             return True
-        except:
+        except asyncio.TimeoutError:
+            logger.warning(f"Cancel of {order_id} timed out after {timeout}s")
+            return False
+        except Exception:
+            # CancelledError is not an Exception and still propagates
             return False
 
     async def close(self) -> None:
         """Close live exchange connection"""
+        if self._ping_task is not None:
+            self._ping_task.cancel()
+            try:
+                await self._ping_task
+            except asyncio.CancelledError:
+                pass
+            self._ping_task = None
+        watch_tasks = list(self._watch_tasks.values())
+        self._watch_tasks.clear()
+        for task in watch_tasks:
+            task.cancel()
+        await asyncio.gather(*watch_tasks, return_exceptions=True)
         if hasattr(self.exchange, "close"):
             await self.exchange.close()
+        # ccxt leaves sessions it did not create open
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def _convert_order_result(
         self, order: Dict, symbol: str, side: Optional[OrderSide], amount: float
     ) -> OrderResult:
         """Convert ccxt order format to OrderResult"""
-        order_side = OrderSide(order.get("side", side.value if side else "buy"))
-        status = order.get("status", "unknown")
+        try:
+            (
+                order_id,
+                raw_side,
+                status,
+                amount_requested,
+                filled,
+                average_price,
+                price,
+                fee,
+                info,
+                trades,
+            ) = _ORDER_FIELDS(order)
+        except KeyError:
+            # Not a full unified ccxt order: fall back to per-field defaults
+            order_id = order["id"]
+            raw_side = order.get("side")
+            status = order.get("status", "unknown")
+            amount_requested = order.get("amount", amount)
+            filled = order.get("filled", 0)
+            price = order.get("price", 0)
+            average_price = order.get("average", price)
+            fee = order.get("fee")
+            info = order.get("info")
+            trades = order.get("trades")
+
+        order_side = _SIDE_FROM_STR.get(
+            raw_side or (side.value if side else "buy"), OrderSide.BUY
+        )
 
         # Map ccxt status to our format
         if status in ["closed", "filled"]:
             result_status = "filled"
         elif status == "canceled":
             result_status = "cancelled"
-        elif order.get("filled", 0) > 0:
+        elif (filled or 0) > 0:
             result_status = "partial"
         else:
             result_status = "pending"
 
-        # Create fills from trades if available
-        fills = []
-        trades = order.get("trades", [])
-        for trade in trades:
-            fill = FillInfo(
-                order_id=order["id"],
+        # Create fills from trades if available; ccxt sends null for
+        # missing fee / timestamp fields, so fall back on falsy values
+        now_ms = time.time() * 1000
+        trades = trades or ()
+        fills = [
+            FillInfo(
+                order_id=order_id,
                 symbol=symbol,
                 side=order_side,
-                amount=trade.get("amount", 0),
-                price=trade.get("price", 0),
-                fee=trade.get("fee", {}).get("cost", 0),
-                timestamp=trade.get("timestamp", time.time()) / 1000,
-                fill_id=trade.get("id", ""),
-                trade_id=trade.get("id", ""),
+                amount=t.get("amount", 0),
+                price=t.get("price", 0),
+                fee=(t.get("fee") or {}).get("cost", 0),
+                timestamp=(t.get("timestamp") or now_ms) / 1000,
+                fill_id=t.get("id", ""),
+                trade_id=t.get("id", ""),
             )
-            fills.append(fill)
+            for t in trades
+        ]
 
-        return OrderResult(
-            order_id=order["id"],
+        result = OrderResult(
+            order_id=order_id,
             symbol=symbol,
             side=order_side,
-            amount_requested=order.get("amount", amount),
-            amount_filled=order.get("filled", 0),
-            average_price=order.get("average", order.get("price", 0)),
-            total_fee=order.get("fee", {}).get("cost", 0),
+            amount_requested=amount_requested,
+            amount_filled=filled,
+            average_price=average_price,
+            total_fee=fee.get("cost", 0) if fee else 0,
             fills=fills,
             status=result_status,
-            error_message=order.get("info", {}).get("error"),
+            error_message=(info or {}).get("error"),
         )
+
+        # Some exchanges leave average / fee null; derive them from the fills
+        if average_price is None:
+            result.average_price = result.fill_batch.vwap() if fills else price
+        if not fee and fills:
+            result.total_fee = result.fill_batch.total_fee()
+        return result
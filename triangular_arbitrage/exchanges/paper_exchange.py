@@ -6,26 +6,74 @@ Uses live market data for price discovery but doesn't execute real trades.
 """
 
 import asyncio
+import itertools
 import logging
-import random
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_adapter import (
+    EMPTY_FILLS,
     ExchangeAdapter,
     FillInfo,
     MarketData,
     OrderResult,
     OrderSide,
+    OrderSpec,
     OrderType,
 )
+from ..utils import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _slippage_bps_loop(
+    base_prices, amounts, rand_bps, fixed_bps, impact_coef, max_impact_bps
+):
+    """Slippage (bps) for a batch of orders, as in _calculate_execution_price"""
+    n = base_prices.size
+    bps = np.empty(n)
+    for i in range(n):
+        impact = min(amounts[i] * base_prices[i] / 1000.0 * impact_coef, max_impact_bps)
+        bps[i] = fixed_bps + impact + rand_bps[i]
+    return bps
+
+
+def _slippage_bps_numpy(
+    base_prices, amounts, rand_bps, fixed_bps, impact_coef, max_impact_bps
+):
+    """Vectorised equivalent of ``_slippage_bps_loop``"""
+    impact = np.minimum(amounts * base_prices / 1000.0 * impact_coef, max_impact_bps)
+    return fixed_bps + impact + rand_bps
+
+
+# Compiled loop when numba is installed, otherwise the NumPy version
+if NUMBA_AVAILABLE:
+    _slippage_bps_batch = njit(cache=True, fastmath=True)(_slippage_bps_loop)
+else:
+    _slippage_bps_batch = _slippage_bps_numpy
+
+# Uniform draws generated per NumPy call by _random_stream
+RANDOM_BLOCK_SIZE = 1024
+
+
+def _random_stream(np_rng: np.random.Generator) -> Iterator[float]:
+    """Endless stream of [0, 1) floats, generated in blocks"""
+    while True:
+        yield from np_rng.random(RANDOM_BLOCK_SIZE).tolist()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PaperOrderState:
     """Internal state for a paper order"""
 
@@ -41,6 +89,11 @@ class PaperOrderState:
     status: str = "pending"  # 'pending', 'partial', 'filled', 'cancelled'
     error_message: Optional[str] = None
     last_fill_time: float = 0.0
+    # Running totals over fills, kept by _create_fill
+    total_fee: float = 0.0
+    notional: float = 0.0
+    # Tuple of fills shared by status results; None after a new fill
+    fills_snapshot: Optional[Tuple[FillInfo, ...]] = None
 
 
 class PaperExchange(ExchangeAdapter):
@@ -66,6 +119,11 @@ class PaperExchange(ExchangeAdapter):
                 - fill_ratio: Probability of full fill (default: 0.95)
                 - spread_padding_bps: Additional spread padding (default: 5)
                 - random_seed: Random seed for deterministic testing
+                - ticker_ttl_ms: How long a live ticker is reused (default: 200)
+                - deterministic_ids: Sequential order/fill ids instead of
+                  uuid4 (default: True)
+                - simulate_time: Sleep for simulated latency and fill
+                  spacing; False executes without waiting (default: True)
                 - slippage_model: Slippage model parameters
                 - partial_fill_model: Partial fill simulation parameters
         """
@@ -74,12 +132,27 @@ class PaperExchange(ExchangeAdapter):
         self._markets = None
         self._balances = config.get("initial_balances", {}).copy()
         self._orders: Dict[str, PaperOrderState] = {}
+        # symbol -> (base, quote), split once per symbol
+        self._symbol_parts: Dict[str, Tuple[str, str]] = {}
 
         # Configuration
         self.fee_bps = config.get("fee_bps", 30)
         self.fill_ratio = config.get("fill_ratio", 0.95)
         self.spread_padding_bps = config.get("spread_padding_bps", 5)
         self.latency_sim_ms = config.get("latency_sim_ms", 50)
+        # Off for backtests and fast simulation: fills land without waiting
+        self.simulate_time = config.get("simulate_time", True)
+
+        # Live tickers reused for ticker_ttl_ms; synthetic ones are not cached
+        self._ticker_ttl = config.get("ticker_ttl_ms", 200) / 1000.0
+        self._ticker_cache: Dict[str, Tuple[float, MarketData]] = {}
+        self._ticker_locks: Dict[str, asyncio.Lock] = {}
+
+        # Sequential ids skip os.urandom per order/fill; the per-instance
+        # prefix keeps them unique across runs sharing one state database
+        self._deterministic_ids = config.get("deterministic_ids", True)
+        self._id_prefix = f"paper-{uuid.uuid4().hex[:12]}-"
+        self._id_counter = itertools.count(1)
 
         # Market impact model
         self.market_impact = config.get(
@@ -113,8 +186,10 @@ class PaperExchange(ExchangeAdapter):
             },
         )
 
-        # Initialize random seed for deterministic testing
-        self.rng = random.Random(config.get("random_seed"))
+        # Seeded uniform draws for deterministic testing; one NumPy call
+        # fills a block that many orders then consume
+        self._np_rng = np.random.default_rng(config.get("random_seed"))
+        self._random = _random_stream(self._np_rng)
 
         # Metrics tracking
         self.metrics = {
@@ -128,6 +203,12 @@ class PaperExchange(ExchangeAdapter):
             "fills_count": 0,
         }
 
+    def _gen_id(self) -> str:
+        """Return a new order/fill id"""
+        if self._deterministic_ids:
+            return f"{self._id_prefix}{next(self._id_counter)}"
+        return str(uuid.uuid4())
+
     async def initialize(self) -> None:
         """Initialize the paper exchange"""
         await self.live_exchange.load_markets()
@@ -140,15 +221,33 @@ class PaperExchange(ExchangeAdapter):
         return self._markets
 
     async def fetch_ticker(self, symbol: str) -> MarketData:
-        """Fetch live market data with timeout"""
-        import asyncio
+        """Fetch live market data, served from a short-lived cache
 
+        Tickers younger than ``ticker_ttl_ms`` are returned without a
+        request, and concurrent misses for a symbol share one request.
+        """
+        cached = self._ticker_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self._ticker_ttl:
+            return cached[1]
+
+        lock = self._ticker_locks.get(symbol)
+        if lock is None:
+            lock = self._ticker_locks[symbol] = asyncio.Lock()
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            cached = self._ticker_cache.get(symbol)
+            if cached is not None and time.monotonic() - cached[0] < self._ticker_ttl:
+                return cached[1]
+            return await self._fetch_live_ticker(symbol)
+
+    async def _fetch_live_ticker(self, symbol: str) -> MarketData:
+        """Fetch live market data with timeout, caching successful results"""
         try:
             # Add timeout to prevent hanging
             ticker = await asyncio.wait_for(
                 self.live_exchange.fetch_ticker(symbol), timeout=2.0  # 2 second timeout
             )
-            return MarketData(
+            market_data = MarketData(
                 symbol=symbol,
                 bid=ticker["bid"],
                 ask=ticker["ask"],
@@ -156,6 +255,8 @@ class PaperExchange(ExchangeAdapter):
                 volume=ticker["quoteVolume"],
                 timestamp=time.time(),
             )
+            self._ticker_cache[symbol] = (time.monotonic(), market_data)
+            return market_data
         except asyncio.TimeoutError:
             logger.warning(f"Ticker fetch timeout for {symbol}, using synthetic data")
             return self._generate_synthetic_ticker(symbol)
@@ -173,7 +274,7 @@ class PaperExchange(ExchangeAdapter):
         self, symbol: str, side: OrderSide, amount: float
     ) -> OrderResult:
         """Create and immediately simulate execution of market order"""
-        order_id = str(uuid.uuid4())
+        order_id = self._gen_id()
 
         order_state = PaperOrderState(
             order_id=order_id,
@@ -187,7 +288,7 @@ class PaperExchange(ExchangeAdapter):
         self.metrics["orders_created"] += 1
 
         # Simulate execution latency
-        if self.latency_sim_ms > 0:
+        if self.simulate_time and self.latency_sim_ms > 0:
             await asyncio.sleep(self.latency_sim_ms / 1000.0)
 
         try:
@@ -198,28 +299,74 @@ class PaperExchange(ExchangeAdapter):
             return await self._execute_market_order(order_state, market_data)
 
         except Exception as e:
-            order_state.status = "failed"
-            order_state.error_message = str(e)
             logger.error(f"Paper order execution failed: {e}")
+            return self._fail_order(order_state, e)
 
-            return OrderResult(
-                order_id=order_id,
-                symbol=symbol,
-                side=side,
-                amount_requested=amount,
-                amount_filled=0.0,
-                average_price=0.0,
-                total_fee=0.0,
-                fills=[],
-                status="failed",
-                error_message=str(e),
+    async def create_orders_batch(
+        self, orders: Sequence[OrderSpec]
+    ) -> List[OrderResult]:
+        """
+        Simulate a batch of orders, pricing market orders in one pass
+
+        An all-market batch pays the simulated latency once and computes
+        every execution price with one slippage kernel call; anything else
+        takes the per-order path.
+
+        The batch draws every order's slippage before any order's fill
+        draws, so for a given random_seed it consumes the random stream in
+        a different order than placing the same orders one at a time: it
+        is reproducible, but not sequence-equivalent to the single-order
+        path unless random_component_bps is 0.
+        """
+        if not orders or any(
+            o.order_type.value != OrderType.MARKET.value for o in orders
+        ):
+            return await super().create_orders_batch(orders)
+
+        states = []
+        for spec in orders:
+            order_state = PaperOrderState(
+                order_id=self._gen_id(),
+                symbol=spec.symbol,
+                side=spec.side,
+                order_type=OrderType.MARKET,
+                amount_requested=spec.amount,
             )
+            self._orders[order_state.order_id] = order_state
+            states.append(order_state)
+        self.metrics["orders_created"] += len(states)
+
+        if self.simulate_time and self.latency_sim_ms > 0:
+            await asyncio.sleep(self.latency_sim_ms / 1000.0)
+
+        try:
+            tickers = await self.fetch_tickers(
+                list(dict.fromkeys(o.symbol for o in orders))
+            )
+            market_data = [tickers[o.symbol] for o in states]
+            prices = self._calculate_execution_prices(states, market_data)
+        except Exception as e:
+            logger.error(f"Paper batch pricing failed: {e}")
+            return [self._fail_order(order_state, e) for order_state in states]
+
+        results = []
+        for order_state, md, price in zip(states, market_data, prices):
+            try:
+                results.append(
+                    await self._execute_market_order(
+                        order_state, md, execution_price=float(price)
+                    )
+                )
+            except Exception as e:
+                logger.error(f"Paper order execution failed: {e}")
+                results.append(self._fail_order(order_state, e))
+        return results
 
     async def create_limit_order(
         self, symbol: str, side: OrderSide, amount: float, price: float
     ) -> OrderResult:
         """Create limit order (immediately filled if price is favorable)"""
-        order_id = str(uuid.uuid4())
+        order_id = self._gen_id()
 
         order_state = PaperOrderState(
             order_id=order_id,
@@ -257,7 +404,7 @@ class PaperExchange(ExchangeAdapter):
                     amount_filled=0.0,
                     average_price=0.0,
                     total_fee=0.0,
-                    fills=[],
+                    fills=EMPTY_FILLS,
                     status="pending",
                 )
 
@@ -273,7 +420,7 @@ class PaperExchange(ExchangeAdapter):
                 amount_filled=0.0,
                 average_price=0.0,
                 total_fee=0.0,
-                fills=[],
+                fills=EMPTY_FILLS,
                 status="failed",
                 error_message=str(e),
             )
@@ -305,16 +452,18 @@ class PaperExchange(ExchangeAdapter):
                 amount_filled=0.0,
                 average_price=0.0,
                 total_fee=0.0,
-                fills=[],
+                fills=EMPTY_FILLS,
                 status="failed",
                 error_message="Order not found",
             )
 
         order_state = self._orders[order_id]
-        total_fee = sum(fill.fee for fill in order_state.fills)
+        fills = order_state.fills_snapshot
+        if fills is None:
+            fills = tuple(order_state.fills) if order_state.fills else EMPTY_FILLS
+            order_state.fills_snapshot = fills
         avg_price = (
-            sum(fill.price * fill.amount for fill in order_state.fills)
-            / order_state.amount_filled
+            order_state.notional / order_state.amount_filled
             if order_state.amount_filled > 0
             else 0.0
         )
@@ -326,8 +475,8 @@ class PaperExchange(ExchangeAdapter):
             amount_requested=order_state.amount_requested,
             amount_filled=order_state.amount_filled,
             average_price=avg_price,
-            total_fee=total_fee,
-            fills=order_state.fills.copy(),
+            total_fee=order_state.total_fee,
+            fills=fills,
             status=order_state.status,
             error_message=order_state.error_message,
         )
@@ -346,21 +495,48 @@ class PaperExchange(ExchangeAdapter):
         """Clean up resources"""
         pass
 
+    def _fail_order(
+        self, order_state: PaperOrderState, error: Exception
+    ) -> OrderResult:
+        """Mark an order failed and build its result"""
+        order_state.status = "failed"
+        order_state.error_message = str(error)
+        return OrderResult(
+            order_id=order_state.order_id,
+            symbol=order_state.symbol,
+            side=order_state.side,
+            amount_requested=order_state.amount_requested,
+            amount_filled=0.0,
+            average_price=0.0,
+            total_fee=0.0,
+            fills=EMPTY_FILLS,
+            status="failed",
+            error_message=str(error),
+        )
+
     async def _execute_market_order(
         self,
         order_state: PaperOrderState,
         market_data: MarketData,
         limit_price: Optional[float] = None,
+        execution_price: Optional[float] = None,
     ) -> OrderResult:
-        """Execute market order simulation with realistic behavior"""
+        """Execute market order simulation with realistic behavior
+
+        ``execution_price`` is passed by the batch path, which has already
+        priced the order; otherwise it is computed here.
+        """
 
         # Calculate execution price with slippage
-        base_price = (
-            market_data.ask if order_state.side == OrderSide.BUY else market_data.bid
-        )
-        execution_price = self._calculate_execution_price(
-            base_price, order_state.side, order_state.amount_requested, market_data
-        )
+        if execution_price is None:
+            base_price = (
+                market_data.ask
+                if order_state.side == OrderSide.BUY
+                else market_data.bid
+            )
+            execution_price = self._calculate_execution_price(
+                base_price, order_state.side, order_state.amount_requested, market_data
+            )
 
         # Apply limit price constraint if specified
         if limit_price is not None:
@@ -435,7 +611,7 @@ class PaperExchange(ExchangeAdapter):
             high=last_price * 1.02,
             low=last_price * 0.98,
             volume=1000.0,
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
         )
 
     def _calculate_execution_price(
@@ -461,10 +637,8 @@ class PaperExchange(ExchangeAdapter):
         slippage_bps += self.spread_padding_bps
 
         # Random component
-        random_slippage = self.rng.uniform(
-            -self.slippage_config["random_component_bps"],
-            self.slippage_config["random_component_bps"],
-        )
+        rand_range = self.slippage_config["random_component_bps"]
+        random_slippage = rand_range * (2.0 * next(self._random) - 1.0)
         slippage_bps += random_slippage
 
         # Adverse selection (always unfavorable)
@@ -481,13 +655,53 @@ class PaperExchange(ExchangeAdapter):
 
         return max(execution_price, 0.0)  # Ensure non-negative
 
+    def _calculate_execution_prices(
+        self, order_states: Sequence[PaperOrderState], market_data: Sequence[MarketData]
+    ) -> np.ndarray:
+        """Batch version of _calculate_execution_price for market orders"""
+        n = len(order_states)
+        is_buy = np.fromiter(
+            (o.side == OrderSide.BUY for o in order_states), dtype=bool, count=n
+        )
+        base_prices = np.where(
+            is_buy,
+            np.fromiter((md.ask for md in market_data), dtype=np.float64, count=n),
+            np.fromiter((md.bid for md in market_data), dtype=np.float64, count=n),
+        )
+        amounts = np.fromiter(
+            (o.amount_requested for o in order_states), dtype=np.float64, count=n
+        )
+        # All n slippage draws are taken up front, ahead of the orders'
+        # fill draws; see create_orders_batch
+        rand_range = self.slippage_config["random_component_bps"]
+        rand_bps = rand_range * (
+            2.0
+            * np.fromiter(itertools.islice(self._random, n), dtype=np.float64, count=n)
+            - 1.0
+        )
+        impact_enabled = self.market_impact["enabled"]
+        bps = _slippage_bps_batch(
+            base_prices,
+            amounts,
+            rand_bps,
+            float(
+                self.slippage_config["base_slippage_bps"]
+                + self.spread_padding_bps
+                + self.slippage_config["adverse_selection_bps"]
+            ),
+            float(self.market_impact["impact_coefficient"] if impact_enabled else 0.0),
+            float(self.market_impact["max_impact_bps"] if impact_enabled else 0.0),
+        )
+        side_sign = np.where(is_buy, 1.0, -1.0)
+        return np.maximum(base_prices * (1 + side_sign * bps / 10000.0), 0.0)
+
     def _determine_fill_amount(
         self, requested_amount: float, execution_price: float, market_data: MarketData
     ) -> tuple[float, bool]:
         """Determine how much of the order should be filled and if it should be partial"""
 
         # Check if order should fill completely
-        if self.rng.random() < self.fill_ratio:
+        if next(self._random) < self.fill_ratio:
             return requested_amount, False
 
         # Determine if order qualifies for partial fill simulation
@@ -500,11 +714,11 @@ class PaperExchange(ExchangeAdapter):
         if should_partial_fill:
             # Partial fill between min_fill_ratio and full amount
             min_fill = requested_amount * self.partial_fill_config["min_fill_ratio"]
-            fill_amount = self.rng.uniform(min_fill, requested_amount)
+            fill_amount = min_fill + (requested_amount - min_fill) * next(self._random)
             return fill_amount, True
         else:
             # Small order gets partial fill in single shot
-            partial_ratio = self.rng.uniform(0.7, 0.95)  # 70-95% fill
+            partial_ratio = 0.7 + 0.25 * next(self._random)  # 70-95% fill
             return requested_amount * partial_ratio, False
 
     async def _simulate_partial_fills(
@@ -512,7 +726,7 @@ class PaperExchange(ExchangeAdapter):
     ) -> None:
         """Simulate partial fills over time"""
         remaining_amount = total_fill_amount
-        fill_count = self.rng.randint(2, 5)  # 2-5 partial fills
+        fill_count = 2 + int(next(self._random) * 4)  # 2-5 partial fills
 
         for i in range(fill_count):
             if remaining_amount <= 0:
@@ -525,10 +739,10 @@ class PaperExchange(ExchangeAdapter):
             else:
                 max_fill = remaining_amount * 0.6  # Max 60% in one fill
                 min_fill = remaining_amount * 0.1  # Min 10% in one fill
-                fill_size = self.rng.uniform(min_fill, max_fill)
+                fill_size = min_fill + (max_fill - min_fill) * next(self._random)
 
             # Slight price variation for each fill
-            price_variance = self.rng.uniform(-0.001, 0.001)  # ±0.1%
+            price_variance = 0.001 * (2.0 * next(self._random) - 1.0)  # ±0.1%
             fill_price = base_price * (1 + price_variance)
 
             await self._create_fill(order_state, fill_price, fill_size)
@@ -536,8 +750,10 @@ class PaperExchange(ExchangeAdapter):
 
             # Simulate time between fills
             if i < fill_count - 1:
-                fill_delay = self.rng.uniform(0.05, 0.2)  # 50-200ms between fills
-                await asyncio.sleep(fill_delay)
+                # Drawn even when not sleeping so later random draws match
+                fill_delay = 0.05 + 0.15 * next(self._random)  # 50-200ms between fills
+                if self.simulate_time:
+                    await asyncio.sleep(fill_delay)
 
     async def _create_fill(
         self, order_state: PaperOrderState, price: float, amount: float
@@ -549,6 +765,7 @@ class PaperExchange(ExchangeAdapter):
             order_state.symbol, order_state.side, order_state.order_type
         )
         fee = amount * price * fee_rate
+        now = time.time()
 
         # Create fill
         fill = FillInfo(
@@ -558,17 +775,20 @@ class PaperExchange(ExchangeAdapter):
             amount=amount,
             price=price,
             fee=fee,
-            timestamp=time.time(),
-            fill_id=str(uuid.uuid4()),
-            trade_id=str(uuid.uuid4()),
+            timestamp=now,
+            fill_id=self._gen_id(),
+            trade_id=self._gen_id(),
             is_partial=(
                 order_state.amount_filled + amount < order_state.amount_requested
             ),
         )
 
         order_state.fills.append(fill)
+        order_state.total_fee += fee
+        order_state.notional += price * amount
+        order_state.fills_snapshot = None
         order_state.amount_filled += amount
-        order_state.last_fill_time = time.time()
+        order_state.last_fill_time = now
 
         # Update status
         if order_state.amount_filled >= order_state.amount_requested:
@@ -578,27 +798,34 @@ class PaperExchange(ExchangeAdapter):
 
     def _update_balances(self, order_state: PaperOrderState) -> None:
         """Update simulated balances based on fills"""
-        base_currency, quote_currency = order_state.symbol.split("/")
-
-        for fill in order_state.fills:
-            # Get current balances
-            current_base = self._balances.get(base_currency, 0.0)
-            current_quote = self._balances.get(quote_currency, 0.0)
-
-            if order_state.side == OrderSide.BUY:
-                # Buying base currency with quote currency
-                # Add to base currency, subtract cost from quote currency
-                self._balances[base_currency] = current_base + fill.amount
-                self._balances[quote_currency] = current_quote - (
-                    fill.amount * fill.price + fill.fee
-                )
-            else:
-                # Selling base currency for quote currency
-                # Subtract from base currency, add proceeds to quote currency
-                self._balances[base_currency] = current_base - fill.amount
-                self._balances[quote_currency] = current_quote + (
-                    fill.amount * fill.price - fill.fee
-                )
+        if not order_state.fills:
+            return
+
+        parts = self._symbol_parts.get(order_state.symbol)
+        if parts is None:
+            parts = tuple(order_state.symbol.split("/", 1))
+            self._symbol_parts[order_state.symbol] = parts
+        base_currency, quote_currency = parts
+
+        # Running balances are kept locally and written back once
+        base_balance = self._balances.get(base_currency, 0.0)
+        quote_balance = self._balances.get(quote_currency, 0.0)
+
+        if order_state.side == OrderSide.BUY:
+            # Buying base currency with quote currency
+            # Add to base currency, subtract cost from quote currency
+            for fill in order_state.fills:
+                base_balance += fill.amount
+                quote_balance -= fill.amount * fill.price + fill.fee
+        else:
+            # Selling base currency for quote currency
+            # Subtract from base currency, add proceeds to quote currency
+            for fill in order_state.fills:
+                base_balance -= fill.amount
+                quote_balance += fill.amount * fill.price - fill.fee
+
+        self._balances[base_currency] = base_balance
+        self._balances[quote_currency] = quote_balance
 
     def _update_metrics(self, order_state: PaperOrderState) -> None:
         """Update execution metrics"""
@@ -607,11 +834,8 @@ class PaperExchange(ExchangeAdapter):
         elif order_state.status == "partial":
             self.metrics["orders_partially_filled"] += 1
 
-        total_volume = sum(fill.amount * fill.price for fill in order_state.fills)
-        total_fees = sum(fill.fee for fill in order_state.fills)
-
-        self.metrics["total_volume"] += total_volume
-        self.metrics["total_fees"] += total_fees
+        self.metrics["total_volume"] += order_state.notional
+        self.metrics["total_fees"] += order_state.total_fee
         self.metrics["fills_count"] += len(order_state.fills)
 
     async def get_execution_metrics(self) -> Dict[str, Any]:
@@ -1898,12 +1898,39 @@ class StrategyExecutionEngine:
 
         return True
 
+    async def _prefetch_leg_tickers(
+        self, trade_path: List[str], start: int, markets: Dict
+    ) -> Dict[str, Any]:
+        """Fetch tickers for the legs from trade_path[start] on in one batch
+
+        Legs whose ticker is missing here are fetched one by one by the
+        caller, so a failed batch only costs the round trips it saved.
+        """
+        symbols = []
+        for i in range(start, len(trade_path) - 1):
+            from_currency, to_currency = trade_path[i], trade_path[i + 1]
+            for symbol in (
+                f"{to_currency}/{from_currency}",
+                f"{from_currency}/{to_currency}",
+            ):
+                if symbol in markets:
+                    symbols.append(markets[symbol]["symbol"])
+                    break
+        if not symbols:
+            return {}
+        try:
+            return await self.exchange.fetch_tickers(symbols)
+        except Exception as e:
+            logger.debug(f"Batched ticker fetch failed, fetching per leg: {e}")
+            return {}
+
     async def _validate_cycle(self, cycle_info: CycleInfo) -> bool:
         """Validate that a cycle can be executed"""
         from_currency = cycle_info.cycle[0]
         amount = cycle_info.initial_amount
         trade_path = cycle_info.cycle + [cycle_info.cycle[0]]
         markets = await self.exchange.load_markets()
+        tickers = await self._prefetch_leg_tickers(trade_path, 0, markets)
 
         for i in range(len(trade_path) - 1):
             to_currency = trade_path[i + 1]
@@ -1938,7 +1965,9 @@ class StrategyExecutionEngine:
 
             # Estimate amount for next step
             try:
-                ticker = await self.exchange.fetch_ticker(market["symbol"])
+                ticker = tickers.get(market["symbol"]) or (
+                    await self.exchange.fetch_ticker(market["symbol"])
+                )
                 price = ticker.last
 
                 # Apply expected slippage
@@ -1975,6 +2004,7 @@ class StrategyExecutionEngine:
         """
         from_currency = cycle_info.current_currency
         amount = cycle_info.current_amount
+        tickers = await self._prefetch_leg_tickers(trade_path, next_step, markets)
 
         # Simulate remaining trades to check minimum requirements
         for i in range(next_step, len(trade_path) - 1):
@@ -2015,7 +2045,9 @@ class StrategyExecutionEngine:
 
             # Estimate amount for next step (using conservative slippage)
             try:
-                ticker = await self.exchange.fetch_ticker(market["symbol"])
+                ticker = tickers.get(market["symbol"]) or (
+                    await self.exchange.fetch_ticker(market["symbol"])
+                )
                 price = ticker.last
 
                 # Apply expected slippage
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from .utils import DATACLASS_SLOTS
+
 
 class CycleState(Enum):
     """
@@ -47,7 +49,7 @@ class OrderState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OrderInfo:
     """Data class for order information"""
 
@@ -65,7 +67,7 @@ class OrderInfo:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CycleInfo:
     """Data class for cycle information"""
 
@@ -7,6 +7,7 @@ timestamp handling, JSON serialization, path validation, and mathematical calcul
 
 import json
 import logging
+import sys
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -303,6 +304,31 @@ def is_valid_basis_points(value: Any) -> bool:
 
 
 # Performance utilities
+# Keyword arguments for @dataclass that add __slots__ on Python 3.10+;
+# older interpreters keep the regular __dict__-backed instances
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def install_uvloop() -> bool:
+    """Use uvloop's event loop for subsequent asyncio.run() calls if installed.
+
+    uvloop is an optional dependency (the ``perf`` extra); without it the
+    standard asyncio loop is kept.
+
+    Returns:
+        True if the uvloop policy was installed, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def timing_decorator(func):
     """Decorator to measure function execution time."""
 